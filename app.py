@@ -1,12 +1,26 @@
 import sys
+import time
+
+# Taken before the heavy imports: the startup time is measured from here
+STARTUP_STARTED = time.perf_counter()
+STARTUP_BUDGET_SECONDS = 1.0  # Launch-to-window time (without the password dialog) to stay within
 
 from PyQt5.QtGui import QIcon, QCloseEvent
 from PyQt5.QtWidgets import QApplication, QDialog, QMainWindow
 
-from ui import Ui_MainWindow
+QT_IMPORTED = time.perf_counter()
 from resources import resources_rc
+RESOURCES_IMPORTED = time.perf_counter()
+
+from ui import Ui_MainWindow
 from mvc import Controller, Model, View
-from classes import Notification, PasswordDialog
+from classes import Notification, PasswordDialog, StartupProfiler
+
+# Phases up to here are closed by hand, the profiler itself is imported last
+startup_profiler = StartupProfiler(started=STARTUP_STARTED)
+startup_profiler.mark("import_qt", at=QT_IMPORTED)
+startup_profiler.mark("import_resources", at=RESOURCES_IMPORTED)
+startup_profiler.mark("import_modules")
 
 
 class MyWindow(QMainWindow):
@@ -17,11 +31,18 @@ class MyWindow(QMainWindow):
     the initial password authentication process.
     """
 
-    def __init__(self) -> None:
-        """Initializes the main window and its components."""
+    def __init__(self, base_path: str | None = None, profiler: StartupProfiler | None = None) -> None:
+        """Initializes the main window and its components.
+
+        Args:
+            base_path: Folder with config.yaml and _internal (the program folder if None).
+            profiler: Startup profiler receiving the phases of the initialization.
+        """
         super().__init__()
 
-        self.model = Model()
+        self.profiler = profiler if profiler is not None else StartupProfiler()
+        self.model = Model(base_path=base_path, profiler=self.profiler)
+        self.profiler.log_path = self.model.startup_log_path
 
         # Check if the configuration data was loaded successfully.
         if not isinstance(self.model.config_data, dict):
@@ -41,11 +62,13 @@ class MyWindow(QMainWindow):
             self.ui.setupUi(self)
 
             self.setWindowIcon(QIcon(":/icons/icon.ico"))
+            self.profiler.mark("setup_ui")
 
             # Initialize MVC components.
             self.view = View(
                 ui=self.ui, authenticated=self.authentication_status
             )
+            self.profiler.mark("view_init")
             self.controller = Controller(model=self.model, view=self.view)
         else:
             # Exit if the user cancels authentication.
@@ -80,11 +103,13 @@ class MyWindow(QMainWindow):
             None: If the user closes or cancels the password dialog.
         """
         password = self.model.get_decrypted_password()
+        self.profiler.mark("get_decrypted_password")
 
         if password:
             dialog = PasswordDialog(correct_password=password)
             dialog.password_changed.connect(self.set_password)
             result = dialog.exec_()
+            self.profiler.mark("password_dialog")
 
             if result == QDialog.Accepted:
                 return True  # Full access mode.
@@ -108,6 +133,18 @@ class MyWindow(QMainWindow):
 if __name__ == "__main__":
     # Application entry point.
     app = QApplication(sys.argv)
-    application = MyWindow()
+    startup_profiler.mark("create_application")
+    application = MyWindow(profiler=startup_profiler)
     application.show()
+    startup_profiler.mark("show_window")
+
+    # The version check and the share are read in the background, so the window
+    # is expected to appear within the budget even on a slow link
+    startup_seconds = startup_profiler.elapsed() - startup_profiler.duration("password_dialog")
+    if startup_seconds > STARTUP_BUDGET_SECONDS and sys.stderr is not None:
+        print(
+            f"Startup took {startup_seconds:.2f} s (budget {STARTUP_BUDGET_SECONDS:.2f} s)",
+            file=sys.stderr,
+        )
+
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,344 @@
+"""Headless benchmark of the Model operations.
+
+Builds a synthetic archive once, then measures every operation in its own
+process, so the peak memory of one operation does not hide another's:
+
+- get_group_versions, get_actual_version, search, search_all: repeated
+  calls over all groups (the first, cold call is reported separately);
+- add_version: uploads of newly generated versions to a separate group;
+- download: downloads of the actual versions of the first groups.
+
+Results are written as JSON (ops/s, MB/s for the transfers, peak RSS of
+the process), and two result files can be compared, e.g. before and after
+a commit.
+
+Usage (from the project folder):
+    python -m benchmarks.model_benchmark --groups 500 --versions 5 --output before.json
+    python -m benchmarks.model_benchmark --groups 500 --versions 5 --output after.json
+    python -m benchmarks.model_benchmark --compare before.json after.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import subprocess
+
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, the peak is read through the Win32 API there
+    resource = None
+
+from benchmarks.synthetic_archive import SIZE_DISTRIBUTIONS
+
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
+OPERATIONS = (
+    "get_group_versions",
+    "get_actual_version",
+    "search",
+    "search_all",
+    "add_version",
+    "download",
+)
+TRANSFER_OPERATIONS = ("add_version", "download")
+STORAGE_EXTENSIONS = (".enc", ".pack", ".manifest")
+BENCHMARK_GROUP = "Замер добавления"  # Group receiving the versions of the add_version benchmark
+
+
+def peak_rss_bytes() -> int | None:
+    """Return the peak resident set size of the current process (None if unknown)."""
+    # On Linux ru_maxrss keeps the peak of the parent the process was started from,
+    # VmHWM belongs to the current program only
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Bytes on macOS, kilobytes on Linux
+        return peak if sys.platform == "darwin" else peak * 1024
+
+    try:
+        import ctypes
+
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        kernel32 = ctypes.WinDLL("kernel32")
+        psapi = ctypes.WinDLL("psapi")
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        psapi.GetProcessMemoryInfo.argtypes = (
+            wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD
+        )
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        if not psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return None
+        return counters.PeakWorkingSetSize
+
+    except (ImportError, AttributeError, OSError):
+        return None
+
+
+def folder_size(path: Path) -> int:
+    """Return the total size of the files in a folder."""
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def run_operation(operation: str, base_path: str, args: argparse.Namespace) -> dict:
+    """Measure one operation against the archive.
+
+    Args:
+        operation: One of OPERATIONS.
+        base_path: Program folder of the synthetic archive.
+        args: Benchmark parameters.
+
+    Returns:
+        Measured values of the operation.
+
+    Raises:
+        RuntimeError: If the operation failed.
+    """
+    from mvc.model import Model
+    from benchmarks.synthetic_archive import version_name, write_version_tree
+
+    model = Model(base_path=base_path)
+    errors: list[str] = []
+    model.show_notification.connect(lambda msg_type, text: errors.append(text) if msg_type == "error" else None)
+
+    groups = [group for group in model.get_groups_names() if group != BENCHMARK_GROUP]
+    calls: list = []  # Zero-argument callables, one per measured call
+    transferred = 0
+
+    with tempfile.TemporaryDirectory(prefix="fa_operation_") as temp_dir:
+        temp_path = Path(temp_dir)
+
+        # Arguments are prepared before the clock starts
+        if operation == "get_group_versions":
+            calls = [lambda g=group: model.get_group_versions(g) for group in groups]
+        elif operation == "get_actual_version":
+            calls = [lambda v=model.get_group_versions(group): model.get_actual_version(v) for group in groups]
+        elif operation in ("search", "search_all"):
+            search = getattr(model, operation)
+            queries = ["Группа", "0001", f"{len(groups):04d}", "v2", "release", "нет такой группы"]
+            calls = [lambda q=query: search(q) for query in queries]
+        elif operation == "add_version":
+            if model.create_new_group(BENCHMARK_GROUP) != 0:
+                raise RuntimeError("\n".join(errors))
+            rng = random.Random(args.seed + 1)
+            for index in range(args.transfers):
+                source = temp_path / "sources" / version_name(index)
+                transferred += write_version_tree(source, args.files, args.file_size, rng, args.size_distribution)
+                calls.append(lambda s=source: model.add_version(str(s), BENCHMARK_GROUP))
+        elif operation == "download":
+            for index, group in enumerate(groups[:args.transfers]):
+                destination = temp_path / "downloads" / str(index)
+                destination.mkdir(parents=True)
+                version = model.get_actual_version(model.get_group_versions(group))
+                # Downloads are requested by the name the table shows, without the storage extension
+                if version.endswith(STORAGE_EXTENSIONS):
+                    version = version.rsplit(".", 1)[0]
+                calls.append(lambda g=group, v=version, d=destination: model.download(g, v, d))
+        else:
+            raise ValueError(f"Unknown operation: {operation}")
+
+        # Reads are repeated; the first call also loads the catalog or builds the search index
+        first_call_ms = None
+        if operation not in TRANSFER_OPERATIONS:
+            started = time.perf_counter()
+            calls[0]()
+            first_call_ms = round((time.perf_counter() - started) * 1000, 3)
+            calls = calls * args.repeat
+
+        started = time.perf_counter()
+        for call in calls:
+            if call() == 1 and operation in TRANSFER_OPERATIONS:
+                raise RuntimeError(f"{operation} failed:\n" + "\n".join(errors))
+        seconds = time.perf_counter() - started
+
+        if operation == "download":
+            transferred = folder_size(temp_path / "downloads")
+
+    peak_rss = peak_rss_bytes()
+    return {
+        "ops": len(calls),
+        "seconds": round(seconds, 6),
+        "ops_per_s": round(len(calls) / seconds, 3) if seconds > 0 else None,
+        "mean_ms": round(seconds * 1000 / len(calls), 3) if calls else None,
+        "first_call_ms": first_call_ms,
+        "mb": round(transferred / 1024 ** 2, 3) if operation in TRANSFER_OPERATIONS else None,
+        "mb_per_s": (
+            round(transferred / 1024 ** 2 / seconds, 3)
+            if operation in TRANSFER_OPERATIONS and seconds > 0 else None
+        ),
+        "peak_rss_mb": round(peak_rss / 1024 ** 2, 3) if peak_rss is not None else None,
+    }
+
+
+def measure(operation: str, base_path: Path, argv: list[str]) -> dict:
+    """Run one operation in a new process and return its results.
+
+    Raises:
+        RuntimeError: If the operation failed.
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.model_benchmark", *argv,
+         "--child-operation", operation, "--child-base", str(base_path)],
+        cwd=PROJECT_PATH,
+        env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{operation} failed (code {result.returncode}):\n{result.stderr}")
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def current_commit() -> str | None:
+    """Return the commit of the project folder (None outside a git checkout)."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_PATH, capture_output=True, text=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print the change of every measured value between two result files."""
+    results = []
+    for path in (before_path, after_path):
+        with open(path, "r", encoding="utf-8") as file:
+            results.append(json.load(file))
+    before, after = results
+
+    print(f"{before.get('commit') or before_path} -> {after.get('commit') or after_path}")
+    if before["parameters"] != after["parameters"]:
+        print("Warning: the results were measured with different parameters")
+
+    print(f"{'operation':<20}{'value':<14}{'before':>12}{'after':>12}{'change':>10}")
+    for operation, values in after["operations"].items():
+        old_values = before["operations"].get(operation, {})
+        for name in ("ops_per_s", "mb_per_s", "peak_rss_mb"):
+            old, new = old_values.get(name), values.get(name)
+            if old is None or new is None:
+                continue
+            change = f"{(new - old) / old * 100:+.1f}%" if old else ""
+            print(f"{operation:<20}{name:<14}{old:>12.1f}{new:>12.1f}{change:>10}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless benchmark of the File Archive model operations.")
+    parser.add_argument("--groups", type=int, default=200, help="Groups in the synthetic archive")
+    parser.add_argument("--versions", type=int, default=5, help="Versions in every group")
+    parser.add_argument("--files", type=int, default=20, help="Files in every version")
+    parser.add_argument("--file-size", type=int, default=64 * 1024, help="Mean size of the files in bytes")
+    parser.add_argument("--size-distribution", default="lognormal", choices=SIZE_DISTRIBUTIONS)
+    parser.add_argument("--undated-share", type=float, default=0.2, help="Share of the groups with undated version names")
+    parser.add_argument("--storage-mode", default="files", choices=("files", "pack", "dedup"))
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the file sizes and contents")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the groups or queries of a read operation")
+    parser.add_argument("--transfers", type=int, default=5, help="Versions uploaded by add_version and downloaded by download")
+    parser.add_argument("--operations", nargs="+", default=list(OPERATIONS), choices=OPERATIONS)
+    parser.add_argument("--output", help="Write the results to this JSON file instead of printing them")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two result files")
+    parser.add_argument("--child-operation", choices=OPERATIONS, help=argparse.SUPPRESS)
+    parser.add_argument("--child-base", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    if args.child_operation:
+        print(json.dumps(run_operation(args.child_operation, args.child_base, args)))
+        return
+
+    from benchmarks.synthetic_archive import create_environment, populate_archive
+    from mvc.model import Model
+
+    parameters = {
+        "groups": args.groups,
+        "versions": args.versions,
+        "files": args.files,
+        "file_size": args.file_size,
+        "size_distribution": args.size_distribution,
+        "undated_share": args.undated_share,
+        "storage_mode": args.storage_mode,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "transfers": args.transfers,
+    }
+    # Parameters used by the operations themselves are passed to their processes
+    child_argv = [
+        "--files", str(args.files),
+        "--file-size", str(args.file_size),
+        "--size-distribution", args.size_distribution,
+        "--seed", str(args.seed),
+        "--repeat", str(args.repeat),
+        "--transfers", str(args.transfers),
+    ]
+
+    with tempfile.TemporaryDirectory(prefix="fa_model_") as root:
+        base_path = create_environment(root, storage_mode=args.storage_mode)
+        populate_archive(
+            Model(base_path=base_path),
+            args.groups,
+            args.versions,
+            args.files,
+            args.file_size,
+            size_distribution=args.size_distribution,
+            undated_share=args.undated_share,
+            seed=args.seed,
+        )
+        operations = {operation: measure(operation, base_path, child_argv) for operation in args.operations}
+
+    results = {
+        "benchmark": "model",
+        "commit": current_commit(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "operations": operations,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+    else:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Headless startup benchmark.
+
+Builds a synthetic archive once, then launches the program against it in
+fresh processes (Qt "offscreen" platform, restricted mode, no password
+dialog). Every launch waits for the version check and the first read of
+the share and writes its phases to the startup log; the benchmark reports
+p50/p95 of every phase, of the whole startup and of the process lifetime.
+
+Usage (from the project folder):
+    python -m benchmarks.startup_benchmark --runs 20 --groups 200 --versions 3
+    python -m benchmarks.startup_benchmark --json > startup.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import tempfile
+import subprocess
+
+from pathlib import Path
+
+
+PROJECT_PATH = Path(__file__).resolve().parent.parent
+LAUNCH_TIMEOUT_SECONDS = 120.0
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_child(base_path: str) -> None:
+    """Launch the program once and exit as soon as its startup is profiled.
+
+    Args:
+        base_path: Program folder of the synthetic archive.
+    """
+    # Imported first, so the profiler measures the imports as a real launch does
+    import app
+
+    from PyQt5.QtCore import QTimer
+    from PyQt5.QtWidgets import QApplication
+
+    application = QApplication(sys.argv[:1])
+    app.startup_profiler.mark("create_application")
+    window = app.MyWindow(base_path=base_path, profiler=app.startup_profiler)
+    window.show()
+    app.startup_profiler.mark("show_window")
+
+    deadline = time.monotonic() + LAUNCH_TIMEOUT_SECONDS
+
+    def check_finished() -> None:
+        if app.startup_profiler.is_finished:
+            # The log is written, teardown of Qt is not a part of the startup
+            os._exit(0)
+        if time.monotonic() > deadline:
+            os._exit(1)
+
+    timer = QTimer()
+    timer.timeout.connect(check_finished)
+    timer.start(5)
+    application.exec_()
+
+
+def launch(base_path: Path) -> float:
+    """Run one launch in a new process.
+
+    Args:
+        base_path: Program folder of the synthetic archive.
+
+    Returns:
+        Wall time of the process in seconds.
+
+    Raises:
+        RuntimeError: If the launch failed or did not finish in time.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup_benchmark", "--child", str(base_path)],
+        cwd=PROJECT_PATH,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=LAUNCH_TIMEOUT_SECONDS + 30,
+    )
+    wall_time = time.perf_counter() - started
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Launch failed (code {result.returncode}):\n{result.stderr}")
+    return wall_time
+
+
+def read_launches(log_path: Path, count: int) -> list[dict]:
+    """Return the last count launches of a startup log."""
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    return [json.loads(line) for line in lines[-count:]]
+
+
+def summarize(launches: list[dict], wall_times: list[float]) -> dict:
+    """Aggregate profiled launches into p50/p95 values in milliseconds."""
+    durations: dict[str, list[float]] = {}
+    for launch_record in launches:
+        for phase in launch_record["phases"]:
+            durations.setdefault(phase["phase"], []).append(phase["duration_ms"])
+
+    window_ms = [
+        next((p["start_ms"] + p["duration_ms"] for p in record["phases"] if p["phase"] == "show_window"), 0.0)
+        for record in launches
+    ]
+    totals = {
+        "window_shown_ms": window_ms,
+        "startup_ms": [record["total_ms"] for record in launches],
+        "process_ms": [t * 1000 for t in wall_times],
+    }
+
+    def stats(values: list[float]) -> dict:
+        return {"p50": round(percentile(values, 50), 3), "p95": round(percentile(values, 95), 3)}
+
+    return {
+        "runs": len(launches),
+        "phases": {phase: stats(values) for phase, values in durations.items()},
+        "totals": {name: stats(values) for name, values in totals.items()},
+    }
+
+
+def print_report(summary: dict, parameters: dict) -> None:
+    """Print the summary as a table."""
+    print(
+        f"Startup, {summary['runs']} runs, archive {parameters['groups']} groups x "
+        f"{parameters['versions']} versions x {parameters['files']} files"
+    )
+    print(f"{'phase':<28}{'p50, ms':>12}{'p95, ms':>12}")
+    for section in ("phases", "totals"):
+        for name, values in summary[section].items():
+            print(f"{name:<28}{values['p50']:>12.1f}{values['p95']:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Headless startup benchmark of File Archive.")
+    parser.add_argument("--runs", type=int, default=20, help="Measured launches")
+    parser.add_argument("--warmup", type=int, default=1, help="Launches before measuring (the first one builds the catalog)")
+    parser.add_argument("--groups", type=int, default=200, help="Groups in the synthetic archive")
+    parser.add_argument("--versions", type=int, default=3, help="Versions in every group")
+    parser.add_argument("--files", type=int, default=5, help="Files in every version")
+    parser.add_argument("--file-size", type=int, default=4096, help="Size of every file in bytes")
+    parser.add_argument("--storage-mode", default="files", choices=("files", "pack", "dedup"))
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the file contents")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    parser.add_argument("--child", metavar="BASE_PATH", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    from benchmarks.synthetic_archive import create_environment, populate_archive
+    from mvc.model import Model
+
+    with tempfile.TemporaryDirectory(prefix="fa_startup_") as root:
+        base_path = create_environment(root, storage_mode=args.storage_mode)
+        model = Model(base_path=base_path)
+        populate_archive(model, args.groups, args.versions, args.files, args.file_size, seed=args.seed)
+
+        for _ in range(args.warmup):
+            launch(base_path)
+        wall_times = [launch(base_path) for _ in range(args.runs)]
+        launches = read_launches(base_path / "_internal" / "startup.log", args.runs)
+
+    parameters = {
+        "groups": args.groups,
+        "versions": args.versions,
+        "files": args.files,
+        "file_size": args.file_size,
+        "storage_mode": args.storage_mode,
+    }
+    summary = summarize(launches, wall_times)
+
+    if args.json:
+        print(json.dumps({"benchmark": "startup", "parameters": parameters, **summary}, indent=2))
+    else:
+        print_report(summary, parameters)
+
+
+if __name__ == "__main__":
+    main()
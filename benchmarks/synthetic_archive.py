@@ -0,0 +1,189 @@
+"""Synthetic archives for the benchmarks.
+
+An archive is a program folder (config.yaml, _internal/keyfile.key) with a
+share of groups and versions added through Model.add_version, so it is
+stored exactly as the program stores real versions. Contents are generated
+from a seed, so the same parameters give the same archive on every run.
+
+File sizes follow one of SIZE_DISTRIBUTIONS around a mean size. Versions
+are named with a date ("v2 08.01.2024"), as most groups on the share are;
+a share of the groups can be given undated names ("release_002"), for
+which the actual version is chosen by name.
+"""
+
+import math
+import random
+import datetime
+import tempfile
+
+from pathlib import Path
+
+import yaml
+
+from mvc.model import Model
+
+
+PROGRAM_VERSION = "4.2.0"
+FIRST_VERSION_DATE = datetime.date(2024, 1, 1)
+SIZE_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+LOGNORMAL_SIGMA = 1.0  # Spread of "lognormal" sizes: many small files and a few large ones
+
+
+def create_environment(root: str | Path, storage_mode: str = "files", extra_config: dict | None = None) -> Path:
+    """Create a program folder with an empty share.
+
+    Args:
+        root: Folder to create the environment in (created if missing).
+        storage_mode: storage_mode option of the archive.
+        extra_config: Additional config.yaml options.
+
+    Returns:
+        Path to the program folder (base_path of the Model).
+    """
+    from cryptography.fernet import Fernet
+
+    root = Path(root)
+    base_path = root / "program"
+    share_path = root / "share"
+    server_path = root / "server"
+    for path in (base_path / "_internal", share_path, server_path):
+        path.mkdir(parents=True, exist_ok=True)
+
+    (base_path / "_internal" / "keyfile.key").write_bytes(Fernet.generate_key())
+
+    config = {
+        "versions_path": str(share_path),
+        "server_program_path": str(server_path),
+        "program_name": "File Archive",
+        "program_version_number": PROGRAM_VERSION,
+        "storage_mode": storage_mode,
+        "version_cache_mb": 0,
+        **(extra_config or {}),
+    }
+    with open(base_path / "config.yaml", "w", encoding="utf-8") as file:
+        yaml.safe_dump(config, file, allow_unicode=True)
+
+    # The server copy of the program has the same version, so no update is offered
+    with open(server_path / "config.yaml", "w", encoding="utf-8") as file:
+        yaml.safe_dump({"program_version_number": PROGRAM_VERSION}, file)
+
+    return base_path
+
+
+def version_name(index: int, dated: bool = True) -> str:
+    """Return the name of the index-th version of a group.
+
+    Args:
+        index: Version number within the group, from 0.
+        dated: Name with a date ("v1 01.01.2024") or without one ("release_001").
+    """
+    if not dated:
+        return f"release_{index + 1:03d}"
+    date = FIRST_VERSION_DATE + datetime.timedelta(days=7 * index)
+    return f"v{index + 1} {date:%d.%m.%Y}"
+
+
+def draw_file_size(rng: random.Random, mean_size: int, distribution: str = "fixed") -> int:
+    """Return a file size in bytes.
+
+    Args:
+        rng: Source of random values.
+        mean_size: Mean size of the files in bytes.
+        distribution: One of SIZE_DISTRIBUTIONS.
+
+    Raises:
+        ValueError: If the distribution is unknown.
+    """
+    if distribution == "fixed":
+        return mean_size
+    if distribution == "uniform":
+        return rng.randint(0, 2 * mean_size)
+    if distribution == "lognormal":
+        if mean_size <= 0:
+            return 0
+        mu = math.log(mean_size) - LOGNORMAL_SIGMA ** 2 / 2
+        return int(rng.lognormvariate(mu, LOGNORMAL_SIGMA))
+    raise ValueError(f"Unknown size distribution: {distribution}")
+
+
+def write_version_tree(
+    path: Path,
+    files: int,
+    file_size: int,
+    rng: random.Random,
+    size_distribution: str = "fixed",
+) -> int:
+    """Write the source folder of a version.
+
+    Args:
+        path: Folder to create.
+        files: Number of files.
+        file_size: Mean size of the files in bytes.
+        rng: Source of the file sizes and contents.
+        size_distribution: One of SIZE_DISTRIBUTIONS.
+
+    Returns:
+        Total size of the files in bytes.
+    """
+    path.mkdir(parents=True)
+    total_size = 0
+    for index in range(files):
+        # Every tenth file goes to a subfolder, as project folders usually have some
+        folder = path / "docs" if index % 10 == 9 else path
+        folder.mkdir(exist_ok=True)
+        size = draw_file_size(rng, file_size, size_distribution)
+        (folder / f"file_{index:04d}.bin").write_bytes(rng.randbytes(size))
+        total_size += size
+    return total_size
+
+
+def populate_archive(
+    model: Model,
+    groups: int,
+    versions: int,
+    files: int,
+    file_size: int,
+    size_distribution: str = "fixed",
+    undated_share: float = 0.0,
+    seed: int = 0,
+) -> list[tuple[str, str]]:
+    """Fill the share of a model with generated groups and versions.
+
+    Args:
+        model: Model of an environment created by create_environment().
+        groups: Number of groups.
+        versions: Number of versions in every group.
+        files: Number of files in every version.
+        file_size: Mean size of the files in bytes.
+        size_distribution: One of SIZE_DISTRIBUTIONS.
+        undated_share: Share of the groups (0..1) whose versions have no date in the name.
+        seed: Seed of the file sizes and contents.
+
+    Returns:
+        (group, version) pairs that were added.
+
+    Raises:
+        RuntimeError: If the model failed to create a group or add a version.
+    """
+    rng = random.Random(seed)
+    undated_groups = round(groups * undated_share)
+    added: list[tuple[str, str]] = []
+
+    with tempfile.TemporaryDirectory(prefix="fa_versions_") as temp_dir:
+        for group_index in range(groups):
+            group = f"Группа {group_index + 1:04d}"
+            if model.create_new_group(group) != 0:
+                raise RuntimeError(f"Не удалось создать группу {group}")
+
+            # Undated groups are spread over the share instead of being the first ones
+            dated = (group_index * undated_groups) % groups >= undated_groups
+            for version_index in range(versions):
+                name = version_name(version_index, dated=dated)
+                source = Path(temp_dir) / f"{group_index}" / name
+                write_version_tree(source, files, file_size, rng, size_distribution)
+
+                if model.add_version(str(source), group) != 0:
+                    raise RuntimeError(f"Не удалось добавить версию {name} в группу {group}")
+                added.append((group, name))
+
+    return added
@@ -1,2 +1,18 @@
 from .notifications import Notification
-from .password_dialog import PasswordDialog
\ No newline at end of file
+from .password_dialog import PasswordDialog
+from .catalog import Catalog
+from .search_index import SearchIndex
+from .file_cipher import Digest, FileCipher
+from .key_manager import KeyManager
+from .file_pipeline import FilePipeline
+from .progress_tracker import ProgressTracker
+from .version_pack import PackEntry, PackReader, PackWriter, VersionPack
+from .object_store import ManifestEntry, ObjectStore
+from .block_delta import BlockDelta
+from .version_cache import VersionCache
+from .job_scheduler import Job, JobScheduler
+from .cancel_token import CancelToken, OperationCancelled
+from .transfer_journal import TransferJournal
+from .table_rows_model import TableRowsModel
+from .catalog_scanner import CatalogScanner
+from .startup_profiler import StartupProfiler
\ No newline at end of file
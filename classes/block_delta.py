@@ -0,0 +1,272 @@
+import struct
+import hashlib
+
+from typing import BinaryIO, Callable, Iterator
+from pathlib import Path
+
+
+class BlockDelta:
+    """Block-based binary deltas between two versions of a file.
+
+    A file is split into fixed-size blocks; its signature is the list of
+    keyed BLAKE2b digests of the blocks. A delta against a base file is a
+    sequence of operations: copy a run of blocks from the base, or insert
+    literal data. Only the base signature is needed to build a delta, so
+    the base content never has to be downloaded when uploading.
+
+    Delta stream layout:
+
+        header: magic "FADELTA" | format version (1 byte) | chain depth (uint16) |
+                block size (uint32) | base object id (64 ASCII chars) | target size (uint64)
+        ops:    1 | first block (uint32) | block count (uint32)   - copy from base
+                2 | length (uint32) | data                         - literal data
+                0                                                  - end
+
+    Blocks are matched at block boundaries, which suits binaries that are
+    changed in place; data shifted by an insertion is stored as literals.
+    """
+
+    MAGIC = b"FADELTA"
+    FORMAT_VERSION = 1
+    DEFAULT_BLOCK_SIZE = 64 * 1024
+    DIGEST_SIZE = 16
+    MAX_LITERAL_RATIO = 0.5  # A delta with more literal data than this is not worth storing
+
+    HEADER_STRUCT = struct.Struct(">7sBHI64sQ")
+    OP_STRUCT = struct.Struct(">B")
+    COPY_STRUCT = struct.Struct(">II")
+    DATA_STRUCT = struct.Struct(">I")
+    OP_END, OP_COPY, OP_DATA = 0, 1, 2
+    MAX_DATA_LENGTH = 0xFFFFFFFF  # Longer literal runs are split into several operations
+
+    def __init__(self, hash_key: bytes, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        """Initialize the delta encoder.
+
+        Args:
+            hash_key: Key of the block digests (up to 64 bytes).
+            block_size: Size of the blocks in bytes.
+        """
+        self.hash_key = hash_key
+        self.block_size = block_size
+
+    def signature(self, src_path: str | Path) -> bytes:
+        """Return the concatenated block digests of a file."""
+        digests = bytearray()
+        for block in self._iter_blocks(src_path):
+            digests += self._digest(block)
+        return bytes(digests)
+
+    def plan(self, src_path: str | Path, base_signature: bytes) -> tuple[list[tuple[int, int, int]], int, int] | None:
+        """Plan a delta of a file against a base.
+
+        Args:
+            src_path: Path to the new file.
+            base_signature: Signature of the base file.
+
+        Returns:
+            (operations, literal bytes, file size), where an operation is
+            (OP_COPY, first block, count) or (OP_DATA, offset, length),
+            or None if the delta is not worth storing.
+        """
+        size = self.DIGEST_SIZE
+        base_blocks: dict[bytes, int] = {}
+        for index in range(len(base_signature) // size):
+            base_blocks.setdefault(base_signature[index * size:(index + 1) * size], index)
+
+        ops: list[tuple[int, int, int]] = []
+        literal = 0
+        offset = 0
+        for block in self._iter_blocks(src_path):
+            base_index = base_blocks.get(self._digest(block))
+            last = ops[-1] if ops else None
+
+            if base_index is not None:
+                if last and last[0] == self.OP_COPY and last[1] + last[2] == base_index:
+                    ops[-1] = (self.OP_COPY, last[1], last[2] + 1)
+                else:
+                    ops.append((self.OP_COPY, base_index, 1))
+            else:
+                literal += len(block)
+                if last and last[0] == self.OP_DATA and last[2] + len(block) <= self.MAX_DATA_LENGTH:
+                    ops[-1] = (self.OP_DATA, last[1], last[2] + len(block))
+                else:
+                    ops.append((self.OP_DATA, offset, len(block)))
+
+            offset += len(block)
+
+        if literal > offset * self.MAX_LITERAL_RATIO:
+            return None
+        return ops, literal, offset
+
+    def iter_encode(
+        self,
+        src_path: str | Path,
+        ops: list[tuple[int, int, int]],
+        base_id: str,
+        depth: int,
+        size: int,
+        progress: Callable[[int], None] | None = None,
+    ) -> Iterator[bytes]:
+        """Yield the delta stream for planned operations.
+
+        Args:
+            src_path: Path to the new file.
+            ops: Operations returned by plan().
+            base_id: Object id of the base.
+            depth: Chain depth of the delta (1 for a delta against a full object).
+            size: Size of the new file.
+            progress: Callback receiving the number of bytes of the new file covered.
+        """
+        yield self.HEADER_STRUCT.pack(
+            self.MAGIC, self.FORMAT_VERSION, depth, self.block_size, base_id.encode("ascii"), size
+        )
+
+        position = 0  # Offset in the new file
+        with open(src_path, "rb") as src:
+            for op, first, count in ops:
+                if op == self.OP_COPY:
+                    yield self.OP_STRUCT.pack(op) + self.COPY_STRUCT.pack(first, count)
+                    covered = min(count * self.block_size, size - position)
+                    position += covered
+                    if progress is not None:
+                        progress(covered)
+                    continue
+
+                position += count
+                yield self.OP_STRUCT.pack(op) + self.DATA_STRUCT.pack(count)
+                src.seek(first)
+                remaining = count
+                while remaining:
+                    data = src.read(min(remaining, self.block_size))
+                    if not data:
+                        raise OSError(f"File changed while adding: {src_path}")
+                    remaining -= len(data)
+                    if progress is not None:
+                        progress(len(data))
+                    yield data
+
+        yield self.OP_STRUCT.pack(self.OP_END)
+
+    @classmethod
+    def read_header(cls, reader: "IterReader") -> tuple[int, int, str, int]:
+        """Read the header of a delta stream.
+
+        Returns:
+            (chain depth, block size, base object id, target size).
+
+        Raises:
+            InvalidToken: If the stream is not a delta.
+        """
+        from cryptography.fernet import InvalidToken
+
+        header = reader.read_exact(cls.HEADER_STRUCT.size)
+        magic, format_version, depth, block_size, base_id, size = cls.HEADER_STRUCT.unpack(header)
+        if magic != cls.MAGIC or format_version != cls.FORMAT_VERSION:
+            raise InvalidToken
+        return depth, block_size, base_id.decode("ascii"), size
+
+    @classmethod
+    def apply(cls, reader: "IterReader", block_size: int, size: int, base: BinaryIO, dst: BinaryIO) -> None:
+        """Rebuild a file from the operations of a delta stream.
+
+        Args:
+            reader: Delta stream positioned after the header.
+            block_size: Block size from the header.
+            size: Target size from the header.
+            base: Decrypted base file opened for reading.
+            dst: Destination file.
+
+        Raises:
+            InvalidToken: If the stream is damaged.
+        """
+        from cryptography.fernet import InvalidToken
+
+        written = 0
+        while True:
+            op = cls.OP_STRUCT.unpack(reader.read_exact(cls.OP_STRUCT.size))[0]
+
+            if op == cls.OP_END:
+                break
+
+            if op == cls.OP_COPY:
+                first, count = cls.COPY_STRUCT.unpack(reader.read_exact(cls.COPY_STRUCT.size))
+                base.seek(first * block_size)
+                remaining = count * block_size
+                while remaining:
+                    data = base.read(min(remaining, block_size))
+                    if not data:
+                        # Run ends with the last (shorter) block of the base
+                        break
+                    dst.write(data)
+                    written += len(data)
+                    remaining -= len(data)
+
+            elif op == cls.OP_DATA:
+                remaining = cls.DATA_STRUCT.unpack(reader.read_exact(cls.DATA_STRUCT.size))[0]
+                while remaining:
+                    data = reader.read_exact(min(remaining, block_size))
+                    dst.write(data)
+                    written += len(data)
+                    remaining -= len(data)
+
+            else:
+                raise InvalidToken
+
+        if written != size or reader.read(1):
+            raise InvalidToken
+
+    # === Internal helpers ===
+
+    def _iter_blocks(self, src_path: str | Path) -> Iterator[bytes]:
+        """Yield the blocks of a file."""
+        with open(src_path, "rb") as src:
+            while True:
+                block = src.read(self.block_size)
+                if not block:
+                    return
+                yield block
+
+    def _digest(self, block: bytes) -> bytes:
+        """Return the keyed digest of a block."""
+        return hashlib.blake2b(block, digest_size=self.DIGEST_SIZE, key=self.hash_key).digest()
+
+
+class IterReader:
+    """File-like reader over an iterator of byte strings."""
+
+    def __init__(self, pieces: Iterator[bytes]) -> None:
+        self._pieces = iter(pieces)
+        self._buffer = b""
+        self._position = 0
+        self._exhausted = False
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes (all remaining bytes if size is negative)."""
+        available = len(self._buffer) - self._position
+        pieces: list[bytes] = []
+        while not self._exhausted and (size < 0 or available < size):
+            piece = next(self._pieces, None)
+            if piece is None:
+                self._exhausted = True
+            else:
+                pieces.append(piece)
+                available += len(piece)
+
+        if pieces:
+            self._buffer = b"".join([self._buffer[self._position:], *pieces])
+            self._position = 0
+
+        if size < 0 or size > available:
+            size = available
+        data = self._buffer[self._position:self._position + size]
+        self._position += size
+        return data
+
+    def read_exact(self, size: int) -> bytes:
+        """Read exactly size bytes or raise InvalidToken on a truncated stream."""
+        from cryptography.fernet import InvalidToken
+
+        data = self.read(size)
+        if len(data) != size:
+            raise InvalidToken
+        return data
@@ -0,0 +1,55 @@
+import threading
+
+
+class OperationCancelled(Exception):
+    """Raised inside an operation whose CancelToken was cancelled."""
+
+
+class CancelToken:
+    """Cooperative cancellation and pause flag of a long-running operation.
+
+    The GUI thread calls cancel(), pause() and resume(); the operation calls
+    check() between files or chunks. check() blocks while the token is
+    paused and raises OperationCancelled once it is cancelled, so the
+    operation stops at a point where it can clean up its partial output.
+    Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._cancelled = threading.Event()
+        self._running = threading.Event()  # Cleared while paused
+        self._running.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True if cancel() was called."""
+        return self._cancelled.is_set()
+
+    @property
+    def is_paused(self) -> bool:
+        """True if the operation is paused."""
+        return not self._running.is_set()
+
+    def cancel(self) -> None:
+        """Request the operation to stop (a paused operation is woken up)."""
+        self._cancelled.set()
+        self._running.set()
+
+    def pause(self) -> None:
+        """Suspend the operation at its next check()."""
+        if not self.is_cancelled:
+            self._running.clear()
+
+    def resume(self) -> None:
+        """Continue a paused operation."""
+        self._running.set()
+
+    def check(self) -> None:
+        """Wait while paused.
+
+        Raises:
+            OperationCancelled: If the token is cancelled.
+        """
+        self._running.wait()
+        if self._cancelled.is_set():
+            raise OperationCancelled
@@ -0,0 +1,262 @@
+import re
+import sqlite3
+
+from pathlib import Path
+from contextlib import contextmanager
+
+
+class Catalog:
+    """Persistent index of groups and versions stored next to the groups.
+
+    The catalog is a single SQLite file placed in the versions directory.
+    Clients read groups, versions and precomputed actual versions from it
+    instead of listing every group directory on the network share.
+    Every write is performed in one transaction, so readers never see
+    a half-updated group.
+
+    For each group the catalog also keeps a snapshot of the group directory
+    (its modification time). Comparing snapshots with the current state of
+    the share tells which groups have to be rescanned; a snapshot without
+    a time is always rescanned.
+    """
+
+    # Service entries start with "~" and are never shown as groups or versions
+    FILE_NAME = "~catalog.sqlite"
+    SCHEMA_VERSION = 2
+
+    def __init__(self, versions_path: str | Path) -> None:
+        """Initialize the catalog for a versions directory.
+
+        Args:
+            versions_path: Path to the folder with groups on the server.
+        """
+        self.path = Path(versions_path) / self.FILE_NAME
+
+    # === Reading ===
+
+    def is_built(self) -> bool:
+        """Return True if the catalog file exists and has been fully built."""
+        if not self.path.exists():
+            return False
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+
+        return row is not None and int(row[0]) == self.SCHEMA_VERSION
+
+    def get_groups(self) -> list[str]:
+        """Return sorted list of group names."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT name FROM groups ORDER BY name").fetchall()
+        return [row[0] for row in rows]
+
+    def has_group(self, group_name: str) -> bool:
+        """Return True if the group is present in the catalog."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM groups WHERE name = ?", (group_name,)
+            ).fetchone()
+        return row is not None
+
+    def get_group_versions(self, group_name: str) -> list[str]:
+        """Return versions of a group, newest first.
+
+        Args:
+            group_name: Name of the group.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name FROM versions WHERE group_name = ? ORDER BY position",
+                (group_name,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_groups_actual_versions(self) -> list[list[str | None]]:
+        """Return [group_name, actual_version] rows for all groups."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name, actual_version FROM groups ORDER BY name"
+            ).fetchall()
+        return [[name, actual] for name, actual in rows]
+
+    def get_all_versions(self) -> dict[str, list[str]]:
+        """Return mapping group name -> versions (newest first) for all groups."""
+        result: dict[str, list[str]] = {name: [] for name in self.get_groups()}
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT group_name, name FROM versions ORDER BY group_name, position"
+            ).fetchall()
+
+        for group_name, version_name in rows:
+            if group_name in result:
+                result[group_name].append(version_name)
+        return result
+
+    def get_snapshots(self) -> dict[str, int | None]:
+        """Return mapping group name -> directory mtime in ns.
+
+        Groups without a stored snapshot are returned with mtime None.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT g.name, s.mtime_ns "
+                "FROM groups g LEFT JOIN snapshots s ON s.group_name = g.name"
+            ).fetchall()
+        return {name: mtime_ns for name, mtime_ns in rows}
+
+    # === Writing ===
+
+    def replace_group(
+        self,
+        group_name: str,
+        versions: list[str],
+        actual_version: str | None,
+        mtime_ns: int | None = None,
+    ) -> None:
+        """Insert or replace a group together with all its versions.
+
+        Args:
+            group_name: Name of the group.
+            versions: Version names, newest first.
+            actual_version: Precomputed actual version of the group.
+            mtime_ns: Modification time of the group directory at scan time.
+        """
+        with self._connect() as conn:
+            self._write_group(conn, group_name, versions, actual_version, mtime_ns)
+
+    def remove_group(self, group_name: str) -> None:
+        """Remove a group and its versions from the catalog."""
+        with self._connect() as conn:
+            self._delete_group(conn, group_name)
+
+    def apply_changes(
+        self,
+        changed: dict[str, tuple[list[str], str | None, int | None]],
+        removed: list[str],
+    ) -> None:
+        """Write rescanned groups and drop removed ones in one transaction.
+
+        Args:
+            changed: Mapping group name -> (versions, actual version, mtime in ns).
+            removed: Names of groups that no longer exist.
+        """
+        with self._connect() as conn:
+            for group_name in removed:
+                self._delete_group(conn, group_name)
+            for group_name, (versions, actual_version, mtime_ns) in changed.items():
+                self._write_group(conn, group_name, versions, actual_version, mtime_ns)
+
+    def clear_snapshots(self, group_names: list[str]) -> None:
+        """Drop the mtime of group snapshots, so the groups are rescanned on the next refresh."""
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE snapshots SET mtime_ns = NULL WHERE group_name = ?",
+                [(group_name,) for group_name in group_names],
+            )
+
+    def rebuild(self, groups: dict[str, tuple[list[str], str | None, int | None]]) -> None:
+        """Replace the whole catalog content in one transaction.
+
+        Args:
+            groups: Mapping group name -> (versions newest first, actual version,
+                mtime of the group directory in ns).
+        """
+        with self._connect() as conn:
+            # Snapshots of older schema versions had another layout
+            conn.execute("DROP TABLE IF EXISTS snapshots")
+            self._create_snapshots_table(conn)
+            conn.execute("DELETE FROM versions")
+            conn.execute("DELETE FROM groups")
+            for group_name, (versions, actual_version, mtime_ns) in groups.items():
+                self._write_group(conn, group_name, versions, actual_version, mtime_ns)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(self.SCHEMA_VERSION),),
+            )
+
+    # === Internal helpers ===
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection, commit on success, roll back on error and close it.
+
+        A fresh connection is used per call, so the catalog can be accessed
+        from worker threads as well as from the GUI thread.
+        """
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            self._ensure_schema(conn)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        """Create catalog tables if they do not exist yet."""
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS groups ("
+                "name TEXT PRIMARY KEY, "
+                "actual_version TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS versions ("
+                "group_name TEXT NOT NULL, "
+                "name TEXT NOT NULL, "
+                "date TEXT, "
+                "position INTEGER NOT NULL, "
+                "PRIMARY KEY (group_name, name))"
+            )
+            self._create_snapshots_table(conn)
+
+    def _create_snapshots_table(self, conn: sqlite3.Connection) -> None:
+        """Create the snapshots table if it does not exist yet."""
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "group_name TEXT PRIMARY KEY, "
+            "mtime_ns INTEGER)"
+        )
+
+    def _write_group(
+        self,
+        conn: sqlite3.Connection,
+        group_name: str,
+        versions: list[str],
+        actual_version: str | None,
+        mtime_ns: int | None,
+    ) -> None:
+        """Write one group with its versions and snapshot using an open connection."""
+        conn.execute("DELETE FROM versions WHERE group_name = ?", (group_name,))
+        conn.execute(
+            "INSERT OR REPLACE INTO groups (name, actual_version) VALUES (?, ?)",
+            (group_name, actual_version),
+        )
+        conn.executemany(
+            "INSERT INTO versions (group_name, name, date, position) VALUES (?, ?, ?, ?)",
+            [
+                (group_name, version_name, self._extract_date(version_name), position)
+                for position, version_name in enumerate(versions)
+            ],
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO snapshots (group_name, mtime_ns) VALUES (?, ?)",
+            (group_name, mtime_ns),
+        )
+
+    def _delete_group(self, conn: sqlite3.Connection, group_name: str) -> None:
+        """Delete one group with its versions and snapshot using an open connection."""
+        conn.execute("DELETE FROM snapshots WHERE group_name = ?", (group_name,))
+        conn.execute("DELETE FROM versions WHERE group_name = ?", (group_name,))
+        conn.execute("DELETE FROM groups WHERE name = ?", (group_name,))
+
+    @staticmethod
+    def _extract_date(version_name: str) -> str | None:
+        """Return DD.MM.YYYY date found in a version name, if any."""
+        match = re.search(r"\d{2}\.\d{2}\.\d{4}", version_name)
+        return match.group() if match else None
@@ -0,0 +1,88 @@
+import threading
+
+from typing import Callable
+
+
+class CatalogScanner:
+    """Worker thread running read-only queries to the share in the background.
+
+    Every query is sent to a channel: the consumer of its result (the
+    download table, a combobox). A new request to a channel supersedes the
+    previous one: a request still waiting in the queue is dropped, and the
+    result of one already running is not delivered, because its generation
+    is no longer the current one. Queries run one at a time in the order
+    their channels were requested, so a slow share is not flooded with
+    parallel listings. Results are passed to the on_result callback, which
+    is called from the worker thread. Thread-safe.
+    """
+
+    def __init__(self, on_result: Callable[[str, str, int, object], None]) -> None:
+        """Initialize the scanner (the worker thread is started on the first request).
+
+        Args:
+            on_result: Callback receiving (channel, name, generation, result) of every
+                current query; result is None if the query raised.
+        """
+        self._on_result = on_result
+
+        self._condition = threading.Condition()
+        self._pending: dict[str, tuple[int, str, Callable, tuple]] = {}  # Channel -> waiting query
+        self._generations: dict[str, int] = {}
+        self._thread: threading.Thread | None = None
+
+    def request(self, channel: str, name: str, fn: Callable, *args) -> int:
+        """Queue fn(*args) for a channel, superseding its earlier requests.
+
+        Args:
+            channel: Consumer of the result.
+            name: Query name passed back with the result.
+            fn: Function performing the query.
+            *args: Positional arguments for fn.
+
+        Returns:
+            Generation of the request within its channel.
+        """
+        with self._condition:
+            generation = self._generations.get(channel, 0) + 1
+            self._generations[channel] = generation
+
+            # A waiting query of the channel is replaced and moves to the end of the queue
+            self._pending.pop(channel, None)
+            self._pending[channel] = (generation, name, fn, args)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._work, daemon=True)
+                self._thread.start()
+            else:
+                self._condition.notify()
+
+        return generation
+
+    def is_current(self, channel: str, generation: int) -> bool:
+        """Check that no newer request was made to the channel.
+
+        Args:
+            channel: Consumer of the result.
+            generation: Generation returned by request().
+        """
+        with self._condition:
+            return self._generations.get(channel) == generation
+
+    # === Internal helpers ===
+
+    def _work(self) -> None:
+        """Worker loop: run waiting queries in request order."""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                channel = next(iter(self._pending))
+                generation, name, fn, args = self._pending.pop(channel)
+
+            try:
+                result = fn(*args)
+            except Exception:
+                result = None
+
+            if self.is_current(channel, generation):
+                self._on_result(channel, name, generation, result)
@@ -0,0 +1,403 @@
+import io
+import os
+import lzma
+import zlib
+import base64
+import struct
+
+from typing import BinaryIO, Callable, Iterator, Protocol
+from pathlib import Path
+
+
+class Digest(Protocol):
+    """Hash object updated with plaintext (hashlib.blake2b, hmac.HMAC, ...)."""
+
+    def update(self, data: bytes) -> None: ...
+
+
+class FileCipher:
+    """Streaming encryption of files in fixed-size authenticated chunks.
+
+    Layout of an encrypted (.enc) file:
+
+        header: magic "FAENC" | format version (1 byte) | flags (1 byte) |
+                reserved (1 byte) | chunk size (uint32) | nonce prefix (8 bytes)
+        chunks: length (uint32, high bit marks the last chunk) | AES-GCM ciphertext
+
+    Every chunk is encrypted with AES-256-GCM under a key derived from the
+    Fernet key, with a nonce built from the per-file prefix and the chunk
+    number. The header, chunk number and "last chunk" flag are bound as
+    associated data, so reordered, truncated or extended files fail
+    authentication. Memory usage is constant: one chunk at a time.
+
+    The flags byte holds the compression codec applied to the plaintext
+    before encryption (0 = none); the compressed stream is split into
+    chunks, and decryption decompresses transparently.
+
+    Files and streams accept a digest (any hashlib-like object), which is
+    updated with the plaintext as it passes through, so a content hash is
+    obtained without reading the file a second time.
+
+    Files written by older versions of the program (a single Fernet token)
+    are recognized by the missing magic and decrypted transparently.
+    """
+
+    MAGIC = b"FAENC"
+    FORMAT_VERSION = 1
+    DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+    MAX_CHUNK_SIZE = 64 * 1024 * 1024  # Larger chunk sizes in a header are rejected before reading
+
+    HEADER_STRUCT = struct.Struct(">5sBBBI8s")
+    LENGTH_STRUCT = struct.Struct(">I")
+    LAST_CHUNK_FLAG = 0x80000000
+    TAG_SIZE = 16
+
+    CODECS = {"zlib": 1, "lzma": 2}  # Compression codec name -> header flags value
+
+    def __init__(self, key: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Initialize the cipher.
+
+        Args:
+            key: Fernet key (urlsafe base64, as stored in keyfile.key).
+            chunk_size: Size of plaintext chunks for new files.
+        """
+        from cryptography.fernet import Fernet
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        self.fernet = Fernet(key)
+        self.chunk_size = chunk_size
+
+        self._key_material = base64.urlsafe_b64decode(key)
+        self._aead = AESGCM(self.derive_key(b"file-archive/chunked-v1"))
+
+    def derive_key(self, info: bytes, length: int = 32) -> bytes:
+        """Derive an independent key for another purpose from the Fernet key.
+
+        Args:
+            info: Purpose label; different labels give unrelated keys.
+            length: Key length in bytes.
+        """
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+        hkdf = HKDF(
+            algorithm=hashes.SHA256(),
+            length=length,
+            salt=None,
+            info=info,
+        )
+        return hkdf.derive(self._key_material)
+
+    # === Files ===
+
+    def encrypt_file(
+        self,
+        src_path: str | Path,
+        dst_path: str | Path,
+        progress: Callable[[int], None] | None = None,
+        compression: str | None = None,
+        digest: Digest | None = None,
+    ) -> None:
+        """Encrypt a file into the chunked format.
+
+        Args:
+            src_path: Path to the plain source file.
+            dst_path: Path to the encrypted destination file.
+            progress: Callback receiving the number of source bytes read.
+            compression: Codec from CODECS applied before encryption, or None.
+            digest: Hash updated with the source bytes.
+        """
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            self.encrypt_stream(src, dst, progress, compression, digest)
+
+    def decrypt_file(
+        self,
+        src_path: str | Path,
+        dst_path: str | Path,
+        progress: Callable[[int], None] | None = None,
+        digest: Digest | None = None,
+    ) -> None:
+        """Decrypt a chunked or legacy Fernet file.
+
+        Args:
+            src_path: Path to the encrypted file.
+            dst_path: Path to the decrypted destination file.
+            progress: Callback receiving the number of encrypted bytes read.
+            digest: Hash updated with the decrypted bytes.
+
+        Raises:
+            InvalidToken: If the key is wrong or the data is damaged.
+        """
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            self.decrypt_stream(src, dst, progress, digest)
+
+    # === Streams ===
+
+    def encrypt_stream(
+        self,
+        src: BinaryIO,
+        dst: BinaryIO,
+        progress: Callable[[int], None] | None = None,
+        compression: str | None = None,
+        digest: Digest | None = None,
+    ) -> int:
+        """Encrypt everything read from src and write it to dst.
+
+        Returns:
+            Number of bytes written to dst.
+        """
+        written = 0
+        for piece in self.iter_encrypt(src, progress, compression, digest):
+            dst.write(piece)
+            written += len(piece)
+        return written
+
+    def decrypt_stream(
+        self,
+        src: BinaryIO,
+        dst: BinaryIO,
+        progress: Callable[[int], None] | None = None,
+        digest: Digest | None = None,
+    ) -> int:
+        """Decrypt everything read from src and write it to dst.
+
+        Returns:
+            Number of plaintext bytes written to dst.
+        """
+        written = 0
+        for piece in self.iter_decrypt(src, progress):
+            dst.write(piece)
+            if digest is not None:
+                digest.update(piece)
+            written += len(piece)
+        return written
+
+    def iter_encrypt(
+        self,
+        src: BinaryIO,
+        progress: Callable[[int], None] | None = None,
+        compression: str | None = None,
+        digest: Digest | None = None,
+    ) -> Iterator[bytes]:
+        """Yield the encrypted file piece by piece: header first, then chunks.
+
+        Args:
+            src: Plain source stream.
+            progress: Callback receiving the number of source bytes read.
+            compression: Codec from CODECS applied before encryption, or None.
+            digest: Hash updated with the source bytes.
+        """
+        flags = self.CODECS[compression] if compression else 0
+        header = self.HEADER_STRUCT.pack(
+            self.MAGIC, self.FORMAT_VERSION, flags, 0, self.chunk_size, os.urandom(8)
+        )
+        yield header
+
+        if compression:
+            pieces = self._iter_compressed(src, self._create_compressor(flags), progress, digest)
+        else:
+            pieces = self._iter_plain(src, progress, digest)
+
+        index = 0
+        current = next(pieces, b"")
+        while True:
+            # Take one chunk ahead to know whether the current one is the last
+            following = next(pieces, None)
+            is_last = following is None
+
+            yield self._encrypt_chunk(header, index, current, is_last)
+
+            if is_last:
+                return
+            current = following
+            index += 1
+
+    def iter_decrypt(self, src: BinaryIO, progress: Callable[[int], None] | None = None) -> Iterator[bytes]:
+        """Yield plaintext pieces of a chunked or legacy Fernet stream.
+
+        Args:
+            src: Encrypted source stream.
+            progress: Callback receiving the number of encrypted bytes read.
+
+        Raises:
+            InvalidToken: If the key is wrong or the data is damaged.
+        """
+        from cryptography.fernet import InvalidToken
+
+        magic = src.read(len(self.MAGIC))
+        if magic != self.MAGIC:
+            # Legacy format: the whole file is one Fernet token
+            token = magic + src.read()
+            yield self.fernet.decrypt(token)
+            if progress is not None:
+                progress(len(token))
+            return
+
+        header = magic + self._read_exact(src, self.HEADER_STRUCT.size - len(magic))
+        if progress is not None:
+            progress(len(header))
+        _, format_version, flags, _, chunk_size, _ = self.HEADER_STRUCT.unpack(header)
+        if format_version != self.FORMAT_VERSION or (flags and flags not in self.CODECS.values()):
+            raise InvalidToken
+        if chunk_size > self.MAX_CHUNK_SIZE:
+            raise InvalidToken
+        # Compressed data is split into chunk_size pieces too, so no codec adds to the bound
+        max_length = chunk_size + self.TAG_SIZE
+
+        decompressor = self._create_decompressor(flags) if flags else None
+
+        index = 0
+        while True:
+            length_field = self.LENGTH_STRUCT.unpack(self._read_exact(src, self.LENGTH_STRUCT.size))[0]
+            is_last = bool(length_field & self.LAST_CHUNK_FLAG)
+            length = length_field & ~self.LAST_CHUNK_FLAG
+            if length > max_length:
+                # A damaged length field must not make the reader allocate or wait for a huge chunk
+                raise InvalidToken
+            ciphertext = self._read_exact(src, length)
+
+            plaintext = self._decrypt_chunk(header, index, ciphertext, is_last)
+            if decompressor is None:
+                yield plaintext
+            else:
+                yield from self._decompress(decompressor, plaintext)
+            if progress is not None:
+                progress(self.LENGTH_STRUCT.size + len(ciphertext))
+
+            if is_last:
+                if src.read(1):
+                    # Data after the last chunk
+                    raise InvalidToken
+                if decompressor is not None and not decompressor.eof:
+                    # Compressed stream is incomplete
+                    raise InvalidToken
+                return
+            index += 1
+
+    # === Small buffers ===
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """Encrypt an in-memory buffer into the chunked format."""
+        dst = io.BytesIO()
+        self.encrypt_stream(io.BytesIO(data), dst)
+        return dst.getvalue()
+
+    def decrypt_bytes(self, data: bytes) -> bytes:
+        """Decrypt an in-memory buffer in the chunked or legacy format."""
+        return b"".join(self.iter_decrypt(io.BytesIO(data)))
+
+    # === Internal helpers ===
+
+    def _iter_plain(
+        self, src: BinaryIO, progress: Callable[[int], None] | None, digest: Digest | None = None
+    ) -> Iterator[bytes]:
+        """Yield chunk-sized pieces of the source."""
+        while True:
+            data = src.read(self.chunk_size)
+            if not data:
+                return
+            if progress is not None:
+                progress(len(data))
+            if digest is not None:
+                digest.update(data)
+            yield data
+
+    def _iter_compressed(
+        self, src: BinaryIO, compressor, progress: Callable[[int], None] | None, digest: Digest | None = None
+    ) -> Iterator[bytes]:
+        """Yield chunk-sized pieces of the compressed source."""
+        buffer = bytearray()
+        while True:
+            data = src.read(self.chunk_size)
+            if progress is not None and data:
+                progress(len(data))
+            if digest is not None and data:
+                digest.update(data)
+
+            buffer += compressor.compress(data) if data else compressor.flush()
+            while len(buffer) >= self.chunk_size:
+                yield bytes(buffer[:self.chunk_size])
+                del buffer[:self.chunk_size]
+
+            if not data:
+                if buffer:
+                    yield bytes(buffer)
+                return
+
+    def _create_compressor(self, flags: int):
+        """Return a streaming compressor for a codec flags value."""
+        if flags == self.CODECS["lzma"]:
+            return lzma.LZMACompressor(format=lzma.FORMAT_XZ)
+        return zlib.compressobj(6)
+
+    def _create_decompressor(self, flags: int):
+        """Return a streaming decompressor for a codec flags value."""
+        if flags == self.CODECS["lzma"]:
+            return lzma.LZMADecompressor(format=lzma.FORMAT_XZ)
+        return zlib.decompressobj()
+
+    def _decompress(self, decompressor, data: bytes) -> Iterator[bytes]:
+        """Decompress one chunk, yielding at most chunk_size bytes at a time.
+
+        The output is bounded, so a highly compressible chunk does not
+        expand into memory all at once.
+        """
+        from cryptography.fernet import InvalidToken
+
+        try:
+            if isinstance(decompressor, lzma.LZMADecompressor):
+                piece = decompressor.decompress(data, self.chunk_size)
+                while True:
+                    if piece:
+                        yield piece
+                    if decompressor.eof or decompressor.needs_input:
+                        return
+                    piece = decompressor.decompress(b"", self.chunk_size)
+            else:
+                piece = decompressor.decompress(data, self.chunk_size)
+                while True:
+                    if piece:
+                        yield piece
+                    if not decompressor.unconsumed_tail:
+                        return
+                    piece = decompressor.decompress(decompressor.unconsumed_tail, self.chunk_size)
+        except (zlib.error, lzma.LZMAError):
+            raise InvalidToken from None
+
+    def _encrypt_chunk(self, header: bytes, index: int, plaintext: bytes, is_last: bool) -> bytes:
+        """Encrypt one chunk and return it with its length prefix."""
+        ciphertext = self._aead.encrypt(
+            self._nonce(header, index), plaintext, self._associated_data(header, index, is_last)
+        )
+
+        length_field = len(ciphertext) | (self.LAST_CHUNK_FLAG if is_last else 0)
+        return self.LENGTH_STRUCT.pack(length_field) + ciphertext
+
+    def _decrypt_chunk(self, header: bytes, index: int, ciphertext: bytes, is_last: bool) -> bytes:
+        """Authenticate and decrypt one chunk."""
+        from cryptography.exceptions import InvalidTag
+        from cryptography.fernet import InvalidToken
+
+        try:
+            return self._aead.decrypt(
+                self._nonce(header, index), ciphertext, self._associated_data(header, index, is_last)
+            )
+        except InvalidTag:
+            raise InvalidToken from None
+
+    def _nonce(self, header: bytes, index: int) -> bytes:
+        """Return 96-bit nonce: 8-byte file prefix + 4-byte chunk number."""
+        return header[-8:] + struct.pack(">I", index)
+
+    def _associated_data(self, header: bytes, index: int, is_last: bool) -> bytes:
+        """Return data authenticated together with a chunk."""
+        return header + struct.pack(">IB", index, int(is_last))
+
+    def _read_exact(self, src: BinaryIO, size: int) -> bytes:
+        """Read exactly size bytes or raise InvalidToken on a truncated stream."""
+        from cryptography.fernet import InvalidToken
+
+        data = src.read(size)
+        if len(data) != size:
+            raise InvalidToken
+        return data
@@ -0,0 +1,149 @@
+import os
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class FilePipeline:
+    """Bounded thread pool for per-file work (encryption, decryption, copying).
+
+    The producer (usually a directory walk on the calling thread) submits
+    tasks one by one; submit() blocks while max_pending tasks are queued or
+    running, so walking a huge tree never creates all tasks at once.
+    An optional byte budget additionally limits the total size of files
+    in flight: a task of `size` bytes waits until the budget allows it
+    (a task larger than the whole budget runs alone).
+    Worker threads are used for both I/O and crypto: `cryptography`
+    releases the GIL while encrypting, so files are processed in parallel.
+
+    The first failed task stops the pipeline: further submit() calls raise
+    its exception and join() re-raises it after running tasks finish.
+
+    Usage:
+        with FilePipeline(workers=8) as pipeline:
+            for src, dst in files:
+                pipeline.submit(encrypt, src, dst)
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int | None = None,
+        max_in_flight_bytes: int | None = None,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            workers: Number of worker threads.
+            max_pending: Maximum number of queued and running tasks.
+                Defaults to four tasks per worker.
+            max_in_flight_bytes: Maximum total size of queued and running
+                tasks. None disables the byte budget.
+        """
+        self.workers = max(1, workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="file-pipeline")
+        self._slots = threading.BoundedSemaphore(max_pending or self.workers * 4)
+
+        self._lock = threading.Lock()
+        self._budget_changed = threading.Condition(self._lock)
+        self._max_in_flight_bytes = max_in_flight_bytes
+        self._in_flight_bytes = 0
+        self._error: BaseException | None = None
+
+    @staticmethod
+    def resolve_workers(value: int | None) -> int:
+        """Return worker count from a configuration value (0 or None = CPU count)."""
+        if not value or value < 0:
+            return os.cpu_count() or 1
+        return int(value)
+
+    def submit(self, fn, *args, size: int = 0) -> None:
+        """Queue fn(*args), blocking while the pipeline is full.
+
+        Args:
+            fn: Task function.
+            *args: Positional arguments for fn.
+            size: Number of bytes the task processes (counted against the budget).
+
+        Raises:
+            The exception of a previously failed task.
+        """
+        self._raise_if_failed()
+        self._slots.acquire()
+
+        weight = 0
+        try:
+            weight = self._acquire_bytes(size)
+            self._raise_if_failed()
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._release(weight)
+            raise
+
+        future.add_done_callback(lambda f: self._on_done(f, weight))
+
+    def join(self) -> None:
+        """Wait for all submitted tasks and re-raise the first error."""
+        self._executor.shutdown(wait=True)
+        self._raise_if_failed()
+
+    def cancel(self) -> None:
+        """Drop queued tasks and wait for running ones to finish."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "FilePipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            self.cancel()
+            return False
+
+        self.join()
+        return False
+
+    # === Internal helpers ===
+
+    def _acquire_bytes(self, size: int) -> int:
+        """Wait until size bytes fit into the budget and reserve them.
+
+        Returns:
+            Number of reserved bytes.
+        """
+        if not self._max_in_flight_bytes:
+            return 0
+
+        weight = min(size, self._max_in_flight_bytes)
+        with self._budget_changed:
+            while (
+                self._in_flight_bytes
+                and self._in_flight_bytes + weight > self._max_in_flight_bytes
+                and self._error is None
+            ):
+                self._budget_changed.wait()
+            self._in_flight_bytes += weight
+        return weight
+
+    def _release(self, weight: int) -> None:
+        """Return a task slot and its reserved bytes."""
+        if weight:
+            with self._budget_changed:
+                self._in_flight_bytes -= weight
+                self._budget_changed.notify_all()
+        self._slots.release()
+
+    def _on_done(self, future: Future, weight: int) -> None:
+        """Release the slot of a finished task and remember its error."""
+        with self._budget_changed:
+            if not future.cancelled() and future.exception() is not None and self._error is None:
+                self._error = future.exception()
+                # Wake up a producer waiting for the budget
+                self._budget_changed.notify_all()
+        self._release(weight)
+
+    def _raise_if_failed(self) -> None:
+        """Raise the error of the first failed task, if any."""
+        with self._lock:
+            error = self._error
+        if error is not None:
+            raise error
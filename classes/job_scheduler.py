@@ -0,0 +1,204 @@
+import heapq
+import itertools
+import threading
+
+from typing import Callable
+
+from .cancel_token import CancelToken
+
+
+class Job:
+    """Background operation queued in a JobScheduler."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(
+        self, job_id: int, name: str, title: str, priority: int, fn: Callable, args: tuple, cancellable: bool = False
+    ) -> None:
+        """Initialize the job.
+
+        Args:
+            job_id: Sequential id of the job.
+            name: Operation name (download, add_version, delete_file, etc.).
+            title: Description shown in the queue panel.
+            priority: Lower values run first.
+            fn: Function performing the operation.
+            args: Positional arguments for fn.
+            cancellable: Whether fn checks the job token (see JobScheduler).
+        """
+        self.job_id = job_id
+        self.name = name
+        self.title = title
+        self.priority = priority
+        self.status = self.QUEUED
+        self.progress = 0
+        self.progress_text = ""
+        self.result = None
+        self.error: Exception | None = None  # Exception raised by fn, if any
+        self.cancellable = cancellable
+        self.token = CancelToken()
+
+        self._fn = fn
+        self._args = args
+
+    @property
+    def is_finished(self) -> bool:
+        """True if the job is done, failed or cancelled."""
+        return self.status in (self.DONE, self.FAILED, self.CANCELLED)
+
+
+class JobScheduler:
+    """Priority queue of background operations served by a pool of worker threads.
+
+    Jobs with a lower priority value start first; jobs of equal priority
+    start in submission order. A job whose function raises or returns a
+    non-zero status code is marked as failed, or as cancelled if its
+    token was cancelled; a raised exception is kept in job.error for the
+    on_change callback to report. A job cancelled while queued still runs,
+    so that its function can report the cancellation the usual way.
+
+    Progress reported from inside a job (report_progress) is stored on the
+    job that runs in the calling thread. Cancellable jobs are expected to
+    check job.token (CancelToken) of current_job() between files or
+    chunks; the token is only a request, nothing is interrupted by the
+    scheduler. Every change of a job is passed to the on_change callback,
+    which is called from worker threads. Thread-safe.
+    """
+
+    PRIORITY_HIGH = 0  # Operator downloads
+    PRIORITY_NORMAL = 1  # Deletions and group creation
+    PRIORITY_LOW = 2  # Bulk uploads
+
+    MAX_FINISHED_JOBS = 10  # Finished jobs kept for the queue panel
+
+    def __init__(self, workers: int = 2, on_change: Callable[[Job], None] | None = None) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            workers: Maximum number of jobs running at the same time.
+            on_change: Callback receiving a job whenever its status or progress changes.
+        """
+        self.workers = max(1, workers)
+        self._on_change = on_change
+
+        self._condition = threading.Condition()
+        self._queue: list[tuple[int, int, Job]] = []  # Heap of (priority, job id, job)
+        self._jobs: list[Job] = []
+        self._ids = itertools.count(1)
+        self._threads: list[threading.Thread] = []
+        self._idle_workers = 0
+        self._local = threading.local()
+
+    def submit(
+        self, name: str, title: str, fn: Callable, *args, priority: int = PRIORITY_NORMAL, cancellable: bool = False
+    ) -> Job:
+        """Queue fn(*args) as a job.
+
+        Args:
+            name: Operation name.
+            title: Description shown in the queue panel.
+            fn: Function performing the operation.
+            *args: Positional arguments for fn.
+            priority: PRIORITY_HIGH, PRIORITY_NORMAL or PRIORITY_LOW.
+            cancellable: Whether fn supports cancellation and pause through the job token.
+
+        Returns:
+            The queued job.
+        """
+        with self._condition:
+            job = Job(next(self._ids), name, title, priority, fn, args, cancellable)
+            self._jobs.append(job)
+            heapq.heappush(self._queue, (priority, job.job_id, job))
+
+            # A new worker is started only if the idle ones cannot take all queued jobs
+            if len(self._queue) > self._idle_workers and len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            else:
+                self._condition.notify()
+
+        self._notify(job)
+        return job
+
+    def jobs(self) -> list[Job]:
+        """Return queued, running and recently finished jobs in submission order."""
+        with self._condition:
+            return list(self._jobs)
+
+    def current_job(self) -> Job | None:
+        """Return the job running in the calling thread, or None outside of jobs."""
+        return getattr(self._local, "job", None)
+
+    def report_progress(self, text: str, value: int) -> None:
+        """Store progress of the job running in the calling thread.
+
+        Args:
+            text: Status text.
+            value: Progress value 0-100.
+        """
+        job = self.current_job()
+        if job is not None:
+            self.report_job_progress(job, text, value)
+
+    def report_job_progress(self, job: Job, text: str, value: int) -> None:
+        """Store progress of a job, e.g. reported from a worker thread of the job.
+
+        Args:
+            job: Job the progress belongs to.
+            text: Status text.
+            value: Progress value 0-100.
+        """
+        if job.progress_text == text and job.progress == value:
+            return
+
+        job.progress_text = text
+        job.progress = value
+        self._notify(job)
+
+    # === Internal helpers ===
+
+    def _work(self) -> None:
+        """Worker loop: run jobs from the queue by priority."""
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._idle_workers += 1
+                    self._condition.wait()
+                    self._idle_workers -= 1
+                _, _, job = heapq.heappop(self._queue)
+                job.status = Job.RUNNING
+
+            self._notify(job)
+            self._local.job = job
+            try:
+                job.result = job._fn(*job._args)
+                failed = isinstance(job.result, int) and job.result != 0
+            except Exception as e:
+                job.error = e
+                failed = True
+            finally:
+                self._local.job = None
+
+            with self._condition:
+                if failed:
+                    job.status = Job.CANCELLED if job.token.is_cancelled else Job.FAILED
+                else:
+                    job.status = Job.DONE
+                self._prune_finished()
+            self._notify(job)
+
+    def _prune_finished(self) -> None:
+        """Forget the oldest finished jobs beyond MAX_FINISHED_JOBS (the caller holds the lock)."""
+        finished = [job for job in self._jobs if job.is_finished]
+        for job in finished[:max(0, len(finished) - self.MAX_FINISHED_JOBS)]:
+            self._jobs.remove(job)
+
+    def _notify(self, job: Job) -> None:
+        """Pass a job change to the on_change callback."""
+        if self._on_change is not None:
+            self._on_change(job)
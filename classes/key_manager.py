@@ -0,0 +1,102 @@
+import time
+import threading
+
+from typing import TYPE_CHECKING
+from pathlib import Path
+
+from .file_cipher import FileCipher
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+
+class KeyManager:
+    """Loads the encryption key once and shares the cipher built from it.
+
+    The key file is read on first use only. Afterwards the same FileCipher
+    (and its Fernet instance) is reused for every file and string.
+    A change of the key file on disk is detected by its modification time,
+    checked at most once per RELOAD_CHECK_INTERVAL seconds; reload() forces
+    re-reading the key immediately. The manager is thread-safe.
+    """
+
+    RELOAD_CHECK_INTERVAL = 2.0  # Seconds between key file mtime checks
+
+    def __init__(self, keyfile_path: str | Path) -> None:
+        """Initialize the manager.
+
+        Args:
+            keyfile_path: Path to keyfile.key.
+        """
+        self.keyfile_path = Path(keyfile_path)
+
+        self._lock = threading.Lock()
+        self._cipher: FileCipher | None = None
+        self._mtime_ns: int | None = None  # mtime of the key file when it was loaded
+        self._checked_at: float = 0.0  # monotonic time of the last mtime check
+
+    def get_cipher(self) -> FileCipher:
+        """Return the shared FileCipher, loading or reloading the key if needed.
+
+        Raises:
+            FileNotFoundError: If the key file does not exist.
+            ValueError: If the key file content is not a valid key.
+        """
+        with self._lock:
+            if self._cipher is None or self._is_changed():
+                self._load()
+            return self._cipher
+
+    def get_fernet(self) -> "Fernet":
+        """Return the shared Fernet instance."""
+        return self.get_cipher().fernet
+
+    def reload(self) -> None:
+        """Re-read the key file regardless of its modification time."""
+        with self._lock:
+            self._load()
+
+    def reload_if_changed(self) -> bool:
+        """Re-read the key file if it changed on disk since it was loaded.
+
+        Returns:
+            True if the key was reloaded.
+        """
+        with self._lock:
+            self._checked_at = 0.0
+            if self._cipher is not None and not self._is_changed():
+                return False
+            self._load()
+            return True
+
+    # === Internal helpers (the caller must hold the lock) ===
+
+    def _load(self) -> None:
+        """Read the key file and build a new cipher."""
+        mtime_ns = self.keyfile_path.stat().st_mtime_ns
+
+        with open(self.keyfile_path, "rb") as kf:
+            key = kf.read().strip()
+
+        if not key:
+            raise ValueError("Keyfile is empty or invalid")
+
+        self._cipher = FileCipher(key)
+        self._mtime_ns = mtime_ns
+        self._checked_at = time.monotonic()
+
+    def _is_changed(self) -> bool:
+        """Return True if the key file mtime differs from the loaded one.
+
+        The file is checked at most once per RELOAD_CHECK_INTERVAL.
+        """
+        now = time.monotonic()
+        if now - self._checked_at < self.RELOAD_CHECK_INTERVAL:
+            return False
+
+        self._checked_at = now
+        try:
+            return self.keyfile_path.stat().st_mtime_ns != self._mtime_ns
+        except FileNotFoundError:
+            # Keep using the loaded key if the file disappeared
+            return False
@@ -0,0 +1,497 @@
+import os
+import hmac
+import json
+import time
+import hashlib
+import tempfile
+import threading
+
+from typing import BinaryIO, Callable, NamedTuple
+from pathlib import Path
+
+
+from .file_cipher import Digest, FileCipher
+from .block_delta import BlockDelta, IterReader
+
+
+class ManifestEntry(NamedTuple):
+    """File of a version stored in the object store."""
+
+    path: str  # Relative path inside the version, "/"-separated
+    object_id: str  # Id of the object with the file content
+    size: int  # Size of the plain file
+
+
+class ObjectStore:
+    """Content-addressed store of encrypted files shared by the versions of a group.
+
+    Every distinct file content is stored once, as a FileCipher-encrypted
+    object named by a keyed hash (HMAC-SHA256) of its plaintext. The hash key
+    is derived from the encryption key, so object names reveal nothing
+    about the contents to someone without the key. A version is reduced to
+    an encrypted manifest that maps relative paths to object ids; files
+    unchanged between versions are not uploaded again.
+
+    An object is stored either in full ("<id>") or as a block delta against
+    another object ("<id>.delta", see BlockDelta). Objects that may serve as
+    a delta base also get an encrypted block signature ("<id>.sig"). Delta
+    chains are limited to max_chain_length, after which a full object is
+    stored again, so restoring a file decrypts a bounded number of objects.
+
+    Objects are written under a temporary name and renamed when complete,
+    so an existing object is always whole. The store directory starts with
+    "~" and is therefore skipped when versions are listed.
+
+    An upload that reuses a stored object (or stores a delta against it)
+    touches the object and its chain of bases, so collect_garbage, which
+    only deletes objects older than its grace period, keeps them until the
+    new manifest refers to them. Within the process touches and garbage
+    collection of the same store are serialized, so an object is either
+    touched before a collection looks at it or found missing and uploaded
+    again.
+    """
+
+    DIR_NAME = "~objects"
+    MANIFEST_EXTENSION = ".manifest"
+    DELTA_EXTENSION = ".delta"
+    SIGNATURE_EXTENSION = ".sig"
+    READ_SIZE = 1024 * 1024
+
+    # Locks serializing touches and garbage collection, shared by all instances of a store
+    _root_locks: dict[str, threading.Lock] = {}
+    _root_locks_guard = threading.Lock()
+
+    def __init__(
+        self,
+        root: str | Path,
+        cipher: FileCipher,
+        block_size: int = BlockDelta.DEFAULT_BLOCK_SIZE,
+        max_chain_length: int = 5,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Directory of the store (usually "<group>/~objects").
+            cipher: Cipher for objects and manifests.
+            block_size: Block size of signatures and new deltas.
+            max_chain_length: Maximum number of deltas in a row.
+        """
+        self.root = Path(root)
+        self.cipher = cipher
+        self.max_chain_length = max_chain_length
+
+        self._hash_key = cipher.derive_key(b"file-archive/object-id-v1")
+        self._delta = BlockDelta(cipher.derive_key(b"file-archive/block-digest-v1"), block_size)
+        self._lock = threading.Lock()
+        self._known_ids: set[str] | None = None  # Ids of existing objects, listed once
+        self._delta_ids: set[str] = set()  # Ids of objects stored as deltas
+        self._writing_ids: set[str] = set()  # Ids reserved by a put() that is still writing
+
+        with self._root_locks_guard:
+            self._root_lock = self._root_locks.setdefault(str(self.root.resolve()), threading.Lock())
+
+    # === Objects ===
+
+    def object_id(self, src_path: str | Path, progress: Callable[[int], None] | None = None) -> str:
+        """Return the id of a file content.
+
+        Args:
+            src_path: Path to the plain file.
+            progress: Callback receiving the number of bytes read.
+        """
+        digest = hmac.new(self._hash_key, digestmod=hashlib.sha256)
+        with open(src_path, "rb") as src:
+            while True:
+                data = src.read(self.READ_SIZE)
+                if not data:
+                    break
+                digest.update(data)
+                if progress is not None:
+                    progress(len(data))
+        return digest.hexdigest()
+
+    def object_path(self, object_id: str) -> Path:
+        """Return the path of an object."""
+        return self.root / object_id
+
+    def has_object(self, object_id: str) -> bool:
+        """Return True if the object is stored.
+
+        The store directory is listed once; objects added through this
+        instance are remembered, so no request per file is made.
+        """
+        with self._lock:
+            return object_id in self._get_known_ids()
+
+    def touch(self, object_id: str) -> bool:
+        """Mark a stored object and its chain of delta bases as recently used.
+
+        Called for every object an upload reuses, so a garbage collection
+        does not delete it before the new manifest refers to it.
+
+        Args:
+            object_id: Id of the object.
+
+        Returns:
+            True if the object and all its bases exist, False if any of them is missing.
+        """
+        with self._root_lock:
+            with self._lock:
+                self._get_known_ids()
+                delta_ids = set(self._delta_ids)
+
+            try:
+                while True:
+                    is_delta = object_id in delta_ids
+                    os.utime(self.root / (f"{object_id}{self.DELTA_EXTENSION}" if is_delta else object_id))
+
+                    # The signature keeps the object usable as a delta base
+                    signature_path = self.root / f"{object_id}{self.SIGNATURE_EXTENSION}"
+                    if signature_path.exists():
+                        os.utime(signature_path)
+
+                    if not is_delta:
+                        return True
+                    object_id = self._read_delta_header(object_id)[2]
+
+            except FileNotFoundError:
+                # Deleted by a garbage collection of another client: the listing is stale
+                with self._lock:
+                    self._known_ids = None
+                return False
+
+    def put(
+        self,
+        object_id: str,
+        src_path: str | Path,
+        progress: Callable[[int], None] | None = None,
+        compression: str | None = None,
+    ) -> bool:
+        """Encrypt a file into the store unless its object already exists.
+
+        An existing object is touched instead (see touch()); if it has
+        disappeared meanwhile, it is written again.
+
+        Args:
+            object_id: Id of the file content, as returned by object_id().
+            src_path: Path to the plain file.
+            progress: Callback receiving the number of source bytes read.
+            compression: Codec from FileCipher.CODECS applied before encryption, or None.
+
+        Returns:
+            True if the object was written, False if it already existed.
+        """
+        with self._lock:
+            # Equal files of one upload are stored once: the id is reserved while it is written
+            if object_id in self._writing_ids:
+                return False
+            exists = object_id in self._get_known_ids()
+
+        if exists and self.touch(object_id):
+            return False
+
+        with self._lock:
+            if object_id in self._writing_ids:
+                return False
+            self._writing_ids.add(object_id)
+
+        temp_path = self.root / f"~{object_id}.{threading.get_ident()}.tmp"
+        try:
+            self.cipher.encrypt_file(src_path, temp_path, progress, compression)
+            os.replace(temp_path, self.object_path(object_id))
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            with self._lock:
+                self._writing_ids.discard(object_id)
+            raise
+
+        with self._lock:
+            self._writing_ids.discard(object_id)
+            self._get_known_ids().add(object_id)
+            self._delta_ids.discard(object_id)
+        return True
+
+    def put_delta(
+        self,
+        object_id: str,
+        src_path: str | Path,
+        base_id: str,
+        progress: Callable[[int], None] | None = None,
+        compression: str | None = None,
+    ) -> bool:
+        """Store a file as a delta against a base object, if it is worth it.
+
+        Only the signature of the base is read from the share. The base and
+        its chain are touched first (see touch()). Nothing is stored if the
+        base is missing or has no signature, the chain would become longer
+        than max_chain_length or the file differs too much from the base.
+
+        Args:
+            object_id: Id of the file content, as returned by object_id().
+            src_path: Path to the plain file.
+            base_id: Id of the base object (usually the same path in the previous version).
+            progress: Callback receiving the number of source bytes covered.
+            compression: Codec from FileCipher.CODECS applied before encryption, or None.
+
+        Returns:
+            True if the delta was written.
+        """
+        if not self.touch(base_id):
+            return False
+
+        depth = self.object_depth(base_id) + 1
+        if depth > self.max_chain_length:
+            return False
+
+        base_signature = self.get_signature(base_id)
+        if base_signature is None:
+            return False
+
+        plan = self._delta.plan(src_path, base_signature)
+        if plan is None:
+            return False
+        ops, _, size = plan
+
+        temp_path = self.root / f"~{object_id}.{threading.get_ident()}.tmp"
+        try:
+            reader = IterReader(self._delta.iter_encode(src_path, ops, base_id, depth, size, progress))
+            with open(temp_path, "wb") as dst:
+                self.cipher.encrypt_stream(reader, dst, None, compression)
+            os.replace(temp_path, self.root / f"{object_id}{self.DELTA_EXTENSION}")
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._get_known_ids().add(object_id)
+            self._delta_ids.add(object_id)
+        return True
+
+    def put_signature(self, object_id: str, src_path: str | Path) -> None:
+        """Store the block signature of an object, so later versions can be deltas against it.
+
+        Args:
+            object_id: Id of the object.
+            src_path: Path to the plain file of the object.
+        """
+        data = self.cipher.encrypt_bytes(self._delta.signature(src_path))
+        self._write_atomic(self.root / f"{object_id}{self.SIGNATURE_EXTENSION}", data)
+
+    def get_signature(self, object_id: str) -> bytes | None:
+        """Return the block signature of an object, or None if it has none."""
+        try:
+            with open(self.root / f"{object_id}{self.SIGNATURE_EXTENSION}", "rb") as f:
+                return self.cipher.decrypt_bytes(f.read())
+        except FileNotFoundError:
+            return None
+
+    def object_depth(self, object_id: str) -> int:
+        """Return the number of deltas needed to restore an object (0 for a full object)."""
+        with self._lock:
+            self._get_known_ids()
+            is_delta = object_id in self._delta_ids
+        if not is_delta:
+            return 0
+        return self._read_delta_header(object_id)[0]
+
+    def get(
+        self,
+        object_id: str,
+        dst_path: str | Path,
+        progress: Callable[[int], None] | None = None,
+        digest: Digest | None = None,
+    ) -> None:
+        """Decrypt an object into a file.
+
+        A delta object is restored by first restoring its base into a
+        temporary file next to the destination.
+
+        Args:
+            object_id: Id of the object.
+            dst_path: Path to the decrypted destination file.
+            progress: Callback receiving the number of restored bytes written,
+                so a file advances by its plain size whether it is stored
+                whole, compressed or as a delta.
+            digest: Hash updated with the restored bytes.
+        """
+        try:
+            src = open(self.object_path(object_id), "rb")
+        except FileNotFoundError:
+            self._get_delta(object_id, Path(dst_path), progress, digest)
+            return
+
+        with src, open(dst_path, "wb") as dst:
+            self.cipher.decrypt_stream(src, _TrackingWriter(dst, progress, digest))
+
+    def collect_garbage(self, referenced_ids: set[str], grace_seconds: float = 3600.0) -> int:
+        """Delete objects that no manifest refers to.
+
+        Bases of referenced delta objects are kept as well. Objects modified
+        less than grace_seconds ago are kept: they may be written or reused
+        (touched) by an upload that has not written its manifest yet.
+
+        Args:
+            referenced_ids: Ids referenced by all remaining manifests of the group.
+            grace_seconds: Minimum age of an object to be deleted.
+
+        Returns:
+            Number of deleted objects.
+        """
+        if not self.root.is_dir():
+            return 0
+
+        with self._root_lock:
+            return self._collect_garbage(referenced_ids, grace_seconds)
+
+    # === Manifests ===
+
+    def write_manifest(self, path: str | Path, directories: list[str], entries: list[ManifestEntry]) -> None:
+        """Write an encrypted version manifest.
+
+        The manifest is written under a "~" name and renamed when complete,
+        so the version appears only when all its objects are stored.
+
+        Args:
+            path: Path to the manifest file.
+            directories: Relative paths of the directories of the version.
+            entries: Files of the version.
+        """
+        path = Path(path)
+        manifest = {
+            "directories": directories,
+            "files": [list(entry) for entry in entries],
+        }
+        data = self.cipher.encrypt_bytes(json.dumps(manifest, ensure_ascii=False).encode("utf-8"))
+
+        self._write_atomic(path, data)
+
+    def read_manifest(self, path: str | Path) -> tuple[list[str], list[ManifestEntry]]:
+        """Read an encrypted version manifest.
+
+        Args:
+            path: Path to the manifest file.
+
+        Returns:
+            (directories, entries) of the version.
+
+        Raises:
+            InvalidToken: If the key is wrong or the manifest is damaged.
+        """
+        from cryptography.fernet import InvalidToken
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        try:
+            manifest = json.loads(self.cipher.decrypt_bytes(data).decode("utf-8"))
+        except ValueError:
+            raise InvalidToken from None
+
+        return manifest["directories"], [ManifestEntry(*item) for item in manifest["files"]]
+
+    # === Internal helpers ===
+
+    def _get_delta(
+        self, object_id: str, dst_path: Path, progress: Callable[[int], None] | None, digest: Digest | None = None
+    ) -> None:
+        """Restore a delta object: its base first, then the delta on top of it."""
+        with open(self.root / f"{object_id}{self.DELTA_EXTENSION}", "rb") as src:
+            reader = IterReader(self.cipher.iter_decrypt(src))
+            _, block_size, base_id, size = BlockDelta.read_header(reader)
+
+            fd, base_path = tempfile.mkstemp(prefix="~", suffix=".tmp", dir=dst_path.parent)
+            os.close(fd)
+            try:
+                self.get(base_id, base_path)
+                with open(base_path, "rb") as base, open(dst_path, "wb") as dst:
+                    BlockDelta.apply(reader, block_size, size, base, _TrackingWriter(dst, progress, digest))
+            finally:
+                os.unlink(base_path)
+
+    def _collect_garbage(self, referenced_ids: set[str], grace_seconds: float) -> int:
+        """Body of collect_garbage(); the caller holds the store lock."""
+        with self._lock:
+            self._known_ids = None
+            self._get_known_ids()
+            delta_ids = set(self._delta_ids)
+
+        # Delta objects keep their whole chain of bases alive
+        keep_ids = set(referenced_ids)
+        pending = [object_id for object_id in keep_ids if object_id in delta_ids]
+        while pending:
+            base_id = self._read_delta_header(pending.pop())[2]
+            if base_id not in keep_ids:
+                keep_ids.add(base_id)
+                if base_id in delta_ids:
+                    pending.append(base_id)
+
+        deadline = time.time() - grace_seconds
+        removed = 0
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                # "<id>", "<id>.delta" and "<id>.sig" belong to the same object
+                if entry.name.split(".", 1)[0] in keep_ids or not entry.is_file():
+                    continue
+                if entry.stat().st_mtime > deadline:
+                    continue
+                os.unlink(entry.path)
+                removed += 1
+
+        with self._lock:
+            self._known_ids = None
+        return removed
+
+    def _read_delta_header(self, object_id: str) -> tuple[int, int, str, int]:
+        """Return (chain depth, block size, base id, size) of a delta object."""
+        with open(self.root / f"{object_id}{self.DELTA_EXTENSION}", "rb") as src:
+            return BlockDelta.read_header(IterReader(self.cipher.iter_decrypt(src)))
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        """Write a small file under a "~" name and rename it when complete."""
+        temp_path = path.with_name(f"~{path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _get_known_ids(self) -> set[str]:
+        """Return ids of stored objects, listing the store directory on first use.
+
+        The caller must hold the lock.
+        """
+        if self._known_ids is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            known_ids: set[str] = set()
+            delta_ids: set[str] = set()
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("~") or name.endswith(self.SIGNATURE_EXTENSION) or not entry.is_file():
+                        continue
+                    if name.endswith(self.DELTA_EXTENSION):
+                        name = name[:-len(self.DELTA_EXTENSION)]
+                        delta_ids.add(name)
+                    known_ids.add(name)
+
+            self._known_ids = known_ids
+            self._delta_ids = delta_ids
+        return self._known_ids
+
+
+class _TrackingWriter:
+    """Write-only view of a file that reports the written bytes to a progress callback and a digest."""
+
+    def __init__(self, file: BinaryIO, progress: Callable[[int], None] | None, digest: Digest | None) -> None:
+        self._file = file
+        self._progress = progress
+        self._digest = digest
+
+    def write(self, data: bytes) -> int:
+        if self._digest is not None:
+            self._digest.update(data)
+        if self._progress is not None:
+            self._progress(len(data))
+        return self._file.write(data)
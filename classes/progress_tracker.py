@@ -0,0 +1,127 @@
+import time
+import threading
+
+from typing import Callable
+
+
+class ProgressTracker:
+    """Byte-based progress with throughput and ETA for long operations.
+
+    Workers report processed bytes with advance(); the tracker converts
+    them into a percentage of the pre-scanned total and passes a status
+    text to the emit callback (usually a Qt signal). Updates are emitted at
+    most max_updates_per_second times, so thousands of small files do not
+    flood the GUI event loop with cross-thread signals. An optional
+    checkpoint callback is called on every advance(), which lets workers
+    be paused or cancelled between chunks. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[str, int], None],
+        text: str,
+        total_bytes: int,
+        start_value: int = 0,
+        max_updates_per_second: float = 10.0,
+        end_value: int = 100,
+        checkpoint: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            emit: Callback receiving (status text, value 0-100).
+            text: Description of the operation shown before the figures.
+            total_bytes: Total number of bytes to process.
+            start_value: Progress value that corresponds to zero bytes.
+            max_updates_per_second: Maximum rate of emit calls.
+            end_value: Progress value that corresponds to all bytes processed
+                (less than 100 when the operation has further stages).
+            checkpoint: Callback called on every advance(), e.g. CancelToken.check.
+        """
+        self._emit = emit
+        self.text = text
+        self.total_bytes = max(0, total_bytes)
+        self.start_value = start_value
+        self.end_value = end_value
+        self._checkpoint = checkpoint
+        self._min_interval = 1.0 / max_updates_per_second if max_updates_per_second > 0 else 0.0
+
+        self._lock = threading.Lock()
+        self._done_bytes = 0
+        self._started_at = time.monotonic()
+        self._emitted_at = 0.0
+
+    @property
+    def done_bytes(self) -> int:
+        """Number of bytes processed so far."""
+        return self._done_bytes
+
+    def start(self) -> None:
+        """Emit the initial state and restart the throughput clock."""
+        with self._lock:
+            self._started_at = time.monotonic()
+        self._emit_state(force=True)
+
+    def advance(self, nbytes: int) -> None:
+        """Account processed bytes and emit an update if enough time passed.
+
+        Args:
+            nbytes: Number of bytes processed since the previous call.
+        """
+        if self._checkpoint is not None:
+            self._checkpoint()
+
+        with self._lock:
+            self._done_bytes += nbytes
+        self._emit_state(force=False)
+
+    def finish(self) -> None:
+        """Emit the final state regardless of the rate limit."""
+        self._emit_state(force=True)
+
+    # === Internal helpers ===
+
+    def _emit_state(self, force: bool) -> None:
+        """Emit the current state unless rate-limited."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._emitted_at < self._min_interval:
+                return
+            self._emitted_at = now
+
+            done_bytes = min(self._done_bytes, self.total_bytes) if self.total_bytes else self._done_bytes
+            elapsed = max(now - self._started_at, 1e-6)
+
+        if self.total_bytes:
+            fraction = done_bytes / self.total_bytes
+        else:
+            fraction = 1.0 if force else 0.0
+
+        value = self.start_value + int((self.end_value - self.start_value) * fraction)
+        # 100% is reported by the operation itself once it is really finished
+        value = min(value, 99)
+
+        speed = done_bytes / elapsed
+        remaining = self.total_bytes - done_bytes
+        eta = self._format_eta(remaining / speed) if speed > 0 and remaining > 0 else "00:00"
+
+        self._emit(
+            f"{self.text} {self._format_mb(done_bytes)} из {self._format_mb(self.total_bytes)} МБ, "
+            f"{self._format_mb(int(speed))} МБ/с, осталось {eta}",
+            value,
+        )
+
+    @staticmethod
+    def _format_mb(nbytes: int) -> str:
+        """Format a byte count in megabytes."""
+        return f"{nbytes / (1024 * 1024):.1f}"
+
+    @staticmethod
+    def _format_eta(seconds: float) -> str:
+        """Format remaining time as [H:]MM:SS."""
+        seconds = int(seconds)
+        hours, rest = divmod(seconds, 3600)
+        minutes, seconds = divmod(rest, 60)
+        if hours:
+            return f"{hours}:{minutes:02d}:{seconds:02d}"
+        return f"{minutes:02d}:{seconds:02d}"
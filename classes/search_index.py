@@ -0,0 +1,264 @@
+import threading
+
+
+class SearchIndex:
+    """In-memory index of groups and versions used by search.
+
+    The index is built once from the catalog and then updated per group,
+    so search queries never touch the network share. Names are normalized
+    (lower case, stripped) when they are added, not on every query.
+
+    Substring queries are resolved with a trigram inverted index: every
+    distinct normalized name (term) is split into trigrams, and a query
+    only checks the terms found in the intersection of the posting lists
+    of its own trigrams. Queries shorter than a trigram scan the terms.
+    Equal names (e.g. the same version name in many groups) share one term.
+
+    All methods are thread-safe: the index is queried from a worker thread
+    while the GUI thread may update it after an operation.
+    """
+
+    NGRAM_SIZE = 3
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._lock = threading.Lock()
+        self.is_built: bool = False  # Flag: the index has been filled at least once
+        self._reset()
+
+    def build(self, groups_versions: dict[str, list[str]], actual_versions: dict[str, str | None]) -> None:
+        """Replace the index content.
+
+        Args:
+            groups_versions: Mapping group name -> versions, newest first.
+            actual_versions: Mapping group name -> actual version.
+        """
+        with self._lock:
+            self._reset()
+            for group_name, versions in groups_versions.items():
+                self._add_group(group_name, versions, actual_versions.get(group_name))
+            self.is_built = True
+
+    def update_group(self, group_name: str, versions: list[str], actual_version: str | None) -> None:
+        """Add or replace one group in the index.
+
+        Args:
+            group_name: Name of the group.
+            versions: Versions of the group, newest first.
+            actual_version: Actual version of the group.
+        """
+        with self._lock:
+            self._remove_group(group_name)
+            self._add_group(group_name, versions, actual_version)
+
+    def remove_group(self, group_name: str) -> None:
+        """Remove a group from the index."""
+        with self._lock:
+            self._remove_group(group_name)
+
+    def clear(self) -> None:
+        """Drop the index content; it has to be built again before use."""
+        with self._lock:
+            self._reset()
+            self.is_built = False
+
+    def search(self, text: str) -> list[list[str | None]]:
+        """Search groups and their actual versions.
+
+        Args:
+            text: Search query string.
+
+        Returns:
+            List of [group_name, actual_version] rows sorted by group name.
+        """
+        if not text:
+            return []
+
+        with self._lock:
+            matched_groups: set[str] = set()
+            for term_id in self._match_terms(self.normalize(text)):
+                matched_groups.update(self._term_groups[term_id])
+                # A version name matches only for groups where it is the actual version
+                matched_groups.update(self._term_actual_groups[term_id])
+
+            return [
+                [group_name, self._group_actual[group_name]]
+                for group_name in sorted(matched_groups)
+            ]
+
+    def search_all(self, text: str) -> list[list[str | None]]:
+        """Search across all versions of all groups.
+
+        Args:
+            text: Search query string.
+
+        Returns:
+            List of [group_name, version_name] rows. If a group has no
+            versions, version_name is None.
+        """
+        if not text:
+            return []
+
+        with self._lock:
+            matched_groups: set[str] = set()
+            matched_rows: set[int] = set()
+            for term_id in self._match_terms(self.normalize(text)):
+                matched_groups.update(self._term_groups[term_id])
+                matched_rows.update(self._term_rows[term_id])
+
+            # Rows are emitted group by group in catalog order; each row is
+            # visited once, so no membership check on the result is needed
+            involved_groups = set(matched_groups)
+            involved_groups.update(self._rows[row_id][0] for row_id in matched_rows)
+
+            result: list[list[str | None]] = []
+            for group_name in sorted(involved_groups):
+                group_rows = self._group_rows[group_name]
+
+                if group_name in matched_groups:
+                    # A matching group name brings all versions of the group
+                    if group_rows:
+                        result.extend([group_name, self._rows[row_id][2]] for row_id in group_rows)
+                    else:
+                        result.append([group_name, None])
+                else:
+                    result.extend(
+                        [group_name, self._rows[row_id][2]]
+                        for row_id in group_rows
+                        if row_id in matched_rows
+                    )
+
+            return result
+
+    @staticmethod
+    def normalize(text: str | None) -> str:
+        """Return the normalized form of a name used for matching."""
+        return text.lower().strip() if text else ""
+
+    @classmethod
+    def ngrams(cls, text: str) -> set[str]:
+        """Return the set of n-grams of a normalized text."""
+        size = cls.NGRAM_SIZE
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    # === Internal helpers (the caller must hold the lock) ===
+
+    def _reset(self) -> None:
+        """Initialize empty index structures."""
+        # Terms: distinct normalized names
+        self._term_ids: dict[str, int] = {}  # normalized name -> term id
+        self._term_texts: dict[int, str] = {}  # term id -> normalized name
+        self._postings: dict[str, set[int]] = {}  # n-gram -> term ids
+        self._term_groups: dict[int, set[str]] = {}  # term id -> groups with this name
+        self._term_rows: dict[int, set[int]] = {}  # term id -> version rows with this name
+        self._term_actual_groups: dict[int, set[str]] = {}  # term id -> groups with this actual version
+        self._next_term_id = 0
+
+        # Rows: one per version of a group
+        self._rows: dict[int, tuple[str, int, str]] = {}  # row id -> (group, position, version)
+        self._group_rows: dict[str, list[int]] = {}  # group -> row ids, newest first
+        self._group_actual: dict[str, str | None] = {}  # group -> actual version
+        self._next_row_id = 0
+
+    def _match_terms(self, search_text: str) -> list[int]:
+        """Return ids of terms that contain the normalized query."""
+        if len(search_text) < self.NGRAM_SIZE:
+            return [
+                term_id for term_id, term_text in self._term_texts.items()
+                if search_text in term_text
+            ]
+
+        # Intersect posting lists starting from the shortest one
+        postings = []
+        for ngram in self.ngrams(search_text):
+            term_ids = self._postings.get(ngram)
+            if not term_ids:
+                return []
+            postings.append(term_ids)
+        postings.sort(key=len)
+
+        candidates = set(postings[0])
+        for term_ids in postings[1:]:
+            candidates &= term_ids
+            if not candidates:
+                return []
+
+        # N-grams may match out of order, so candidates are verified
+        return [
+            term_id for term_id in candidates
+            if search_text in self._term_texts[term_id]
+        ]
+
+    def _add_group(self, group_name: str, versions: list[str], actual_version: str | None) -> None:
+        """Add one group with its versions."""
+        self._term_groups.setdefault(self._acquire_term(group_name), set()).add(group_name)
+
+        row_ids: list[int] = []
+        for position, version_name in enumerate(versions):
+            row_id = self._next_row_id
+            self._next_row_id += 1
+
+            self._rows[row_id] = (group_name, position, version_name)
+            self._term_rows.setdefault(self._acquire_term(version_name), set()).add(row_id)
+            row_ids.append(row_id)
+
+        self._group_rows[group_name] = row_ids
+        self._group_actual[group_name] = actual_version
+        if actual_version is not None:
+            self._term_actual_groups.setdefault(self._acquire_term(actual_version), set()).add(group_name)
+
+    def _remove_group(self, group_name: str) -> None:
+        """Remove one group with its versions, if present."""
+        if group_name not in self._group_rows:
+            return
+
+        group_term_id = self._term_ids[self.normalize(group_name)]
+        self._term_groups[group_term_id].discard(group_name)
+        self._release_term(group_term_id)
+
+        for row_id in self._group_rows.pop(group_name):
+            _, _, version_name = self._rows.pop(row_id)
+            term_id = self._term_ids[self.normalize(version_name)]
+            self._term_rows[term_id].discard(row_id)
+            self._release_term(term_id)
+
+        actual_version = self._group_actual.pop(group_name)
+        if actual_version is not None:
+            term_id = self._term_ids[self.normalize(actual_version)]
+            self._term_actual_groups[term_id].discard(group_name)
+            self._release_term(term_id)
+
+    def _acquire_term(self, name: str) -> int:
+        """Return the term id of a name, adding the term to the n-gram index."""
+        term_text = self.normalize(name)
+        term_id = self._term_ids.get(term_text)
+        if term_id is not None:
+            return term_id
+
+        term_id = self._next_term_id
+        self._next_term_id += 1
+
+        self._term_ids[term_text] = term_id
+        self._term_texts[term_id] = term_text
+        self._term_groups[term_id] = set()
+        self._term_rows[term_id] = set()
+        self._term_actual_groups[term_id] = set()
+        for ngram in self.ngrams(term_text):
+            self._postings.setdefault(ngram, set()).add(term_id)
+        return term_id
+
+    def _release_term(self, term_id: int) -> None:
+        """Drop a term from the n-gram index once nothing refers to it."""
+        if self._term_groups[term_id] or self._term_rows[term_id] or self._term_actual_groups[term_id]:
+            return
+
+        term_text = self._term_texts.pop(term_id)
+        del self._term_ids[term_text]
+        del self._term_groups[term_id]
+        del self._term_rows[term_id]
+        del self._term_actual_groups[term_id]
+        for ngram in self.ngrams(term_text):
+            term_ids = self._postings[ngram]
+            term_ids.discard(term_id)
+            if not term_ids:
+                del self._postings[ngram]
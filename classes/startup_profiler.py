@@ -0,0 +1,106 @@
+import json
+import time
+import datetime
+
+from pathlib import Path
+
+
+class StartupProfiler:
+    """Monotonic timestamps of the startup phases of the program.
+
+    Sequential phases are closed with mark(): a phase lasts from the end of
+    the previous one. Background phases (the version check, the first read
+    of the share) overlap with them and are added with record(). finish()
+    appends the launch to a JSON-lines log next to the program, keeping the
+    last MAX_LOG_RECORDS launches, so slow starts on a workstation can be
+    read afterwards. A profiler without a log path only collects phases.
+    """
+
+    MAX_LOG_RECORDS = 100
+
+    def __init__(self, started: float | None = None, log_path: str | Path | None = None) -> None:
+        """Initialize the profiler.
+
+        Args:
+            started: time.perf_counter() value of the program start (now if None).
+            log_path: Startup log file written by finish().
+        """
+        self.started = time.perf_counter() if started is None else started
+        self.log_path = Path(log_path) if log_path is not None else None
+
+        self._phases: list[tuple[str, float, float]] = []  # (phase, start, end) perf_counter values
+        self._last_mark = self.started
+        self._finished = False
+
+    @property
+    def phases(self) -> list[dict]:
+        """Recorded phases in milliseconds since the program start."""
+        return [
+            {
+                "phase": phase,
+                "start_ms": round((start - self.started) * 1000, 3),
+                "duration_ms": round((end - start) * 1000, 3),
+            }
+            for phase, start, end in self._phases
+        ]
+
+    @property
+    def is_finished(self) -> bool:
+        """True once finish() was called."""
+        return self._finished
+
+    def mark(self, phase: str, at: float | None = None) -> None:
+        """Close a sequential phase that started at the end of the previous one.
+
+        Args:
+            phase: Phase name.
+            at: time.perf_counter() value of the phase end (now if None).
+        """
+        end = time.perf_counter() if at is None else at
+        self._phases.append((phase, self._last_mark, end))
+        self._last_mark = end
+
+    def record(self, phase: str, started: float, finished: float | None = None) -> None:
+        """Add a background phase overlapping the sequential ones.
+
+        Args:
+            phase: Phase name.
+            started: time.perf_counter() value of the phase start.
+            finished: time.perf_counter() value of the phase end (now if None).
+        """
+        self._phases.append((phase, started, time.perf_counter() if finished is None else finished))
+
+    def duration(self, phase: str) -> float:
+        """Return the total duration of a phase in seconds (0 if it was not recorded)."""
+        return sum(end - start for name, start, end in self._phases if name == phase)
+
+    def elapsed(self) -> float:
+        """Return seconds from the program start to the end of the last sequential phase."""
+        return self._last_mark - self.started
+
+    def finish(self) -> None:
+        """Write the launch to the startup log (once; errors are ignored)."""
+        if self._finished:
+            return
+        self._finished = True
+
+        if self.log_path is None:
+            return
+
+        record = {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "total_ms": round((max((end for _, _, end in self._phases), default=self.started) - self.started) * 1000, 3),
+            "phases": self.phases,
+        }
+        try:
+            lines = self.log_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            lines = []
+        lines.append(json.dumps(record, ensure_ascii=False))
+
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self.log_path.write_text("\n".join(lines[-self.MAX_LOG_RECORDS:]) + "\n", encoding="utf-8")
+        except OSError:
+            # Profiling never stops the program
+            pass
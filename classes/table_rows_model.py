@@ -0,0 +1,70 @@
+import sys
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class TableRowsModel(QAbstractTableModel):
+    """Read-only table model over a compact column store of strings.
+
+    Rows are kept as one list per column with interned strings, so the
+    repeated group and version names of a large search result share their
+    objects. The view asks only for the cells it paints, and replacing the
+    contents is a single model reset instead of per-row inserts, so tens
+    of thousands of rows are shown without freezing the GUI.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+
+        self._headers: list[str] = []
+        self._columns: list[list[str]] = []
+        self._row_count = 0
+
+    def set_rows(self, headers: list[str], rows: list[list[str | None]]) -> None:
+        """Replace the columns and all rows of the table.
+
+        Args:
+            headers: Column header texts.
+            rows: Rows of cell texts (None is shown as an empty cell).
+        """
+        columns: list[list[str]] = [[] for _ in headers]
+        intern = sys.intern
+        for row in rows:
+            for column, value in zip(columns, row):
+                column.append(intern(value) if value else "")
+
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._columns = columns
+        self._row_count = len(rows)
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Remove all columns and rows."""
+        self.set_rows([], [])
+
+    def row_data(self, row: int) -> list[str]:
+        """Return the cell texts of a row (empty list for a row out of range)."""
+        if not 0 <= row < self._row_count:
+            return []
+        return [column[row] for column in self._columns]
+
+    # === QAbstractTableModel interface ===
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._columns[index.column()][index.row()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return section + 1
@@ -0,0 +1,168 @@
+import os
+import hmac
+import json
+import hashlib
+import threading
+
+from pathlib import Path
+
+
+class TransferJournal:
+    """Append-only journal of the files committed by an upload or download.
+
+    An interrupted transfer leaves its journal next to the partial output;
+    the next attempt loads it and skips every file whose record still
+    matches the local file (the source of an upload, the destination of a
+    download) by size and keyed hash, so only the remaining files are
+    transferred again. The hash is normally computed by the caller while
+    the file streams through the cipher (see new_digest); a local file
+    whose size and mtime still match its record is not hashed again.
+
+    Every record is one JSON line, appended and flushed as soon as the file
+    is complete; a line cut off by a crash is ignored on load. Files are
+    identified by a keyed hash of their relative path, so a journal left on
+    the share reveals no file names. Thread-safe.
+    """
+
+    EXTENSION = ".journal"
+    READ_SIZE = 1024 * 1024
+
+    def __init__(self, path: str | Path, hash_key: bytes) -> None:
+        """Open the journal (created on the first record).
+
+        Args:
+            path: Path to the journal file.
+            hash_key: Key of the path and content hashes (up to 64 bytes).
+        """
+        self.path = Path(path)
+        self.hash_key = hash_key
+
+        self._lock = threading.Lock()
+        self._records: dict[str, dict] = {}
+        self._file = None
+
+    @property
+    def records(self) -> list[dict]:
+        """Loaded and added records in the order they were committed."""
+        with self._lock:
+            return list(self._records.values())
+
+    def load(self) -> int:
+        """Read the records of a previous attempt.
+
+        Returns:
+            Number of records read (0 if there is no journal).
+        """
+        records: dict[str, dict] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Last line of an interrupted write
+                        continue
+                    if isinstance(record, dict) and "key" in record:
+                        records[record["key"]] = record
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            self._records = records
+        return len(records)
+
+    def get(self, rel_path: str) -> dict | None:
+        """Return the record of a file, or None if it was not committed."""
+        with self._lock:
+            return self._records.get(self.path_key(rel_path))
+
+    def is_committed(self, rel_path: str, local_path: str | Path) -> bool:
+        """Check that a file was committed and the local file did not change since.
+
+        The file is hashed only if its mtime differs from the record.
+
+        Args:
+            rel_path: Relative path of the file in the transfer.
+            local_path: Local file the record describes.
+        """
+        record = self.get(rel_path)
+        if record is None:
+            return False
+
+        try:
+            stat = os.stat(local_path)
+            if stat.st_size != record["size"]:
+                return False
+            if stat.st_mtime_ns == record.get("mtime_ns"):
+                return True
+            return hmac.compare_digest(self.digest_file(local_path), record["digest"])
+        except OSError:
+            return False
+
+    def record(self, rel_path: str, local_path: str | Path, digest: str | None = None, **fields) -> None:
+        """Commit a transferred file.
+
+        Args:
+            rel_path: Relative path of the file in the transfer.
+            local_path: Local file to describe.
+            digest: Hex digest of the content from new_digest(), computed while
+                the file was transferred. None hashes the local file now.
+            **fields: Additional JSON-serializable values stored with the record.
+        """
+        stat = os.stat(local_path)
+        record = {
+            **fields,
+            "key": self.path_key(rel_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest if digest is not None else self.digest_file(local_path),
+        }
+        line = json.dumps(record) + "\n"
+
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            self._records[record["key"]] = record
+
+    def path_key(self, rel_path: str) -> str:
+        """Return the keyed hash identifying a relative path."""
+        return hmac.new(self.hash_key, rel_path.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def new_digest(self) -> "hashlib.blake2b":
+        """Return an empty keyed BLAKE2b hash of file content, as stored in the records."""
+        return hashlib.blake2b(key=self.hash_key, digest_size=32)
+
+    def digest_file(self, path: str | Path) -> str:
+        """Return the keyed BLAKE2b hash of a file's content."""
+        digest = self.new_digest()
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(self.READ_SIZE)
+                if not data:
+                    break
+                digest.update(data)
+        return digest.hexdigest()
+
+    def close(self) -> None:
+        """Close the journal file, keeping it for the next attempt."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the journal once the transfer is complete or abandoned."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        with self._lock:
+            self._records = {}
+
+    def __enter__(self) -> "TransferJournal":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
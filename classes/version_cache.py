@@ -0,0 +1,159 @@
+import os
+import hmac
+import hashlib
+
+from typing import Callable
+from pathlib import Path
+
+from .cancel_token import OperationCancelled
+from .file_cipher import FileCipher
+from .version_pack import PackReader, PackWriter
+
+
+class VersionCache:
+    """Local on-disk cache of downloaded versions with LRU eviction.
+
+    Every cached version is a single pack file (see VersionPack), encrypted
+    with the archive key, so the cache holds no plain files and can live in
+    the user profile. Entries are named by a keyed hash of the group, the
+    version and a fingerprint of its stored form (e.g. the manifest hash):
+    a version replaced on the share gets a new key, and names reveal
+    nothing about the contents.
+
+    The modification time of an entry is its last use; when the total size
+    exceeds max_bytes, the least recently used entries are deleted.
+    """
+
+    EXTENSION = ".pack"
+
+    def __init__(self, root: str | Path, cipher: FileCipher, max_bytes: int) -> None:
+        """Initialize the cache.
+
+        Args:
+            root: Cache directory (created on first store).
+            cipher: Cipher for the cached packs.
+            max_bytes: Maximum total size of the cache.
+        """
+        self.root = Path(root)
+        self.cipher = cipher
+        self.max_bytes = max_bytes
+
+        self._key_hash_key = cipher.derive_key(b"file-archive/version-cache-v1")
+
+    def make_key(self, group: str, version: str, fingerprint: str) -> str:
+        """Return the cache key of a version.
+
+        Args:
+            group: Group name.
+            version: Version name.
+            fingerprint: Fingerprint of the stored version; changes when the version changes.
+        """
+        data = "\0".join((group, version, fingerprint)).encode("utf-8")
+        return hmac.new(self._key_hash_key, data, hashlib.sha256).hexdigest()
+
+    def has(self, key: str) -> bool:
+        """Return True if the version is cached."""
+        return self._entry_path(key).is_file()
+
+    def cached_length(self, key: str) -> int:
+        """Return the size of the encrypted file streams of a cached version."""
+        with PackReader(self._entry_path(key), self.cipher) as pack:
+            return pack.total_length
+
+    def extract(self, key: str, dst_root: str | Path, progress: Callable[[int], None] | None = None) -> None:
+        """Decrypt a cached version into a folder and mark it as recently used.
+
+        Args:
+            key: Cache key of the version.
+            dst_root: Destination directory of the version.
+            progress: Callback receiving the number of encrypted bytes read.
+
+        Raises:
+            InvalidToken: If the cached pack is damaged (it is deleted then).
+        """
+        path = self._entry_path(key)
+        os.utime(path)
+        try:
+            with PackReader(path, self.cipher) as pack:
+                pack.extract_all(dst_root, progress)
+        except OperationCancelled:
+            raise
+        except Exception:
+            # A damaged entry would fail every time; the next download stores it again
+            path.unlink(missing_ok=True)
+            raise
+
+    def store(self, key: str, src_root: str | Path, progress: Callable[[int], None] | None = None) -> bool:
+        """Store a downloaded version folder in the cache.
+
+        Args:
+            key: Cache key of the version.
+            src_root: Folder with the plain files of the version.
+            progress: Callback receiving the number of source bytes read.
+
+        Returns:
+            True if the version was stored, False if it is larger than the cache.
+        """
+        src_root = Path(src_root)
+        directories: list[str] = []
+        files: list[tuple[str, Path]] = []
+        total_size = 0
+        for root_path, dir_names, file_names in os.walk(src_root):
+            rel = Path(root_path).relative_to(src_root).as_posix()
+            prefix = "" if rel == "." else f"{rel}/"
+            directories.extend(f"{prefix}{name}" for name in dir_names)
+            for name in file_names:
+                files.append((f"{prefix}{name}", Path(root_path) / name))
+                total_size += (Path(root_path) / name).stat().st_size
+
+        if total_size > self.max_bytes:
+            return False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        temp_path = path.with_name(f"~{path.name}.tmp")
+        try:
+            with PackWriter(temp_path, self.cipher) as pack:
+                for rel_path in directories:
+                    pack.add_directory(rel_path)
+                for rel_path, file_path in files:
+                    pack.add_file(rel_path, file_path, progress)
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits into max_bytes.
+
+        Returns:
+            Number of deleted entries.
+        """
+        if not self.root.is_dir():
+            return 0
+
+        entries: list[tuple[float, int, str]] = []  # (last use, size, path)
+        with os.scandir(self.root) as scan:
+            for entry in scan:
+                if entry.is_file() and entry.name.endswith(self.EXTENSION) and not entry.name.startswith("~"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            os.unlink(path)
+            total_size -= size
+            removed += 1
+        return removed
+
+    # === Internal helpers ===
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the path of a cache entry."""
+        return self.root / f"{key}{self.EXTENSION}"
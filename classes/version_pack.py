@@ -0,0 +1,331 @@
+import json
+import struct
+
+from typing import BinaryIO, Callable, Iterator, NamedTuple
+from pathlib import Path
+
+
+from .file_cipher import Digest, FileCipher
+
+
+class PackEntry(NamedTuple):
+    """File stored in a version pack."""
+
+    path: str  # Relative path inside the version, "/"-separated
+    offset: int  # Offset of the encrypted stream in the pack
+    length: int  # Length of the encrypted stream
+    size: int  # Size of the plain file
+
+
+class VersionPack:
+    """Layout of a version stored as a single pack file.
+
+    Instead of a directory tree of .enc files, a whole version is written
+    into one file, so copying, listing and deleting it takes a handful of
+    requests to the share instead of several per file:
+
+        header:  magic "FAPACK" | format version (1 byte) | reserved (1 byte)
+        body:    encrypted streams of the files one after another
+                 (each in the chunked FileCipher format with its own nonce)
+        index:   encrypted JSON table of contents (directories and files
+                 with offsets, lengths and sizes, and keyed content
+                 digests of the files if they were computed on write)
+        trailer: index offset (uint64) | index length (uint64) | magic "FAPEND"
+
+    The table of contents is at the end, so a pack is written in one pass,
+    and any file can be read without touching the others.
+    """
+
+    EXTENSION = ".pack"
+    MAGIC = b"FAPACK"
+    END_MAGIC = b"FAPEND"
+    FORMAT_VERSION = 1
+    BUFFER_SIZE = 1024 * 1024  # Small records are coalesced into large requests to the share
+
+    HEADER_STRUCT = struct.Struct(">6sBB")
+    TRAILER_STRUCT = struct.Struct(">QQ6s")
+
+
+class PackWriter:
+    """Writes a version pack file in one sequential pass.
+
+    Usage:
+        with PackWriter(path, cipher) as pack:
+            pack.add_directory("docs")
+            pack.add_file("docs/readme.txt", src_path)
+
+    The table of contents is written when the block exits without an
+    exception; an interrupted pack has no trailer and is rejected by
+    PackReader. An interrupted pack can be continued by passing the
+    entries known to be complete and the offset they end at.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        cipher: FileCipher,
+        resume_offset: int | None = None,
+        entries: list[PackEntry] | None = None,
+        digests: dict[str, str] | None = None,
+    ) -> None:
+        """Create the pack file and write its header, or reopen an interrupted pack.
+
+        Args:
+            path: Path to the pack file.
+            cipher: Cipher used for the files and the table of contents.
+            resume_offset: End of the complete data of an interrupted pack;
+                everything after it is discarded. None creates a new pack.
+            entries: Complete entries of the interrupted pack.
+            digests: Content digests of the complete entries, by path.
+        """
+        self.path = Path(path)
+        self.cipher = cipher
+
+        self._directories: list[str] = []
+        self._entries: list[PackEntry] = list(entries or [])
+        self._digests: dict[str, str] = dict(digests or {})
+
+        if resume_offset is None:
+            self._file: BinaryIO = open(self.path, "wb", buffering=VersionPack.BUFFER_SIZE)
+            header = VersionPack.HEADER_STRUCT.pack(VersionPack.MAGIC, VersionPack.FORMAT_VERSION, 0)
+            self._file.write(header)
+            self._offset = len(header)
+        else:
+            self._file = open(self.path, "r+b", buffering=VersionPack.BUFFER_SIZE)
+            self._file.truncate(resume_offset)
+            self._file.seek(resume_offset)
+            self._offset = resume_offset
+
+    @property
+    def offset(self) -> int:
+        """End of the data written so far."""
+        return self._offset
+
+    def add_directory(self, rel_path: str) -> None:
+        """Record a directory, so empty directories are restored too.
+
+        Args:
+            rel_path: Relative "/"-separated path of the directory.
+        """
+        self._directories.append(rel_path)
+
+    def add_file(
+        self,
+        rel_path: str,
+        src_path: str | Path,
+        progress: Callable[[int], None] | None = None,
+        compression: str | None = None,
+        digest: Digest | None = None,
+    ) -> PackEntry:
+        """Encrypt a file into the pack.
+
+        Args:
+            rel_path: Relative "/"-separated path of the file inside the version.
+            src_path: Path to the plain source file.
+            progress: Callback receiving the number of source bytes read.
+            compression: Codec from FileCipher.CODECS applied before encryption, or None.
+            digest: Hash updated with the source bytes; its hex digest is
+                stored in the table of contents.
+
+        Returns:
+            Entry of the stored file.
+        """
+        size = 0
+
+        def count(nbytes: int) -> None:
+            nonlocal size
+            size += nbytes
+            if progress is not None:
+                progress(nbytes)
+
+        with open(src_path, "rb") as src:
+            length = self.cipher.encrypt_stream(src, self._file, count, compression, digest)
+
+        entry = PackEntry(rel_path, self._offset, length, size)
+        if digest is not None:
+            self._digests[rel_path] = digest.hexdigest()
+        self._entries.append(entry)
+        self._offset += length
+        return entry
+
+    def flush(self) -> None:
+        """Write buffered data to the file, e.g. before journaling the added entries."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the table of contents and the trailer and close the file."""
+        index = {
+            "directories": self._directories,
+            "files": [list(entry) for entry in self._entries],
+        }
+        if self._digests:
+            # A separate key, so the list format of the entries stays unchanged
+            index["digests"] = self._digests
+        encrypted_index = self.cipher.encrypt_bytes(json.dumps(index, ensure_ascii=False).encode("utf-8"))
+
+        self._file.write(encrypted_index)
+        self._file.write(
+            VersionPack.TRAILER_STRUCT.pack(self._offset, len(encrypted_index), VersionPack.END_MAGIC)
+        )
+        self._file.close()
+
+    def abort(self) -> None:
+        """Close the file without writing the table of contents."""
+        self._file.close()
+
+    def __enter__(self) -> "PackWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+        return False
+
+
+class PackReader:
+    """Reads a version pack file.
+
+    Only the trailer and the table of contents are read on open; file
+    contents are read on demand, each with a single seek. digests maps
+    paths to the content digests stored on write (empty for older packs).
+
+    Raises:
+        InvalidToken: If the file is not a complete pack, the key is wrong
+            or the data is damaged.
+    """
+
+    def __init__(self, path: str | Path, cipher: FileCipher) -> None:
+        """Open the pack and read its table of contents.
+
+        Args:
+            path: Path to the pack file.
+            cipher: Cipher the pack was written with.
+        """
+        self.path = Path(path)
+        self.cipher = cipher
+
+        self._file: BinaryIO = open(self.path, "rb", buffering=VersionPack.BUFFER_SIZE)
+        try:
+            self.directories, self.entries, self.digests = self._read_index()
+        except BaseException:
+            self._file.close()
+            raise
+
+    @property
+    def total_length(self) -> int:
+        """Total size of the encrypted file streams in bytes."""
+        return sum(entry.length for entry in self.entries)
+
+    def extract(
+        self,
+        entry: PackEntry,
+        dst_path: str | Path,
+        progress: Callable[[int], None] | None = None,
+        digest: Digest | None = None,
+    ) -> None:
+        """Decrypt one file of the pack.
+
+        Args:
+            entry: Entry of the file.
+            dst_path: Path to the decrypted destination file.
+            progress: Callback receiving the number of encrypted bytes read.
+            digest: Hash updated with the decrypted bytes.
+        """
+        self._file.seek(entry.offset)
+        with open(dst_path, "wb") as dst:
+            self.cipher.decrypt_stream(_PackSlice(self._file, entry.length), dst, progress, digest)
+
+    def iter_file(self, entry: PackEntry, progress: Callable[[int], None] | None = None) -> Iterator[bytes]:
+        """Yield the decrypted pieces of one file of the pack.
+
+        The pack must not be read otherwise until the iterator is exhausted
+        or closed.
+
+        Args:
+            entry: Entry of the file.
+            progress: Callback receiving the number of encrypted bytes read.
+        """
+        self._file.seek(entry.offset)
+        yield from self.cipher.iter_decrypt(_PackSlice(self._file, entry.length), progress)
+
+    def extract_all(self, dst_root: str | Path, progress: Callable[[int], None] | None = None) -> None:
+        """Decrypt all directories and files of the pack.
+
+        Files are read in the order they are stored, so the pack is read
+        sequentially from start to end.
+
+        Args:
+            dst_root: Destination directory of the version.
+            progress: Callback receiving the number of encrypted bytes read.
+        """
+        dst_root = Path(dst_root)
+        for rel_path in self.directories:
+            (dst_root / rel_path).mkdir(parents=True, exist_ok=True)
+
+        for entry in self.entries:
+            dst_path = dst_root / entry.path
+            dst_path.parent.mkdir(parents=True, exist_ok=True)
+            self.extract(entry, dst_path, progress)
+
+    def close(self) -> None:
+        """Close the pack file."""
+        self._file.close()
+
+    def __enter__(self) -> "PackReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    # === Internal helpers ===
+
+    def _read_index(self) -> tuple[list[str], list[PackEntry], dict[str, str]]:
+        """Validate header and trailer and decrypt the table of contents."""
+        from cryptography.fernet import InvalidToken
+
+        header = self._file.read(VersionPack.HEADER_STRUCT.size)
+        if len(header) != VersionPack.HEADER_STRUCT.size:
+            raise InvalidToken
+        magic, format_version, _ = VersionPack.HEADER_STRUCT.unpack(header)
+        if magic != VersionPack.MAGIC or format_version != VersionPack.FORMAT_VERSION:
+            raise InvalidToken
+
+        file_size = self._file.seek(0, 2)
+        if file_size < VersionPack.HEADER_STRUCT.size + VersionPack.TRAILER_STRUCT.size:
+            raise InvalidToken
+
+        self._file.seek(file_size - VersionPack.TRAILER_STRUCT.size)
+        index_offset, index_length, end_magic = VersionPack.TRAILER_STRUCT.unpack(
+            self._file.read(VersionPack.TRAILER_STRUCT.size)
+        )
+        index_end = index_offset + index_length + VersionPack.TRAILER_STRUCT.size
+        if end_magic != VersionPack.END_MAGIC or index_end != file_size:
+            # Interrupted write or damaged file
+            raise InvalidToken
+
+        self._file.seek(index_offset)
+        try:
+            index = json.loads(self.cipher.decrypt_bytes(self._file.read(index_length)).decode("utf-8"))
+        except ValueError:
+            raise InvalidToken from None
+
+        entries = [PackEntry(*item) for item in index["files"]]
+        return index["directories"], entries, index.get("digests", {})
+
+
+class _PackSlice:
+    """Read-only view of a byte range of the pack file (from its current position)."""
+
+    def __init__(self, file: BinaryIO, length: int) -> None:
+        self._file = file
+        self._remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
@@ -1,8 +1,11 @@
 import re
 import sys
+import time
 
 from PyQt5.QtWidgets import QFileDialog
-from PyQt5.QtCore import QObject, QEvent
+from PyQt5.QtCore import QObject, QEvent, QTimer
+
+from classes import Job
 
 
 class Controller(QObject):
@@ -27,18 +30,46 @@ class Controller(QObject):
         # Selected item state
         self._selected_group: str | None = None
         self._selected_file: str | None = None
-
-        # Checking the current version of the program at startup
-        self.__check_program_version()
+        self._selected_path: str | None = None  # File inside the opened version
+
+        # Background jobs: downloads run next to other jobs,
+        # other operations lock their page while queued or running
+        self.DOWNLOAD_OPERATIONS: tuple[str, ...] = ("download", "extract_files", "sync_version")
+        self.OPERATION_PAGES: dict[str, str] = {
+            "create_group": "add",
+            "add_version": "add",
+            "add_instruction": "add",
+            "delete_file": "delete",
+            "delete_group": "delete",
+        }
+        # What the queued delete operations remove: [group] or [group, version]
+        # (one target per operation, its page is locked while it is queued)
+        self._delete_targets: dict[str, list[str]] = {}
+
+        # Search state: queries are debounced and run in the background
+        # (on the "table" channel of the catalog scanner, so they supersede each other)
+        self.SEARCH_DEBOUNCE_MS: int = 250
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.run_search)
 
         # Flag to prevent recursive version updates
         self._is_updating_versions = False
+        # Original names (with .enc, .pack or .manifest) of the versions in the delete combobox
+        self._delete_page_versions: list[str] = []
 
-        # Initial interface configuration
-        self.update_layer_one_table_data()  # Uploading data to the group table
-        # Uploading groups to comboboxes
-        self.view.set_groups_comboboxes_data(self.model.get_groups_names())
-        self.update_version_combobox_data()  # Uploading versions to comboboxes
+        self.model.profiler.mark("controller_state")
+
+        # Initial interface configuration: the program version is checked and the share is read
+        # in the background, the window is shown with the table in the loading state.
+        # The Add and Delete pages are built when their tabs are opened first.
+        # Both background reads are startup phases, the startup log is written when they finish.
+        self.model.scan_finished.connect(self.on_scan_finished)
+        self._startup_scans: dict[str, float] = dict.fromkeys(("program_version", "table"), time.perf_counter())
+        self.model.scan_in_thread("program_version", "check_program_version")
+        self.load_catalog_data()
+        self.model.profiler.mark("startup_requests")
 
         # Setting the event filter for the search field
         self.view.ui.search_lineEdit.installEventFilter(self)
@@ -47,30 +78,16 @@ class Controller(QObject):
         # Buttons
         self.view.tab_button_clicked(self.on_tab_button_clicked)
         self.view.download_page_choose_push_button_clicked(self.on_download_page_choose_folder_path_button_clicked)
-        self.view.add_page_choose_folder_path_push_buttons_clicked(self.on_add_page_choose_folder_path_button_clicked)
-        self.view.add_page_choose_file_path_push_buttons_clicked(self.on_add_page_choose_file_path_button_clicked)
-        self.view.add_page_create_push_buttons_clicked(self.on_add_page_create_push_button_clicked)
-        self.view.add_page_add_push_buttons_clicked(self.on_add_page_add_push_button_clicked)
-        self.view.delete_page_delete_push_buttons_clicked(self.on_delete_page_delete_push_button_clicked)
         self.view.download_page_back_push_button_clicked(self.on_download_page_back_push_button_clicked)
         self.view.download_page_download_push_buttons_clicked(self.on_download_page_download_push_button_clicked)
         self.view.download_page_open_push_button_clicked(self.on_download_page_open_push_button_clicked)
-
-        # Radio-Buttons
-        self.view.add_page_radio_buttons_state_changed(self.on_add_options_button_clicked)
-        self.view.delete_page_radio_buttons_state_changed(self.on_delete_options_button_clicked)
+        self.view.pause_job_push_button_clicked(self.on_pause_job_push_button_clicked)
+        self.view.cancel_job_push_button_clicked(self.on_cancel_job_push_button_clicked)
 
         # Input Fields
-        self.view.add_page_new_group_name_lineedit_text_changed(self.on_add_page_new_group_name_lineedit_text_changed)
-        self.view.add_page_paths_lineedits_text_changed(self.on_add_page_paths_lineedits_text_changed)
         self.view.download_page_search_lineedit_text_changed(self.on_download_page_search_lineedit_text_changed)
 
-        # Comboboxes
-        self.view.add_page_group_name_combobox_item_changed(self.on_add_page_group_name_combobox_item_changed)
-        self.view.delete_page_group_comboboxes_state_changed(self.on_delete_page_group_comboboxes_state_changed)
-
         # Checkboxes
-        self.view.delete_page_checkboxes_state_changed(self.on_delete_page_checkboxes_state_changed)
         self.view.download_page_search_all_versions_checkbox_state_changed(
             self.on_download_page_search_all_versions_checkbox_state_changed
         )
@@ -78,51 +95,121 @@ class Controller(QObject):
         # Table
         self.view.download_page_table_row_clicked(self.on_download_page_table_row_clicked)
         self.view.download_page_table_row_double_clicked(self.on_download_page_table_row_double_clicked)
+        self.view.queue_table_selection_changed(self.update_job_buttons_state)
 
         # Model Signals
         self.model.progress_chehged.connect(self.on_progress_bar_changed)
         self.model.show_notification.connect(self.on_show_notification)
         self.model.operation_finished.connect(self.on_operation_finished)
+        self.model.jobs_changed.connect(self.on_jobs_changed)
+
+        self.model.profiler.mark("connect_handlers")
 
     # === Main functions ===
 
+    def load_catalog_data(self) -> None:
+        """Requests all data read from the share: the group table and the comboboxes.
+
+        The catalog is brought up to date first; the queries run one after
+        another on the scanning worker.
+        """
+        self.model.scan_in_thread("catalog", "refresh_catalog")
+        self.model.scan_in_thread("group_names", "get_groups_names")
+        self.update_layer_one_table_data()
+
+    def request_table_data(self, query: str, *args) -> None:
+        """Puts the table in the loading state and requests its data in the background.
+
+        Args:
+            query: Catalog query of the model (see Model.SCAN_QUERIES).
+            *args: Arguments of the query.
+        """
+        self.view.set_table_loading(True)
+        self.model.scan_in_thread("table", query, *args)
+
     def update_layer_one_table_data(self, data: list = None) -> None:
         """Updates the data in the group table on the first tab.
 
         Args:
-            data: Ready-made data for the table. If not transmitted, the data
-                They are formed based on the list of groups and their current versions.
+            data: Ready-made data for the table. If not transmitted, the groups
+                and their current versions are requested from the catalog.
         """
         if data is None:
-            groups_names = self.model.get_groups_names()  # Getting a list of all the groups
-
-            layer_one_data = []
-            for group_name in groups_names:
-                versions = self.model.get_group_versions(group_name)  # All versions of the group
-                actual_version = self.model.get_actual_version(versions)  # Current version
-                layer_one_data.append([group_name, actual_version])  # Row for the table
-
-            # Filling in the group table
-            self.view.set_layer_one_table_data(layer_one_data)
+            # Groups with their current versions (read from the catalog in one pass)
+            self.request_table_data("get_groups_actual_versions")
         else:
             self.view.set_layer_one_table_data(data)
 
     def update_version_combobox_data(self) -> None:
-        """Updates the list of versions in the combo box on the deletions tab."""
-        if self._is_updating_versions:
+        """Requests the list of versions in the combo box on the deletions tab.
+
+        The combo box stays empty (and the delete button disabled) until the
+        versions of the selected group are read.
+        """
+        # The versions are requested again when the Delete page is built
+        if self._is_updating_versions or not self.view.is_page_loaded("delete"):
             return
 
+        self.set_delete_page_versions([])
+        group_name = self.view.get_delete_page_version_combobox_current_text()
+        if group_name:
+            self.model.scan_in_thread("delete_versions", "get_group_versions", group_name)
+
+    def set_delete_page_versions(self, versions: list[str]) -> None:
+        """Fills the combo box of versions on the deletions tab.
+
+        Args:
+            versions: Original version names of the selected group.
+        """
         self._is_updating_versions = True
         try:
-            group_name = self.view.get_delete_page_version_combobox_current_text()
-            if group_name:
-                versions = self.model.get_group_versions(group_name)
-                # Убираем расширение .enc для отображения в combobox
-                display_versions = [re.sub(r'\.enc$', '', v) for v in versions]
-                self.view.set_version_combobox_data(display_versions)
+            self._delete_page_versions = versions
+            # Убираем расширения .enc, .pack и .manifest для отображения в combobox
+            display_versions = [re.sub(r'\.(enc|pack|manifest)$', '', v) for v in versions]
+            self.view.set_version_combobox_data(display_versions)
         finally:
             self._is_updating_versions = False
 
+    def on_scan_finished(self, channel: str, query: str, generation: int, result: object) -> None:
+        """Handles the result of a background catalog query.
+
+        Args:
+            channel: Consumer of the result ("table", "group_names", "delete_versions",
+                "catalog" or "program_version").
+            query: Name of the query.
+            generation: Generation of the query within its channel.
+            result: Query result (None if the query failed).
+        """
+        # A newer query for the same channel was requested after this one
+        if not self.model.is_scan_current(channel, generation):
+            return
+
+        if channel in self._startup_scans:
+            self.model.profiler.record(query, self._startup_scans.pop(channel))
+            if not self._startup_scans:
+                self.model.profiler.finish()
+
+        if channel == "program_version":
+            self.__handle_program_version(result)
+
+        elif channel == "table":
+            if query == "get_group_versions":
+                self.view.set_layer_two_table_data(result or [])
+            elif query == "list_version_contents":
+                self.view.set_layer_three_table_data(result or [])
+            else:
+                # Groups with current versions or search results
+                self.view.set_layer_one_table_data(result or [])
+            self.view.set_table_loading(False)
+
+        elif channel == "group_names":
+            self.view.set_groups_comboboxes_data(result or [])
+            self.update_version_combobox_data()
+
+        elif channel == "delete_versions":
+            self.set_delete_page_versions(result or [])
+            self.update_delete_push_buttons_state()
+
     # === Icons and Events filter ===
 
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
@@ -151,8 +238,53 @@ class Controller(QObject):
         Args:
             button: The tab button that the user clicked on.
         """
+        page = self.view.get_tab_page_name(button)
+        if self.view.load_page(page):
+            self.on_page_loaded(page)
+
         self.view.set_tab_page(button)
 
+    def on_page_loaded(self, page: str) -> None:
+        """Connects the handlers of a page built on first use and fills it with data.
+
+        Args:
+            page: Internal page name ('add' or 'delete').
+        """
+        if page == "add":
+            # Buttons
+            self.view.add_page_choose_folder_path_push_buttons_clicked(self.on_add_page_choose_folder_path_button_clicked)
+            self.view.add_page_choose_file_path_push_buttons_clicked(self.on_add_page_choose_file_path_button_clicked)
+            self.view.add_page_create_push_buttons_clicked(self.on_add_page_create_push_button_clicked)
+            self.view.add_page_add_push_buttons_clicked(self.on_add_page_add_push_button_clicked)
+
+            # Radio-Buttons
+            self.view.add_page_radio_buttons_state_changed(self.on_add_options_button_clicked)
+
+            # Input Fields
+            self.view.add_page_new_group_name_lineedit_text_changed(self.on_add_page_new_group_name_lineedit_text_changed)
+            self.view.add_page_paths_lineedits_text_changed(self.on_add_page_paths_lineedits_text_changed)
+
+            # Comboboxes
+            self.view.add_page_group_name_combobox_item_changed(self.on_add_page_group_name_combobox_item_changed)
+
+            self.update_add_push_buttons_state()
+
+        elif page == "delete":
+            # Buttons
+            self.view.delete_page_delete_push_buttons_clicked(self.on_delete_page_delete_push_button_clicked)
+
+            # Radio-Buttons
+            self.view.delete_page_radio_buttons_state_changed(self.on_delete_options_button_clicked)
+
+            # Comboboxes
+            self.view.delete_page_group_comboboxes_state_changed(self.on_delete_page_group_comboboxes_state_changed)
+
+            # Checkboxes
+            self.view.delete_page_checkboxes_state_changed(self.on_delete_page_checkboxes_state_changed)
+
+            self.update_version_combobox_data()
+            self.update_delete_push_buttons_state()
+
     # === Download tab ===
 
     def update_back_push_button_state(self, state: bool = None) -> None:
@@ -169,7 +301,11 @@ class Controller(QObject):
 
     def update_download_button_state(self) -> None:
         """Updates the status of the "Download" button on the "Download" tab."""
-        can_download = self._selected_group is not None and self._selected_file is not None
+        if self.model.opened_version is not None:
+            # Inside a version only a selected file can be downloaded
+            can_download = self._selected_path is not None
+        else:
+            can_download = self._selected_group is not None and self._selected_file is not None
         self.view.set_download_button_state(state=can_download)
 
     def update_open_button_state(self) -> None:
@@ -180,17 +316,25 @@ class Controller(QObject):
         self.view.set_open_button_state(state=can_open)
 
     def on_download_page_search_lineedit_text_changed(self) -> None:
-        """Handles changing the text in the search bar on the Download tab."""
+        """Handles changing the text in the search bar on the Download tab.
+
+        The search is started only after typing pauses for SEARCH_DEBOUNCE_MS.
+        """
+        self._search_timer.start()
+
+    def run_search(self) -> None:
+        """Starts a background search for the current text in the search bar.
+
+        The search supersedes any earlier request for the table, so the
+        results of an outdated query are never shown.
+        """
+        self._search_timer.stop()
+
         search_text = self.view.get_search_lineedit_text()
         if search_text:
-            if not self.model.search_all_versions:
-                # Regular search by groups and current versions
-                search_results = self.model.search(text=search_text)
-                self.update_layer_one_table_data(data=search_results)
-            else:
-                # Search through all files of all versions
-                search_results = self.model.search_all(text=search_text)
-                self.update_layer_one_table_data(data=search_results)
+            # Regular search by groups and current versions or through all versions
+            query = "search_all" if self.model.search_all_versions else "search"
+            self.model.scan_in_thread("table", query, search_text)
         else:
             # If the search bar is empty, we show all the groups
             self.update_layer_one_table_data()
@@ -203,8 +347,8 @@ class Controller(QObject):
         """
         self.model.search_all_versions = state
 
-        # We simulate changing the text in the search bar to update the table
-        self.on_download_page_search_lineedit_text_changed()
+        # Re-run the search for the current text without waiting for the debounce
+        self.run_search()
 
     def on_download_page_choose_folder_path_button_clicked(self) -> None:
         """Processes the selection of a folder to save files on the "Download" tab."""
@@ -218,6 +362,13 @@ class Controller(QObject):
             row: The index of the selected row in the table.
         """
         row_data = self.view.get_table_row_data(row=row)
+        if self.model.opened_version is not None:
+            # Inside a version, row_data is [file path, size]
+            self._selected_path = row_data[0] if row_data[0] else None
+            self.view.set_choosen_file_label_text(version=self.model.opened_version, file_path=self._selected_path)
+            self.update_download_button_state()
+            return
+
         if self.model.in_group:
             # Inside a group, row_data is [file]
             self._selected_file = row_data[0] if row_data[0] else None
@@ -233,17 +384,32 @@ class Controller(QObject):
     def on_download_page_table_row_double_clicked(self, row: int) -> None:
         """Handles a double click on a row of the table on the "Download" tab.
 
-        Double-clicking on a group opens a list of versions of that group.
+        Double-clicking on a group opens a list of versions of that group,
+        double-clicking on a version opens a list of its files.
         Args:
             row: The index of the selected row in the table.
         """
-        if not self.model.in_group:
+        if self.model.in_group and self.model.opened_version is None:
+            version = self.view.get_table_row_data(row=row)[0]
+            if not version or version.endswith((".pdf", ".doc", ".docx")):
+                return
+
+            # Only the table of contents (or the folder listing) is read
+            self.request_table_data("list_version_contents", self._selected_group, version)
+
+            self.model.opened_version = version
+            self._selected_file = None
+            self._selected_path = None
+            self.view.set_choosen_file_label_text(version=version, file_path=None)
+            self.update_download_button_state()
+            self.update_open_button_state()
+
+        elif not self.model.in_group:
             row_data = self.view.get_table_row_data(row=row)
             self._selected_group = row_data[0]
 
-            # Get the versions of the group and set the data in the table
-            layer_two_data = self.model.get_group_versions(group_name=row_data[0])
-            self.view.set_layer_two_table_data(layer_two_data)
+            # Request the versions of the group for the table
+            self.request_table_data("get_group_versions", row_data[0])
 
             # Setting the flag for being inside the group
             self.model.in_group = True
@@ -253,6 +419,18 @@ class Controller(QObject):
 
     def on_download_page_back_push_button_clicked(self) -> None:
         """Handles clicking on the "Back" button on the "Download" tab."""
+        if self.model.opened_version is not None:
+            # Going back from the files of a version to the list of versions,
+            # the version stays selected
+            self._selected_file = self.model.opened_version
+            self._selected_path = None
+            self.model.opened_version = None
+            self.request_table_data("get_group_versions", self._selected_group)
+            self.view.set_choosen_label_text(data=[self._selected_file], in_group_flag=True)
+            self.update_download_button_state()
+            self.update_open_button_state()
+            return
+
         # Going back to the list of groups
         self.model.in_group = False
         self.update_layer_one_table_data()
@@ -268,15 +446,60 @@ class Controller(QObject):
 
         Initiates the download based on the currently selected item.
         """
-        if not self._selected_group or not self._selected_file:
+        if not self._selected_group or not (self._selected_file or self._selected_path):
             return
 
         save_path = self.view.get_download_save_path()
 
-        # Disabling the page for the download time
-        self.view.update_page_enabled_state(page="download", state=False)
+        if self.model.opened_version is None:
+            # A version downloaded earlier is updated in place: only changed files are written;
+            # an interrupted download is simply started again and resumes where it stopped
+            download_path = self.model.get_version_download_path(self._selected_group, self._selected_file, save_path)
+            if (
+                download_path is not None
+                and download_path.exists()
+                and not self.model.is_download_interrupted(download_path)
+            ):
+                action = self.on_show_action_notification(
+                    msg_type="warning",
+                    title="Папка уже существует",
+                    text=(
+                        f"Папка {download_path} уже существует.\n"
+                        "Обновить её до выбранной версии?\n"
+                        "Будут скачаны только изменённые файлы."
+                    ),
+                    buttons_texts=["Обновить", "Отмена"],
+                )
+                if action != 1:
+                    return
+
+                remove_stale = self.on_show_action_notification(
+                    msg_type="warning",
+                    title="Лишние файлы",
+                    text="Удалить из папки файлы, которых нет в выбранной версии?",
+                    buttons_texts=["Удалить", "Оставить"],
+                )
+
+                self.model.sync_version_in_thread(
+                    group=self._selected_group,
+                    version=self._selected_file,
+                    save_path=save_path,
+                    remove_stale=remove_stale == 1,
+                )
+                return
+
+        # Downloads are queued as jobs, the page stays available for further downloads
+        if self.model.opened_version is not None:
+            # Only the selected file of the opened version is downloaded
+            self.model.extract_files_in_thread(
+                group=self._selected_group,
+                version=self.model.opened_version,
+                paths=[self._selected_path],
+                save_path=save_path,
+            )
+            return
 
-        # Start the download in a separate stream
+        # Queue the download as a background job
         self.model.download_in_thread(group=self._selected_group, file=self._selected_file, save_path=save_path)
 
     def on_download_page_open_push_button_clicked(self) -> None:
@@ -422,7 +645,7 @@ class Controller(QObject):
             combobox: Комбобокс, значение которого изменилось.
         """
         # We update the list of versions only when changing the combo box of the group
-        if combobox is self.view.ui.choose_group_to_delete_comboBox:
+        if combobox is self.view.delete_ui.choose_group_to_delete_comboBox:
             self.update_version_combobox_data()
 
         self.update_delete_push_buttons_state()
@@ -444,22 +667,21 @@ class Controller(QObject):
 
         if button_type == "file":
             group_name_to_delete_from = self.view.get_delete_page_combobox_text(
-                combobox=self.view.ui.choose_group_to_delete_comboBox
+                combobox=self.view.delete_ui.choose_group_to_delete_comboBox
             )
             
             # We get the index of the selected file from the combobox
-            selected_file_index = self.view.ui.choose_file_to_delete_comboBox.currentIndex()
+            selected_file_index = self.view.delete_ui.choose_file_to_delete_comboBox.currentIndex()
 
             if group_name_to_delete_from and selected_file_index != -1:
-                # We get the original list of files (with .enc)
-                original_versions = self.model.get_group_versions(group_name_to_delete_from)
-                # We find the real file name by the index
-                file_to_delete = original_versions[selected_file_index]
+                # We find the real file name (with .enc) by the index in the list read for the combobox
+                file_to_delete = self._delete_page_versions[selected_file_index]
 
                 file_page_data = [group_name_to_delete_from, file_to_delete]
 
                 # Disabling the page while deleting files
                 self.view.update_page_enabled_state(page="delete", state=False)
+                self._delete_targets["delete_file"] = file_page_data
                 self.model.delete_file_in_thread(data=file_page_data)
 
         elif button_type == "group":
@@ -475,6 +697,7 @@ class Controller(QObject):
             if group_name:
                 # Disabling the page while deleting the group
                 self.view.update_page_enabled_state(page="delete", state=False)
+                self._delete_targets["delete_group"] = [group_name]
                 self.model.delete_group_in_thread(group_name=group_name)
 
     # === Signals and completion of operations ===
@@ -482,10 +705,18 @@ class Controller(QObject):
     def on_progress_bar_changed(self, process_text: str, value: int) -> None:
         """Handles changing the status of the progress bar.
 
+        Several jobs report progress at the same time, so while jobs are running
+        the bar shows the progress stored on one of them (see get_progress_job)
+        instead of the values of whichever job reported last.
+
         Args:
             process_text: The text of the operation status.
             value: The current value of the progress bar (0-100).
         """
+        job = self.get_progress_job()
+        if job is not None:
+            process_text, value = job.progress_text, job.progress
+
         self.view.set_progress_bar_process_text(text=process_text)
         self.view.set_progress_bar_percents_text(percents=f"{value}%")
         self.view.set_progress_bar_value(value=value)
@@ -540,6 +771,76 @@ class Controller(QObject):
         )
         return notification
 
+    def on_jobs_changed(self) -> None:
+        """Handles a change of a background job: refreshes the queue panel."""
+        self.view.set_queue_table_data(self.model.job_scheduler.jobs())
+        self.update_job_buttons_state()
+
+    def get_progress_job(self) -> Job | None:
+        """Returns the job shown in the progress bar.
+
+        This is the job selected in the queue panel if it is running, otherwise the oldest running job.
+        """
+        running = [job for job in self.model.job_scheduler.jobs() if job.status == Job.RUNNING]
+        selected_job_id = self.view.get_selected_queue_job_id()
+        for job in running:
+            if job.job_id == selected_job_id:
+                return job
+        return running[0] if running else None
+
+    def get_controlled_jobs(self) -> list[Job]:
+        """Returns the unfinished cancellable jobs the pause and cancel buttons act on.
+
+        This is the job selected in the queue panel or, without a selection, all such jobs.
+        """
+        jobs = [
+            job for job in self.model.job_scheduler.jobs()
+            if job.cancellable and not job.is_finished and not job.token.is_cancelled
+        ]
+        selected_job_id = self.view.get_selected_queue_job_id()
+        if selected_job_id is not None:
+            jobs = [job for job in jobs if job.job_id == selected_job_id]
+        return jobs
+
+    def update_job_buttons_state(self) -> None:
+        """Shows the pause and cancel buttons while there are jobs to control."""
+        jobs = self.get_controlled_jobs()
+        self.view.set_job_buttons_state(
+            visible=bool(jobs),
+            paused=bool(jobs) and all(job.token.is_paused for job in jobs),
+        )
+
+    def on_pause_job_push_button_clicked(self) -> None:
+        """Pauses the controlled jobs or resumes them if all of them are paused."""
+        jobs = self.get_controlled_jobs()
+        resume = bool(jobs) and all(job.token.is_paused for job in jobs)
+        for job in jobs:
+            if resume:
+                job.token.resume()
+            else:
+                job.token.pause()
+        self.on_jobs_changed()
+
+    def on_cancel_job_push_button_clicked(self) -> None:
+        """Cancels the controlled jobs after confirmation."""
+        jobs = self.get_controlled_jobs()
+        if not jobs:
+            return
+
+        text = f"Отменить операцию «{jobs[0].title}»?" if len(jobs) == 1 else f"Отменить операции ({len(jobs)})?"
+        result = self.on_show_action_notification(
+            msg_type="warning",
+            title="Отмена операции",
+            text=text,
+            buttons_texts=["Отменить операцию", "Продолжить"],
+        )
+        if result != 1:
+            return
+
+        for job in jobs:
+            job.token.cancel()
+        self.on_jobs_changed()
+
     def on_operation_finished(self, operation_name: str, status_code: int) -> None:
         """Handles the completion of a background operation.
 
@@ -547,8 +848,17 @@ class Controller(QObject):
             operation_name: Operation name (create_group, add_version, delete_file, etc.).
             status_code: Operation completion code (0 — success).
         """
-        # After the operation, we turned on all the pages again.
-        self.view.update_page_enabled_state(state=True, check_all=True)
+        # Downloads change nothing on the share and do not lock any page
+        if operation_name in self.DOWNLOAD_OPERATIONS:
+            return
+
+        deleted = self._delete_targets.pop(operation_name, None)
+
+        # After the operation, we turned on its page again
+        # (the page is locked while the job is queued, so it has no other jobs)
+        page = self.OPERATION_PAGES.get(operation_name)
+        if page is not None:
+            self.view.update_page_enabled_state(page=page, state=True)
 
         # If the operation failed, we don't update anything
         if status_code != 0:
@@ -563,28 +873,72 @@ class Controller(QObject):
         elif operation_name == "delete_group":
             self.view.set_delete_checkboxes_state(type="group", state=False)
 
-        # First, update the list of groups in all comboboxes
-        self.view.set_groups_comboboxes_data(self.model.get_groups_names())
-        # Update the dependent data
-        self.update_layer_one_table_data()
-        self.update_version_combobox_data()
-        self.model.in_group = False
-        self._selected_group = None
-        self._selected_file = None
-        self.view.set_choosen_label_text(data=None, in_group_flag=None)
+        # Pick up changes on the share (only groups whose directories changed are rescanned),
+        # then update the list of groups in all comboboxes and the dependent data
+        self.model.scan_in_thread("catalog", "refresh_catalog")
+        self.model.scan_in_thread("group_names", "get_groups_names")
+
+        # Jobs finish in the background, so the user keeps browsing where they are
+        # unless the opened group or version has just been deleted
+        if deleted is not None:
+            self.forget_deleted_items(deleted)
+        self.update_current_table_data()
+
         self.update_download_button_state()
         self.update_open_button_state()
         self.update_back_push_button_state()
 
-    def __check_program_version(self) -> None:
-        """Checks the relevance of the program version and, if necessary, launches an update.
+    def forget_deleted_items(self, deleted: list[str]) -> None:
+        """Leaves the group or the version on the "Download" tab if it was deleted.
+
+        Args:
+            deleted: Deleted group as [group] or deleted version as [group, version].
+        """
+        if deleted[0] != self._selected_group:
+            return
+
+        if len(deleted) == 1:
+            # The group is gone: back to the list of groups
+            self.model.in_group = False
+            self.model.opened_version = None
+            self._selected_group = None
+            self._selected_file = None
+            self._selected_path = None
+            self.view.set_choosen_label_text(data=None, in_group_flag=None)
+            return
+
+        version = deleted[1]
+        if self.model.opened_version == version:
+            # The opened version is gone: back to the list of versions of the group
+            self.model.opened_version = None
+            self._selected_file = None
+            self._selected_path = None
+            self.view.set_choosen_label_text(data=[""], in_group_flag=True)
+
+        elif self._selected_file == version:
+            self._selected_file = None
+            data = [""] if self.model.in_group else [self._selected_group, ""]
+            self.view.set_choosen_label_text(data=data, in_group_flag=self.model.in_group)
+
+    def update_current_table_data(self) -> None:
+        """Requests the data of the table that is shown on the "Download" tab again."""
+        if self.model.opened_version is not None:
+            self.request_table_data("list_version_contents", self._selected_group, self.model.opened_version)
+        elif self.model.in_group:
+            self.request_table_data("get_group_versions", self._selected_group)
+        else:
+            # The list of groups or the results of the current search
+            self.run_search()
+
+    def __handle_program_version(self, is_version: bool | None) -> None:
+        """Handles the result of the background program version check and, if necessary, launches an update.
 
         If the version is outdated, the user is prompted to update the program.
         If the verification fails or the update fails, the application is terminated.
-        """
-        # Checking the program version
-        is_version = self.model.check_program_version()
 
+        Args:
+            is_version: Result of Model.check_program_version (None if the check failed).
+        """
         # If an error occurred during the version check
         if is_version is None:
             self.on_show_notification(
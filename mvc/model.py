@@ -1,17 +1,47 @@
 import os
 import re
 import sys
+import json
+import zlib
+import hashlib
 import yaml
 import shutil
+import sqlite3
 import datetime
 import threading
 import subprocess
 
+from typing import TYPE_CHECKING, Callable, Iterator
 from pathlib import Path
-from packaging import version
-from cryptography.fernet import Fernet, InvalidToken
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+from classes import (
+    Catalog,
+    CatalogScanner,
+    Digest,
+    FileCipher,
+    FilePipeline,
+    Job,
+    JobScheduler,
+    KeyManager,
+    ManifestEntry,
+    ObjectStore,
+    OperationCancelled,
+    PackEntry,
+    PackReader,
+    PackWriter,
+    ProgressTracker,
+    SearchIndex,
+    StartupProfiler,
+    TransferJournal,
+    VersionCache,
+    VersionPack,
+)
+
+# cryptography and packaging are imported on first use: they are not needed to show the window
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
 
 
 class Model(QObject):
@@ -25,35 +55,108 @@ class Model(QObject):
     progress_chehged = pyqtSignal(str, int)  # Progress bar state changed (text, value)
     show_notification = pyqtSignal(str, str)  # Show notification (type, text)
     operation_finished = pyqtSignal(str, int)  # Background operation finished (name, status code)
+    scan_finished = pyqtSignal(str, str, int, object)  # Catalog query finished (channel, query, generation, result)
+    jobs_changed = pyqtSignal()  # A queued job changed its status or progress
 
-    def __init__(self) -> None:
-        """Initialize the model and load configuration."""
+    def __init__(self, base_path: str | Path | None = None, profiler: StartupProfiler | None = None) -> None:
+        """Initialize the model and load configuration.
+
+        Args:
+            base_path: Folder with config.yaml and _internal (the program folder if None).
+            profiler: Startup profiler receiving the phases of the initialization.
+        """
         super().__init__()
 
         # Determine base path for script or frozen executable
-        if getattr(sys, "frozen", False):
+        if base_path is not None:
+            self.base_path = Path(base_path)
+        elif getattr(sys, "frozen", False):
             self.base_path = Path(sys.executable).parent
         else:
             # Path to project root folder (e.g., File Archive/)
             self.base_path = Path(__file__).parent.parent
+        self.profiler = profiler if profiler is not None else StartupProfiler()
 
         # Configuration and state
         self.config_data = self._load_config()  # Configuration data from config.yaml
+        self.profiler.mark("load_config")
         self.in_group: bool = False  # Flag: table currently shows all versions of one group
+        self.opened_version: str | None = None  # Version whose files are shown in the table
         self.search_all_versions: bool = False  # Flag: search across all versions
         self.new_group_name = None  # Name of newly created group
         self.is_temp_folder_created = False # Flag: temp folder was created
         self.temp_folder_path = None  # Path to temp folder
+        self.catalog: Catalog | None = None  # Server-side index of groups and versions
+        self.catalog_enabled: bool = True  # Flag: catalog is usable (falls back to scanning otherwise)
+        # Guards the two above: the catalog is first used by the scanner, job or GUI thread
+        # (reentrant, building it may disable it)
+        self._catalog_lock = threading.RLock()
+        self.search_index = SearchIndex()  # In-memory index for search queries
+
+        # Background jobs; progress of an operation is also stored on its job for the queue panel
+        job_workers = (self.config_data or {}).get("job_workers")
+        self.job_scheduler = JobScheduler(
+            workers=job_workers if isinstance(job_workers, int) and job_workers > 0 else 2,
+            on_change=self._on_job_changed,
+        )
+        self.progress_chehged.connect(self.job_scheduler.report_progress, Qt.DirectConnection)
+
+        # Queries the GUI waits for run on their own worker, so they are not queued behind jobs;
+        # a newer query for the same channel (table, combobox) supersedes the older one
+        self.catalog_scanner = CatalogScanner(on_result=self.scan_finished.emit)
+        self.SCAN_QUERIES: tuple[str, ...] = (
+            "check_program_version",
+            "refresh_catalog",
+            "get_groups_names",
+            "get_groups_actual_versions",
+            "get_group_versions",
+            "list_version_contents",
+            "search",
+            "search_all",
+        )
 
         # Encryption-related paths
         self.keyfile_path: str = self.base_path / "_internal" / "keyfile.key"  # Encryption key file
         self.password_file_path: str = self.base_path / "_internal" / "password.key"  # Encrypted password file
+        self.startup_log_path: Path = self.base_path / "_internal" / "startup.log"  # Startup phases of recent launches
+        self.key_manager = KeyManager(self.keyfile_path)  # Loads the key once and caches the cipher
 
         # Progress bar step settings
         self.DOWNLOAD_PROGRESS_BAR_STEP: int = 3
         self.CREATE_NEW_GROUP_PROGRESS_BAR_STEP: int = 3
         self.ADD_PROGRESS_BAR_STEP: int = 2
         self.DELETE_PROGRESS_BAR_STEP: int = 2
+        self.PROGRESS_UPDATES_PER_SECOND: float = 10.0  # Rate limit for byte-based progress signals
+
+        # Compression before encryption: formats that are already compressed are stored as is,
+        # larger files are stored as is if a sample of their beginning does not shrink enough
+        self.COMPRESSED_EXTENSIONS: tuple[str, ...] = (
+            ".zip", ".7z", ".rar", ".gz", ".bz2", ".xz", ".zst", ".cab", ".msi",
+            ".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp3", ".mp4", ".avi", ".mkv", ".mov",
+            ".pdf", ".docx", ".xlsx", ".pptx",
+        )
+        self.COMPRESSION_SAMPLE_SIZE: int = 64 * 1024
+        self.COMPRESSION_MIN_RATIO: float = 0.9
+
+        # Unreferenced objects younger than this may belong to an unfinished upload
+        self.OBJECT_GC_GRACE_SECONDS: float = 3600.0
+
+        # Delta encoding of "dedup" versions: smaller files are always stored in full
+        self.DELTA_MIN_FILE_SIZE: int = 1024 * 1024
+        self.DELTA_BLOCK_SIZE: int = 64 * 1024
+
+        # Resumable pack uploads: written entries are journaled after this many bytes
+        self.PACK_JOURNAL_INTERVAL: int = 16 * 1024 * 1024
+
+        # Folder versions keep the plain sizes and content digests of their files here,
+        # so a sync compares local files without decrypting the copies on the share
+        self.VERSION_INDEX_NAME: str = "~version.index"
+
+        # Directory mtimes closer than this to the time of the share are not trusted by the
+        # catalog refresh: a change in the same timestamp tick would otherwise go unnoticed
+        self.CATALOG_MTIME_GRANULARITY_NS: int = 2_000_000_000
+
+        self.profiler.mark("model_init")
 
     # === Version checking & updating ===
 
@@ -65,6 +168,8 @@ class Model(QObject):
             False if current version is up to date,
             None if a check error occurred.
         """
+        from packaging import version
+
         program_server_path = Path(self.config_data.get("server_program_path"))
 
         if not program_server_path.exists():
@@ -120,6 +225,9 @@ class Model(QObject):
     def get_groups_names(self) -> list[str]:
         """Return list of group names from versions directory.
 
+        Group names are read from the catalog when it is available,
+        otherwise the versions directory is listed.
+
         Returns:
             Sorted list of group names, or empty list on error.
         """
@@ -133,8 +241,14 @@ class Model(QObject):
                 )
                 return []
 
-            groups_names = [p.name for p in path_to_groups.iterdir()]
-            return sorted(groups_names)
+            try:
+                catalog = self._get_catalog()
+                if catalog is not None:
+                    return catalog.get_groups()
+            except sqlite3.Error:
+                self._disable_catalog()
+
+            return self._scan_groups_names(path_to_groups)
 
         except FileNotFoundError:
             self.show_notification.emit(
@@ -159,6 +273,100 @@ class Model(QObject):
     def get_group_versions(self, group_name: str) -> list[str]:
         """Return list of versions for a specific group.
 
+        Versions are read from the catalog when it is available,
+        otherwise the group directory is listed.
+
+        Args:
+            group_name: Name of the group.
+
+        Returns:
+            Sorted list of version names, newest first, or empty list on error.
+        """
+        try:
+            catalog = self._get_catalog()
+            if catalog is not None and catalog.has_group(group_name):
+                return catalog.get_group_versions(group_name)
+
+        except sqlite3.Error:
+            self._disable_catalog()
+
+        return self._scan_group_versions(group_name)
+
+    def get_groups_actual_versions(self) -> list[list[str | None]]:
+        """Return groups together with their actual versions.
+
+        With the catalog this is a single read of the precomputed values,
+        without it every group directory is listed.
+
+        Returns:
+            List of [group_name, actual_version] rows sorted by group name.
+        """
+        try:
+            catalog = self._get_catalog()
+            if catalog is not None:
+                return catalog.get_groups_actual_versions()
+
+        except sqlite3.Error:
+            self._disable_catalog()
+
+        groups_versions: list[list[str | None]] = []
+        for group in self.get_groups_names():
+            versions = self.get_group_versions(group)
+            groups_versions.append([group, self.get_actual_version(versions)])
+        return groups_versions
+
+    def rebuild_catalog(self) -> int:
+        """Rebuild the catalog from the contents of the versions directory.
+
+        Returns:
+            0 on success, 1 on error.
+        """
+        try:
+            versions_path = Path(self.config_data.get("versions_path"))
+            if not versions_path.exists():
+                return 1
+
+            with self._catalog_lock:
+                if self.catalog is None:
+                    self.catalog = Catalog(versions_path)
+                catalog = self.catalog
+
+            groups: dict[str, tuple[list[str], str | None, int | None]] = {}
+            for group_name in self._scan_groups_names(versions_path):
+                mtime_ns = self._get_group_mtime_ns(versions_path / group_name)
+                versions = self._scan_group_versions(group_name)
+                groups[group_name] = (versions, self.get_actual_version(versions), mtime_ns)
+
+            catalog.rebuild(groups)
+            self._clear_recent_snapshots(
+                catalog, {group_name: mtime_ns for group_name, (_, _, mtime_ns) in groups.items()}
+            )
+            return 0
+
+        except (sqlite3.Error, OSError):
+            self._disable_catalog()
+            return 1
+
+    def refresh_catalog(self) -> list[str]:
+        """Bring the catalog up to date with the versions directory.
+
+        Only the versions directory itself is listed; a group directory is
+        rescanned only if its modification time differs from the snapshot
+        stored in the catalog. Groups that disappeared are removed.
+
+        Returns:
+            Names of groups that were rescanned or removed.
+        """
+        catalog = self._get_catalog()
+        if catalog is None:
+            self.search_index.clear()
+            return []
+
+        return self._refresh_catalog(catalog)
+
+    def _scan_group_versions(self, group_name: str) -> list[str]:
+        """List versions of a group directly from the group directory.
+
         Args:
             group_name: Name of the group.
 
@@ -306,6 +514,9 @@ class Model(QObject):
     def search(self, text: str) -> list[list[str | None]]:
         """Search in last versions table (groups and their actual versions).
 
+        The query is resolved against the in-memory search index,
+        the share is not accessed.
+
         Args:
             text: Search query string.
 
@@ -316,32 +527,7 @@ class Model(QObject):
             if not text:
                 return []
 
-            groups = self.get_groups_names()
-            if not groups:
-                return []
-
-            groups_versions: list[list[str | None]] = []
-            for group in groups:
-                versions = self.get_group_versions(group)
-                actual_version = self.get_actual_version(versions)
-                groups_versions.append([group, actual_version])
-
-            result: list[list[str | None]] = []
-            search_text = text.lower().strip()
-            for group_version in groups_versions:
-                group_name = group_version[0].lower().strip()
-
-                if group_version[1] is None:
-                    if search_text in group_name and group_version not in result:
-                        result.append(group_version)
-                    continue
-
-                version_name = str(group_version[1]).lower().strip()
-
-                if (search_text in group_name or search_text in version_name) and group_version not in result:
-                    result.append(group_version)
-
-            return result
+            return self._get_search_index().search(text)
 
         except Exception as e:
             self.show_notification.emit(
@@ -354,6 +540,9 @@ class Model(QObject):
     def search_all(self, text: str) -> list[list[str | None]]:
         """Search across all versions and all groups.
 
+        The query is resolved against the in-memory search index,
+        the share is not accessed.
+
         Args:
             text: Search query string.
 
@@ -365,33 +554,7 @@ class Model(QObject):
             if not text:
                 return []
 
-            groups = self.get_groups_names()
-            if not groups:
-                return []
-
-            groups_versions: dict[str, list[str]] = {}
-            for group in groups:
-                groups_versions[group] = self.get_group_versions(group)
-
-            result: list[list[str | None]] = []
-            search_text = text.lower().strip()
-            for group, versions in groups_versions.items():
-                group_text = group.lower().strip()
-
-                if not versions:
-                    if search_text in group_text and [group, None] not in result:
-                        result.append([group, None])
-                else:
-                    for version_name in versions:
-                        version_text = version_name.lower().strip() if version_name else ""
-
-                        if (search_text in group_text or search_text in version_text) and [
-                            group,
-                            version_name,
-                        ] not in result:
-                            result.append([group, version_name])
-
-            return result
+            return self._get_search_index().search_all(text)
 
         except Exception as e:
             self.show_notification.emit(
@@ -434,6 +597,7 @@ class Model(QObject):
             current_step += progress_step_size
             self.progress_chehged.emit("Создаём группу...", current_step)
             group_path.mkdir(parents=True, exist_ok=True)
+            self._update_catalog_group(group_name)
 
             self.progress_chehged.emit("Группа создана.", 100)
             self.show_notification.emit(
@@ -476,9 +640,12 @@ class Model(QObject):
                 )
                 return 1
 
+            self._check_cancelled()
+
             current_step += progress_step_size
             self.progress_chehged.emit("Удаляем группу...", current_step)
-            shutil.rmtree(group_path)
+            self._delete_tree(group_path)
+            self._update_catalog_group(group_name)
 
             self.progress_chehged.emit("Группа удалена.", 100)
             self.show_notification.emit(
@@ -487,6 +654,12 @@ class Model(QObject):
             )
             return 0
 
+        except OperationCancelled:
+            # Files deleted before the cancellation are gone; the group stays with the rest
+            self._update_catalog_group(group_name)
+            self.progress_chehged.emit("Удаление отменено.", 0)
+            self.show_notification.emit("info", f"Удаление группы {group_name} отменено.")
+            return 1
         except Exception as e:
             self.show_notification.emit(
                 "error",
@@ -528,6 +701,13 @@ class Model(QObject):
             elif file_path.is_dir():
                 shutil.rmtree(file_path)
 
+            if file_path.name.endswith(ObjectStore.MANIFEST_EXTENSION):
+                # Objects no longer used by any version of the group are removed
+                self.progress_chehged.emit("Удаляем неиспользуемые файлы...", current_step)
+                self._collect_group_garbage(data[0])
+
+            self._update_catalog_group(data[0])
+
             self.progress_chehged.emit("Файл удалён.", 100)
             self.show_notification.emit(
                 "info",
@@ -546,13 +726,33 @@ class Model(QObject):
     def add_version(self, version_path: str, group_name: str) -> int:
         """Add a new version (folder) to a group with encryption of its files.
 
+        Depending on the storage_mode setting the version is stored as a
+        folder of .enc files ("files"), as a single .pack file ("pack") or
+        as a manifest referring to objects shared by the versions of the
+        group ("dedup"), in which case only new file contents are uploaded.
+
+        The operation can be paused and cancelled between files and chunks.
+        A cancelled upload removes its partial folder or pack from the share;
+        in "dedup" mode the objects uploaded so far are kept (nothing refers
+        to them until a manifest is written) and are reused by the next
+        attempt, so only the remaining files are uploaded again.
+
+        An upload that fails (e.g. the network drops) is resumed by adding
+        the same folder again: a folder or pack is written under a "~"
+        service name with a TransferJournal of the committed files, and
+        files whose source still matches the journal by size and hash are
+        not encrypted again. The version appears only when it is complete.
+
         Args:
             version_path: Source directory of the new version.
             group_name: Name of the target group.
 
         Returns:
-            0 on success, 1 on error.
+            0 on success, 1 on error or cancellation.
         """
+        partial_path: Path | None = None  # Output removed if the operation is cancelled
+        journal: TransferJournal | None = None
+        storage_mode = None
         try:
             if not version_path or not group_name:
                 return 1
@@ -562,39 +762,112 @@ class Model(QObject):
 
             self.progress_chehged.emit("Формируем путь к папке новой версии...", current_step)
             src_path = Path(version_path)
-            dst_root = Path(self.config_data.get("versions_path")) / group_name / src_path.name
+            group_path = Path(self.config_data.get("versions_path")) / group_name
+            dst_root = group_path / src_path.name
 
-            if dst_root.exists():
-                self.show_notification.emit("error", f"Папка {dst_root} уже существует.")
+            storage_kind, existing_path = self._find_version_storage(group_name, src_path.name)
+            if storage_kind == "files":
+                self.show_notification.emit("error", f"Папка {existing_path} уже существует.")
+                return 1
+            if storage_kind is not None:
+                self.show_notification.emit("error", f"Файл {existing_path} уже существует.")
                 return 1
 
-            dst_root.mkdir(parents=True, exist_ok=True)
+            storage_mode = self._get_storage_mode()
+            if storage_mode == "files":
+                # Files go to a service folder renamed into place when complete
+                staging_root = group_path / f"~{src_path.name}.upload"
+                journal = self._get_transfer_journal(staging_root.with_name(staging_root.name + TransferJournal.EXTENSION))
+                if journal.load():
+                    self.progress_chehged.emit("Продолжаем прерванное добавление...", current_step)
+                staging_root.mkdir(parents=True, exist_ok=True)
+                partial_path = staging_root
 
             current_step += progress_step_size
             self.progress_chehged.emit("Копируем и шифруем файлы...", current_step)
 
-            for root, dirs, files in os.walk(version_path):
-                root_path = Path(root)
-                rel = root_path.relative_to(version_path)
-                dst_dir = dst_root / rel
-                dst_dir.mkdir(parents=True, exist_ok=True)
+            # Pre-scan the source to report progress in bytes
+            tree = list(self._walk_with_sizes(src_path))
+            total_bytes = sum(size for _, files in tree for _, size in files)
+            self._check_cancelled()
+
+            if storage_mode == "dedup":
+                manifest_path = group_path / f"{src_path.name}{ObjectStore.MANIFEST_EXTENSION}"
+                self._store_version_objects(group_name, src_path, tree, total_bytes, manifest_path, current_step)
+            else:
+                progress = self._create_progress_tracker(
+                    text="Копируем и шифруем файлы...",
+                    total_bytes=total_bytes,
+                    start_value=current_step,
+                )
+                progress.start()
+
+                if storage_mode == "pack":
+                    pack_path = group_path / f"{src_path.name}{VersionPack.EXTENSION}"
+                    self._write_version_pack(group_name, src_path, tree, pack_path, progress.advance)
+                else:
+                    index: dict[str, list] = {}  # Relative path -> [plain size, content digest]
+
+                    def encrypt(rel_path: str, src_file: Path, dst_file: Path, size: int, compression: str | None) -> None:
+                        digest = self._run_journaled(
+                            journal, rel_path, src_file, Path(f"{dst_file}.enc"), size, progress.advance,
+                            self._encrypt_file, str(src_file), str(dst_file), False, progress.advance, compression,
+                        )
+                        index[rel_path] = [size, digest]
+
+                    # Directories are created in order, files are encrypted in parallel
+                    workers = FilePipeline.resolve_workers(self.config_data.get("encryption_workers"))
+                    with FilePipeline(workers=workers) as pipeline:
+                        for root_path, files in tree:
+                            rel = root_path.relative_to(src_path)
+                            dst_dir = staging_root / rel
+                            dst_dir.mkdir(parents=True, exist_ok=True)
+
+                            for filename, size in files:
+                                self._check_cancelled()
+                                src_file = root_path / filename
+                                dst_file = dst_dir / filename
+                                compression = self._choose_compression(group_name, src_file, size)
+                                pipeline.submit(encrypt, (rel / filename).as_posix(), src_file, dst_file, size, compression)
+
+                    self._write_version_index(staging_root, index)
 
-                for filename in files:
-                    src_file = root_path / filename
-                    dst_file = dst_dir / filename
-                    self._encrypt_file(str(src_file), str(dst_file))
+                    staging_root.rename(dst_root)
+                    journal.remove()
+
+                progress.finish()
+
+            self._update_catalog_group(group_name)
 
             self.progress_chehged.emit("Версия добавлена.", 100)
             self.show_notification.emit("info", "Папка успешно скопирована и зашифрована.")
             return 0
 
+        except OperationCancelled:
+            self._remove_partial_output(partial_path)
+            if journal is not None:
+                journal.remove()
+            self.progress_chehged.emit("Добавление отменено.", 0)
+            if storage_mode == "dedup":
+                self.show_notification.emit(
+                    "info",
+                    "Добавление версии отменено.\n"
+                    "Уже загруженные файлы будут использованы при повторном добавлении.",
+                )
+            else:
+                self.show_notification.emit("info", "Добавление версии отменено. Частично загруженные файлы удалены.")
+            return 1
         except Exception as e:
             self.show_notification.emit(
                 "error",
                 "Произошла ошибка при добавлении версии.\n"
-                f"Ошибка: {e}",
+                f"Ошибка: {e}\n"
+                "Добавьте эту папку ещё раз, чтобы продолжить с места остановки.",
             )
             return 1
+        finally:
+            if journal is not None:
+                journal.close()
 
     def add_instruction(self, instruction_path: str, group_name: str) -> int:
         """Add an instruction file to a group with encryption.
@@ -627,7 +900,19 @@ class Model(QObject):
 
             current_step += progress_step_size
             self.progress_chehged.emit("Копируем и шифруем файл...", current_step)
-            self._encrypt_file(src_path=instruction_path, dst_path=str(dst_path))
+            instruction_size = instruction_path_obj.stat().st_size
+            progress = self._create_progress_tracker(
+                text="Копируем и шифруем файл...",
+                total_bytes=instruction_size,
+                start_value=current_step,
+            )
+            self._encrypt_file(
+                src_path=instruction_path,
+                dst_path=str(dst_path),
+                progress=progress.advance,
+                compression=self._choose_compression(group_name, instruction_path_obj, instruction_size),
+            )
+            self._update_catalog_group(group_name)
 
             self.progress_chehged.emit("Инструкция добавлена.", 100)
             self.show_notification.emit("info", "Инструкция успешно скопирована и зашифрована.")
@@ -642,7 +927,17 @@ class Model(QObject):
             return 1
 
     def download(self, group: str, file: str, save_path: str | Path | None) -> int:
-        """Download and decrypt a version folder or instruction file.
+        """Download and decrypt a version (folder or pack) or instruction file.
+
+        With version_cache_mb set, downloaded versions are kept in a local
+        encrypted cache, and a repeated download of an unchanged version is
+        decrypted from the cache without reading the share.
+
+        The operation can be paused and cancelled between files and chunks;
+        a cancelled download removes its partial output. A version download
+        that fails keeps the downloaded files and a TransferJournal of them
+        next to the folder; downloading the version again resumes it, and
+        files that still match the journal by size and hash are skipped.
 
         Args:
             group: Group name.
@@ -651,10 +946,15 @@ class Model(QObject):
                 If not set, Desktop is used.
 
         Returns:
-            0 on success, 1 on error.
+            0 on success, 1 on error or cancellation.
         """
+        from cryptography.fernet import InvalidToken
+
+        partial_path: Path | None = None  # Output removed if the operation is cancelled
+        journal: TransferJournal | None = None
         try:
             file_path = Path(self.config_data.get("versions_path")) / group / file
+            storage_kind, storage_path = self._find_version_storage(group, file)
 
             if not save_path:
                 save_path = self.get_desktop_path()
@@ -667,7 +967,23 @@ class Model(QObject):
                 )
                 return 1
 
-            if file_path.is_dir():
+            # A job cancelled while queued stops before touching the destination
+            self._check_cancelled()
+
+            cache = self._get_version_cache() if storage_kind is not None else None
+            cache_key = None
+            if cache is not None:
+                cache_key = cache.make_key(group, file, self._get_version_fingerprint(storage_kind, storage_path))
+
+            if (
+                cache_key is not None
+                and cache.has(cache_key)
+                and self._extract_cached_version(cache, cache_key, Path(save_path) / f"{group} {file}")
+            ):
+                # Nothing to store: the version is already cached
+                cache = None
+
+            elif storage_kind == "files":
                 progress_step_size = 100 // self.DOWNLOAD_PROGRESS_BAR_STEP
                 current_step = 0
 
@@ -683,30 +999,138 @@ class Model(QObject):
                 current_step += progress_step_size
                 self.progress_chehged.emit("Создаём путь сохранения...", current_step)
                 dst_path = Path(save_path) / f"{group} {file}"
-                if dst_path.exists():
-                    self.show_notification.emit(
-                        "error",
-                        f"Директория {dst_path} уже существует.",
-                    )
+                journal = self._open_download_journal(dst_path)
+                if journal is None:
                     return 1
 
                 dst_path.mkdir(parents=True, exist_ok=True)
+                partial_path = dst_path
 
                 current_step += progress_step_size
                 self.progress_chehged.emit("Скачиаваем файлы...", current_step)
-                for root, dirs, files in os.walk(src_path):
-                    root_path = Path(root)
-                    rel = root_path.relative_to(src_path)
-                    dst_dir = dst_path / rel
-                    dst_dir.mkdir(parents=True, exist_ok=True)
 
-                    for filename in files:
-                        if not filename.endswith(".enc"):
-                            continue
+                # Pre-scan the version to report progress in bytes
+                tree = [
+                    (root_path, [(name, size) for name, size in files if name.endswith(".enc")])
+                    for root_path, files in self._walk_with_sizes(src_path)
+                ]
+                progress = self._create_progress_tracker(
+                    text="Скачиваем файлы...",
+                    total_bytes=sum(size for _, files in tree for _, size in files),
+                    start_value=current_step,
+                )
+                progress.start()
+
+                # Network reads, decryption and local writes of different files overlap;
+                # the byte budget keeps the amount of data in flight predictable
+                cipher = self._get_file_cipher()
+                workers = FilePipeline.resolve_workers(self.config_data.get("download_workers"))
+                in_flight_mb = self.config_data.get("download_in_flight_mb") or 256
+                with FilePipeline(workers=workers, max_in_flight_bytes=in_flight_mb * 1024 * 1024) as pipeline:
+                    for root_path, files in tree:
+                        rel = root_path.relative_to(src_path)
+                        dst_dir = dst_path / rel
+                        dst_dir.mkdir(parents=True, exist_ok=True)
+
+                        for filename, size in files:
+                            self._check_cancelled()
+                            src_file = root_path / filename
+                            dst_file = dst_dir / filename[:-4]
+                            pipeline.submit(
+                                self._run_journaled,
+                                journal,
+                                (rel / filename[:-4]).as_posix(),
+                                dst_file,
+                                dst_file,
+                                size,
+                                progress.advance,
+                                cipher.decrypt_file,
+                                src_file,
+                                dst_file,
+                                progress.advance,
+                                size=size,
+                            )
+
+                progress.finish()
+
+            elif storage_kind in ("pack", "dedup"):
+                progress_step_size = 100 // self.DOWNLOAD_PROGRESS_BAR_STEP
+                current_step = 0
+
+                self.progress_chehged.emit("Создаём путь сохранения...", current_step)
+                dst_path = Path(save_path) / f"{group} {file}"
+                journal = self._open_download_journal(dst_path)
+                if journal is None:
+                    return 1
 
-                        src_file = root_path / filename
-                        dst_file = dst_dir / filename[:-4]
-                        self._decryprt_file(str(src_file), str(dst_file))
+                current_step += progress_step_size
+                self.progress_chehged.emit("Читаем оглавление версии...", current_step)
+
+                if storage_kind == "pack":
+                    # The whole version is one file: the table of contents is read
+                    # once, then the pack is decrypted front to back
+                    with PackReader(storage_path, self._get_file_cipher()) as pack:
+                        current_step += progress_step_size
+                        progress = self._create_progress_tracker(
+                            text="Скачиваем файлы...",
+                            total_bytes=pack.total_length,
+                            start_value=current_step,
+                        )
+                        progress.start()
+
+                        dst_path.mkdir(parents=True, exist_ok=True)
+                        partial_path = dst_path
+                        for rel_path in pack.directories:
+                            (dst_path / rel_path).mkdir(parents=True, exist_ok=True)
+
+                        # Files are extracted in the order they are stored, reading the pack sequentially
+                        for entry in pack.entries:
+                            dst_file = dst_path / entry.path
+                            dst_file.parent.mkdir(parents=True, exist_ok=True)
+                            self._run_journaled(
+                                journal, entry.path, dst_file, dst_file, entry.length, progress.advance,
+                                pack.extract, entry, dst_file, progress.advance,
+                            )
+                else:
+                    store = self._get_object_store(group)
+                    directories, entries = store.read_manifest(storage_path)
+
+                    current_step += progress_step_size
+                    progress = self._create_progress_tracker(
+                        text="Скачиваем файлы...",
+                        total_bytes=sum(entry.size for entry in entries),
+                        start_value=current_step,
+                    )
+                    progress.start()
+
+                    dst_path.mkdir(parents=True, exist_ok=True)
+                    partial_path = dst_path
+                    for rel_path in directories:
+                        (dst_path / rel_path).mkdir(parents=True, exist_ok=True)
+
+                    workers = FilePipeline.resolve_workers(self.config_data.get("download_workers"))
+                    in_flight_mb = self.config_data.get("download_in_flight_mb") or 256
+                    with FilePipeline(workers=workers, max_in_flight_bytes=in_flight_mb * 1024 * 1024) as pipeline:
+                        for entry in entries:
+                            self._check_cancelled()
+                            dst_file = dst_path / entry.path
+                            dst_file.parent.mkdir(parents=True, exist_ok=True)
+                            pipeline.submit(
+                                self._run_journaled,
+                                journal,
+                                entry.path,
+                                dst_file,
+                                dst_file,
+                                entry.size,
+                                progress.advance,
+                                store.get,
+                                entry.object_id,
+                                dst_file,
+                                progress.advance,
+                                size=entry.size,
+                            )
+
+                progress.finish()
 
             else:
                 progress_step_size = 100 // self.DOWNLOAD_PROGRESS_BAR_STEP
@@ -721,150 +1145,651 @@ class Model(QObject):
 
                 current_step += progress_step_size
                 self.progress_chehged.emit(f"Скачивание файла {file}...", current_step)
-                self._decryprt_file(str(src_path), str(dst_path))
+                progress = self._create_progress_tracker(
+                    text=f"Скачивание файла {file}...",
+                    total_bytes=src_path.stat().st_size,
+                    start_value=current_step,
+                )
+                partial_path = dst_path
+                self._decryprt_file(str(src_path), str(dst_path), progress=progress.advance)
+
+            if journal is not None:
+                journal.remove()
+
+            if cache is not None:
+                self._store_cached_version(cache, cache_key, dst_path)
 
             self.progress_chehged.emit("Скачивание завершено.", 100)
             self.show_notification.emit("info", "Файл успешно скачан.")
             return 0
 
+        except OperationCancelled:
+            self._remove_partial_output(partial_path)
+            if journal is not None:
+                journal.remove()
+            self.progress_chehged.emit("Скачивание отменено.", 0)
+            self.show_notification.emit("info", "Скачивание отменено. Частично скачанные файлы удалены.")
+            return 1
+        except InvalidToken:
+            self.show_notification.emit(
+                "error",
+                "Ошибка дешифрования: ключ недействителен или данные повреждены.",
+            )
+            return 1
         except Exception as e:
+            resume_hint = "\nСкачайте версию ещё раз, чтобы продолжить с места остановки." if journal is not None else ""
             self.show_notification.emit(
                 "error",
                 "Произошла ошибка при скачивании файла.\n"
-                f"Ошибка: {e}",
+                f"Ошибка: {e}{resume_hint}",
             )
             return 1
+        finally:
+            if journal is not None:
+                journal.close()
         
-    def open_file(self, group: str, file: str) -> None:
-        """Decrypt and open a file in a temporary location.
+    def list_version_contents(self, group: str, version: str) -> list[tuple[str, int]]:
+        """Return the files stored in a version.
 
-        This function decrypts the specified file into a temporary directory
-        and then opens it using the default system application. It is intended
-        for quickly viewing files like instructions without permanently saving them.
+        For a pack or a manifest only its table of contents is read; for a
+        folder version the folder tree is listed. File contents are not read.
 
         Args:
-            group: The name of the group containing the file.
-            file: The name of the file to open (without the .enc extension).
+            group: Group name.
+            version: Version name (without the .pack/.manifest extension).
+
+        Returns:
+            List of (relative "/"-separated path, size in bytes) sorted by path,
+            or empty list on error. For folder versions the size is the size
+            of the stored encrypted file.
         """
+        from cryptography.fernet import InvalidToken
+
         try:
-            file_path = Path(self.config_data.get("versions_path")) / group / f"{file}.enc"
+            storage_kind, version_path = self._find_version_storage(group, version)
+
+            if storage_kind == "files":
+                contents: list[tuple[str, int]] = []
+                for root_path, files in self._walk_with_sizes(version_path):
+                    rel = root_path.relative_to(version_path).as_posix()
+                    prefix = "" if rel == "." else f"{rel}/"
+                    contents.extend(
+                        (f"{prefix}{name[:-4]}", size) for name, size in files if name.endswith(".enc")
+                    )
+                return sorted(contents)
 
-            if not file_path.exists():
-                self.show_notification.emit("error", "Выбранный файл не существует на сервере.")
-                return
+            if storage_kind == "pack":
+                with PackReader(version_path, self._get_file_cipher()) as pack:
+                    return sorted((entry.path, entry.size) for entry in pack.entries)
 
-            # Create a temp folder and get the path for the new file
-            temp_folder_path = self._create_temp_folder() / file_path.name
-            
-            # Decrypt and download the instruction file to the temp folder
-            shutil.copy(file_path, temp_folder_path)
-            self._decryprt_file(temp_folder_path, temp_folder_path.with_suffix(""))
-            
-            # Open the decrypted file
-            subprocess.Popen(['start', '', temp_folder_path.with_suffix("")], shell=True)
-        
-        except Exception as e:
-            self.show_notification.emit("error", f"Произошла ошибка при открытии файла.\nОшибка: {e}")
-            return
-        
-    def delete_temp_folder(self, path: Path) -> None:
-        """Recursively delete the temporary folder.
+            if storage_kind == "dedup":
+                _, entries = self._get_object_store(group).read_manifest(version_path)
+                return sorted((entry.path, entry.size) for entry in entries)
 
-        Args:
-            path: The Path object representing the directory to delete.
-        """
-        try:
-            shutil.rmtree(path)
+            self.show_notification.emit("error", f"Версия {version} не найдена в группе {group}.")
+            return []
 
+        except InvalidToken:
+            self.show_notification.emit(
+                "error",
+                "Ошибка дешифрования: ключ недействителен или данные повреждены.",
+            )
+            return []
         except Exception as e:
-            print("Ошибка: ", e)
+            self.show_notification.emit(
+                "error",
+                "Произошла ошибка при получении списка файлов версии.\n"
+                f"Ошибка: {e}",
+            )
+            return []
 
-    # === Password management ===
+    def extract_files(self, group: str, version: str, paths: list[str], save_path: str | Path | None) -> int:
+        """Download and decrypt selected files of a version.
 
-    def get_decrypted_password(self) -> str | None:
-        """Get and decrypt password from password.key.
+        Only the selected files are read from the share: separate .enc files
+        of a folder version, the byte ranges of the files inside a pack, or
+        the objects of the files of a manifest.
+        Files are saved under "<group> <version>" in the destination
+        directory, keeping their relative paths.
+
+        Args:
+            group: Group name.
+            version: Version name (without the .pack/.manifest extension).
+            paths: Relative paths of the files, as returned by list_version_contents().
+            save_path: Destination directory. If not set, Desktop is used.
 
         Returns:
-            Decrypted password string or None if not available.
+            0 on success, 1 on error.
         """
-        if not self.password_file_path.exists():
-            return None
+        from cryptography.fernet import InvalidToken
 
         try:
-            with open(self.password_file_path, "r", encoding="utf-8") as f:
-                encrypted_password = f.read().strip()
+            if not paths:
+                return 1
 
-            if not encrypted_password:
-                return None
+            if not save_path:
+                save_path = self.get_desktop_path()
+                if not save_path or not Path(save_path).exists():
+                    return 1
+            elif not Path(save_path).exists():
+                self.show_notification.emit(
+                    "error",
+                    f"Директория {save_path} не существует.",
+                )
+                return 1
 
-            return self._decrypt_string(encrypted_password)
-        except Exception:
-            return None
+            # A job cancelled while queued stops before touching the destination
+            self._check_cancelled()
 
-    def set_password(self, new_password: str) -> int:
-        """Set new password in password.key using encryption.
+            progress_step_size = 100 // self.DOWNLOAD_PROGRESS_BAR_STEP
+            current_step = 0
 
-        Args:
-            new_password: Plain text password to store.
+            self.progress_chehged.emit("Создаём путь сохранения...", current_step)
+            storage_kind, version_path = self._find_version_storage(group, version)
+            dst_root = Path(save_path) / f"{group} {version}"
 
-        Returns:
-            0 on success, 1 on error.
-        """
-        try:
-            encrypted_password = self._encrypt_string(new_password)
+            for rel_path in paths:
+                if (dst_root / rel_path).exists():
+                    self.show_notification.emit("error", f"Файл {dst_root / rel_path} уже существует.")
+                    return 1
 
-            with open(self.password_file_path, "w", encoding="utf-8") as f:
-                f.write(encrypted_password)
+            current_step += progress_step_size
+            self.progress_chehged.emit("Скачиваем файлы...", current_step)
+
+            if storage_kind == "files":
+                sources = [(rel_path, version_path / f"{rel_path}.enc") for rel_path in paths]
+                progress = self._create_progress_tracker(
+                    text="Скачиваем файлы...",
+                    total_bytes=sum(src.stat().st_size for _, src in sources),
+                    start_value=current_step,
+                )
+                progress.start()
+
+                cipher = self._get_file_cipher()
+                for rel_path, src in sources:
+                    self._check_cancelled()
+                    dst = dst_root / rel_path
+                    dst.parent.mkdir(parents=True, exist_ok=True)
+                    cipher.decrypt_file(src, dst, progress.advance)
+
+            elif storage_kind == "pack":
+                with PackReader(version_path, self._get_file_cipher()) as pack:
+                    entries = {entry.path: entry for entry in pack.entries}
+                    missing = [rel_path for rel_path in paths if rel_path not in entries]
+                    if missing:
+                        self.show_notification.emit("error", f"Файл {missing[0]} не найден в версии {version}.")
+                        return 1
+
+                    progress = self._create_progress_tracker(
+                        text="Скачиваем файлы...",
+                        total_bytes=sum(entries[rel_path].length for rel_path in paths),
+                        start_value=current_step,
+                    )
+                    progress.start()
+
+                    for rel_path in paths:
+                        self._check_cancelled()
+                        dst = dst_root / rel_path
+                        dst.parent.mkdir(parents=True, exist_ok=True)
+                        pack.extract(entries[rel_path], dst, progress.advance)
+
+            elif storage_kind == "dedup":
+                store = self._get_object_store(group)
+                entries = {entry.path: entry for entry in store.read_manifest(version_path)[1]}
+                missing = [rel_path for rel_path in paths if rel_path not in entries]
+                if missing:
+                    self.show_notification.emit("error", f"Файл {missing[0]} не найден в версии {version}.")
+                    return 1
+
+                progress = self._create_progress_tracker(
+                    text="Скачиваем файлы...",
+                    total_bytes=sum(entries[rel_path].size for rel_path in paths),
+                    start_value=current_step,
+                )
+                progress.start()
+
+                for rel_path in paths:
+                    self._check_cancelled()
+                    dst = dst_root / rel_path
+                    dst.parent.mkdir(parents=True, exist_ok=True)
+                    store.get(entries[rel_path].object_id, dst, progress.advance)
 
+            else:
+                self.show_notification.emit("error", f"Версия {version} не найдена в группе {group}.")
+                return 1
+
+            progress.finish()
+
+            self.progress_chehged.emit("Скачивание завершено.", 100)
+            self.show_notification.emit("info", f"Файлы сохранены в {dst_root}.")
             return 0
 
+        except OperationCancelled:
+            self.progress_chehged.emit("Скачивание отменено.", 0)
+            self.show_notification.emit("info", "Скачивание файлов отменено.")
+            return 1
+        except InvalidToken:
+            self.show_notification.emit(
+                "error",
+                "Ошибка дешифрования: ключ недействителен или данные повреждены.",
+            )
+            return 1
         except Exception as e:
             self.show_notification.emit(
                 "error",
-                "Произошла ошибка при смене пароля.\n"
+                "Произошла ошибка при скачивании файлов.\n"
                 f"Ошибка: {e}",
             )
             return 1
 
-    # === Threaded operations ===
+    def get_version_download_path(self, group: str, version: str, save_path: str | Path | None) -> Path | None:
+        """Return the folder a version is downloaded to.
 
-    def download_in_thread(self, group: str, file: str, save_path: str | Path | None) -> None:
-        """Run download operation in a separate thread."""
-        thread = threading.Thread(target=self._wrapper_download, args=(group, file, save_path))
-        thread.daemon = True
-        thread.start()
+        Args:
+            group: Group name.
+            version: Version name (without the .pack/.manifest extension).
+            save_path: Destination directory. If not set, Desktop is used.
 
-    def create_group_in_thread(self, group_name: str) -> None:
-        """Run create_new_group operation in a separate thread."""
-        thread = threading.Thread(target=self._wrapper_create_new_group, args=(group_name,))
-        thread.daemon = True
-        thread.start()
+        Returns:
+            Path to "<group> <version>" in the destination directory, or None
+            for an instruction file or if there is no destination directory.
+        """
+        storage_kind, _ = self._find_version_storage(group, version)
+        if storage_kind is None:
+            return None
 
-    def add_version_in_thread(self, version_path: str, group_name: str) -> None:
-        """Run add_version operation in a separate thread."""
-        thread = threading.Thread(target=self._wrapper_add_version, args=(version_path, group_name))
-        thread.daemon = True
-        thread.start()
+        if not save_path:
+            save_path = self.get_desktop_path()
+            if not save_path:
+                return None
 
-    def add_instruction_in_thread(self, instruction_path: str, group_name: str) -> None:
-        """Run add_instruction operation in a separate thread."""
-        thread = threading.Thread(target=self._wrapper_add_instruction, args=(instruction_path, group_name))
-        thread.daemon = True
-        thread.start()
+        return Path(save_path) / f"{group} {version}"
 
-    def delete_group_in_thread(self, group_name: str) -> None:
-        """Run delete_group operation in a separate thread."""
-        thread = threading.Thread(target=self._wrapper_delete_group, args=(group_name,))
-        thread.daemon = True
-        thread.start()
+    def is_download_interrupted(self, download_path: Path) -> bool:
+        """Return True if a failed download of a version left a journal to resume it.
 
-    def delete_file_in_thread(self, data: list[str]) -> None:
-        """Run delete_file operation in a separate thread."""
-        thread = threading.Thread(target=self._wrapper_delete_file, args=(data,))
-        thread.daemon = True
-        thread.start()
+        Args:
+            download_path: Folder of the version, as returned by get_version_download_path().
+        """
+        return self._get_download_journal_path(download_path).is_file()
+
+    def sync_version(
+        self, group: str, version: str, save_path: str | Path | None, remove_stale: bool = False
+    ) -> int:
+        """Update an existing local copy of a version instead of downloading it again.
+
+        Local files are compared with the version by size and keyed hash,
+        read from the manifest, the table of contents of a pack or the index
+        of a folder version, so unchanged files are not read from the share.
+        Versions uploaded before the digests were stored are compared with
+        the decrypted content instead. Only differing files are decrypted, first into
+        a "~" staging folder next to the copy. The copy itself is changed
+        only when all of them are ready, by renaming the staged files into
+        place, so an interrupted sync leaves it as it was.
 
-    # === Internal helpers ===
+        Args:
+            group: Group name.
+            version: Version name (without the .pack/.manifest extension).
+            save_path: Destination directory. If not set, Desktop is used.
+            remove_stale: Delete local files that are not in the version.
+
+        Returns:
+            0 on success, 1 on error.
+        """
+        from cryptography.fernet import InvalidToken
+
+        stage_root: Path | None = None
+        try:
+            if not save_path:
+                save_path = self.get_desktop_path()
+                if not save_path or not Path(save_path).exists():
+                    return 1
+            elif not Path(save_path).exists():
+                self.show_notification.emit(
+                    "error",
+                    f"Директория {save_path} не существует.",
+                )
+                return 1
+
+            # A job cancelled while queued stops before touching the destination
+            self._check_cancelled()
+
+            progress_step_size = 100 // self.DOWNLOAD_PROGRESS_BAR_STEP
+            current_step = 0
+
+            self.progress_chehged.emit("Читаем оглавление версии...", current_step)
+            storage_kind, version_path = self._find_version_storage(group, version)
+            if storage_kind is None:
+                self.show_notification.emit("error", f"Версия {version} не найдена в группе {group}.")
+                return 1
+
+            dst_root = Path(save_path) / f"{group} {version}"
+            stage_root = Path(save_path) / f"~{group} {version}.sync"
+            # Leftovers of an interrupted sync
+            shutil.rmtree(stage_root, ignore_errors=True)
+
+            current_step += progress_step_size
+            workers = FilePipeline.resolve_workers(self.config_data.get("download_workers"))
+
+            if storage_kind == "dedup":
+                store = self._get_object_store(group)
+                directories, entries = store.read_manifest(version_path)
+                object_ids = {entry.path: entry.object_id for entry in entries}
+
+                def matches(rel_path: str, local_path: Path, progress: Callable[[int], None]) -> bool:
+                    return store.object_id(local_path, progress) == object_ids[rel_path]
+
+                def fetch(rel_path: str, dst: Path, progress: Callable[[int], None]) -> None:
+                    store.get(object_ids[rel_path], dst, progress)
+
+                result = self._sync_version_files(
+                    [(entry.path, entry.size) for entry in entries],
+                    directories, matches, fetch, workers,
+                    dst_root, stage_root, remove_stale, current_step,
+                )
+
+            elif storage_kind == "pack":
+                with PackReader(version_path, self._get_file_cipher()) as pack:
+                    pack_entries = {entry.path: entry for entry in pack.entries}
+
+                    def matches(rel_path: str, local_path: Path, progress: Callable[[int], None]) -> bool:
+                        if rel_path in pack.digests:
+                            return self._digest_file(local_path, progress) == pack.digests[rel_path]
+                        return self._same_content(pack.iter_file(pack_entries[rel_path]), local_path, progress)
+
+                    def fetch(rel_path: str, dst: Path, progress: Callable[[int], None]) -> None:
+                        pack.extract(pack_entries[rel_path], dst, progress)
+
+                    # The pack is read through one file handle, so files are processed one by one
+                    result = self._sync_version_files(
+                        [(entry.path, entry.size) for entry in pack.entries],
+                        pack.directories, matches, fetch, 1,
+                        dst_root, stage_root, remove_stale, current_step,
+                        stored_sizes={entry.path: entry.length for entry in pack.entries},
+                    )
+
+            else:
+                cipher = self._get_file_cipher()
+                directories: list[str] = []
+                files: list[tuple[str, int]] = []  # (relative path, size of the .enc file)
+                for root_path, names in self._walk_with_sizes(version_path):
+                    rel = root_path.relative_to(version_path).as_posix()
+                    prefix = "" if rel == "." else f"{rel}/"
+                    if prefix:
+                        directories.append(rel)
+                    files.extend((f"{prefix}{name[:-4]}", size) for name, size in names if name.endswith(".enc"))
+                encrypted_sizes = dict(files)
+
+                index = self._read_version_index(version_path)
+                if index is not None and set(index) == {rel_path for rel_path, _ in files}:
+                    def matches(rel_path: str, local_path: Path, progress: Callable[[int], None]) -> bool:
+                        return self._digest_file(local_path, progress) == index[rel_path][1]
+
+                    files = [(rel_path, index[rel_path][0]) for rel_path, _ in files]
+                    sizes_known = True
+                else:
+                    # Versions without a (matching) index are compared with the decrypted content
+                    def matches(rel_path: str, local_path: Path, progress: Callable[[int], None]) -> bool:
+                        with open(version_path / f"{rel_path}.enc", "rb") as src:
+                            return self._same_content(cipher.iter_decrypt(src), local_path, progress)
+
+                    # Plain sizes are unknown without decrypting, so every existing file is compared
+                    sizes_known = False
+
+                def fetch(rel_path: str, dst: Path, progress: Callable[[int], None]) -> None:
+                    cipher.decrypt_file(version_path / f"{rel_path}.enc", dst, progress)
+
+                result = self._sync_version_files(
+                    files, directories, matches, fetch, workers,
+                    dst_root, stage_root, remove_stale, current_step,
+                    sizes_known=sizes_known, stored_sizes=encrypted_sizes,
+                )
+
+            updated, removed, unchanged = result
+            self.progress_chehged.emit("Обновление завершено.", 100)
+            self.show_notification.emit(
+                "info",
+                f"Папка {dst_root} обновлена.\n"
+                f"Изменено файлов: {updated}, без изменений: {unchanged}, удалено: {removed}.",
+            )
+            return 0
+
+        except OperationCancelled:
+            self.progress_chehged.emit("Обновление отменено.", 0)
+            self.show_notification.emit("info", "Обновление отменено. Папка версии не изменена.")
+            return 1
+        except InvalidToken:
+            self.show_notification.emit(
+                "error",
+                "Ошибка дешифрования: ключ недействителен или данные повреждены.",
+            )
+            return 1
+        except Exception as e:
+            self.show_notification.emit(
+                "error",
+                "Произошла ошибка при обновлении папки версии.\n"
+                f"Ошибка: {e}",
+            )
+            return 1
+        finally:
+            if stage_root is not None:
+                shutil.rmtree(stage_root, ignore_errors=True)
+
+    def open_file(self, group: str, file: str) -> None:
+        """Decrypt and open a file in a temporary location.
+
+        This function decrypts the specified file into a temporary directory
+        and then opens it using the default system application. It is intended
+        for quickly viewing files like instructions without permanently saving them.
+
+        Decrypted files stay in the temporary directory as a cache keyed by
+        group, file name and the size and modification time of the encrypted
+        file, so opening the same unchanged file again does not read the
+        share. The cache is limited to instruction_cache_mb; the least
+        recently opened files are removed first. The temporary directory is
+        deleted when the program closes, so decrypted files do not outlive
+        the session and the cache lasts until then.
+
+        Args:
+            group: The name of the group containing the file.
+            file: The name of the file to open (without the .enc extension).
+        """
+        from cryptography.fernet import InvalidToken
+
+        try:
+            file_path = Path(self.config_data.get("versions_path")) / group / f"{file}.enc"
+
+            if not file_path.exists():
+                self.show_notification.emit("error", "Выбранный файл не существует на сервере.")
+                return
+
+            # A replaced file on the share gets a new key
+            stat = file_path.stat()
+            key_data = f"{group}\0{file}\0{stat.st_size}\0{stat.st_mtime_ns}".encode("utf-8")
+            cached_path = self._create_temp_folder() / hashlib.sha256(key_data).hexdigest()[:16] / file
+
+            if cached_path.is_file():
+                # Mark as recently opened
+                os.utime(cached_path)
+            else:
+                # Decrypt straight from the share, the file appears only when complete;
+                # a failed decryption must not leave a partial file in the cache
+                cached_path.parent.mkdir(exist_ok=True)
+                temp_path = cached_path.with_name(f"~{cached_path.name}.tmp")
+                try:
+                    self._get_file_cipher().decrypt_file(file_path, temp_path)
+                    os.replace(temp_path, cached_path)
+                except BaseException:
+                    temp_path.unlink(missing_ok=True)
+                    raise
+
+                self._evict_instruction_cache(cached_path)
+
+            # Open the decrypted file
+            subprocess.Popen(['start', '', cached_path], shell=True)
+        
+        except InvalidToken:
+            self.show_notification.emit(
+                "error",
+                "Ошибка дешифрования: ключ недействителен или данные повреждены.",
+            )
+            return
+        except Exception as e:
+            self.show_notification.emit("error", f"Произошла ошибка при открытии файла.\nОшибка: {e}")
+            return
+        
+    def delete_temp_folder(self, path: Path) -> None:
+        """Recursively delete the temporary folder.
+
+        Args:
+            path: The Path object representing the directory to delete.
+        """
+        try:
+            shutil.rmtree(path)
+
+        except Exception as e:
+            print("Ошибка: ", e)
+
+    # === Password management ===
+
+    def get_decrypted_password(self) -> str | None:
+        """Get and decrypt password from password.key.
+
+        Returns:
+            Decrypted password string or None if not available.
+        """
+        if not self.password_file_path.exists():
+            return None
+
+        try:
+            with open(self.password_file_path, "r", encoding="utf-8") as f:
+                encrypted_password = f.read().strip()
+
+            if not encrypted_password:
+                return None
+
+            return self._decrypt_string(encrypted_password)
+        except Exception:
+            return None
+
+    def set_password(self, new_password: str) -> int:
+        """Set new password in password.key using encryption.
+
+        Args:
+            new_password: Plain text password to store.
+
+        Returns:
+            0 on success, 1 on error.
+        """
+        try:
+            encrypted_password = self._encrypt_string(new_password)
+
+            with open(self.password_file_path, "w", encoding="utf-8") as f:
+                f.write(encrypted_password)
+
+            return 0
+
+        except Exception as e:
+            self.show_notification.emit(
+                "error",
+                "Произошла ошибка при смене пароля.\n"
+                f"Ошибка: {e}",
+            )
+            return 1
+
+    # === Threaded operations ===
+    # Operations run as jobs of the scheduler: downloads first, uploads last
+
+    def download_in_thread(self, group: str, file: str, save_path: str | Path | None) -> None:
+        """Queue download operation as a background job."""
+        self.job_scheduler.submit(
+            "download", f"Скачивание {group} {file}",
+            self._wrapper_download, group, file, save_path,
+            priority=JobScheduler.PRIORITY_HIGH, cancellable=True,
+        )
+
+    def extract_files_in_thread(
+        self, group: str, version: str, paths: list[str], save_path: str | Path | None
+    ) -> None:
+        """Queue extract_files operation as a background job."""
+        self.job_scheduler.submit(
+            "extract_files", f"Скачивание файлов {group} {version}",
+            self._wrapper_extract_files, group, version, paths, save_path,
+            priority=JobScheduler.PRIORITY_HIGH, cancellable=True,
+        )
+
+    def sync_version_in_thread(
+        self, group: str, version: str, save_path: str | Path | None, remove_stale: bool = False
+    ) -> None:
+        """Queue sync_version operation as a background job."""
+        self.job_scheduler.submit(
+            "sync_version", f"Обновление {group} {version}",
+            self._wrapper_sync_version, group, version, save_path, remove_stale,
+            priority=JobScheduler.PRIORITY_HIGH, cancellable=True,
+        )
+
+    def scan_in_thread(self, channel: str, query: str, *args) -> int:
+        """Run a catalog query on the scanning worker.
+
+        The result is delivered by the scan_finished signal, unless a newer
+        query was requested for the same channel in the meantime.
+
+        Args:
+            channel: Consumer of the result (e.g. "table", "group_names").
+            query: Name of a model method from SCAN_QUERIES.
+            *args: Positional arguments for the query.
+
+        Returns:
+            Generation of the query within its channel (see is_scan_current).
+        """
+        if query not in self.SCAN_QUERIES:
+            raise ValueError(f"Unknown catalog query: {query}")
+
+        return self.catalog_scanner.request(channel, query, getattr(self, query), *args)
+
+    def is_scan_current(self, channel: str, generation: int) -> bool:
+        """Check that a delivered query result is not superseded by a newer query."""
+        return self.catalog_scanner.is_current(channel, generation)
+
+    def create_group_in_thread(self, group_name: str) -> None:
+        """Queue create_new_group operation as a background job."""
+        self.job_scheduler.submit(
+            "create_group", f"Создание группы {group_name}",
+            self._wrapper_create_new_group, group_name,
+        )
+
+    def add_version_in_thread(self, version_path: str, group_name: str) -> None:
+        """Queue add_version operation as a background job."""
+        self.job_scheduler.submit(
+            "add_version", f"Добавление версии {Path(version_path).name} в {group_name}",
+            self._wrapper_add_version, version_path, group_name,
+            priority=JobScheduler.PRIORITY_LOW, cancellable=True,
+        )
+
+    def add_instruction_in_thread(self, instruction_path: str, group_name: str) -> None:
+        """Queue add_instruction operation as a background job."""
+        self.job_scheduler.submit(
+            "add_instruction", f"Добавление инструкции {Path(instruction_path).name} в {group_name}",
+            self._wrapper_add_instruction, instruction_path, group_name,
+            priority=JobScheduler.PRIORITY_LOW,
+        )
+
+    def delete_group_in_thread(self, group_name: str) -> None:
+        """Queue delete_group operation as a background job."""
+        self.job_scheduler.submit(
+            "delete_group", f"Удаление группы {group_name}",
+            self._wrapper_delete_group, group_name,
+            cancellable=True,
+        )
+
+    def delete_file_in_thread(self, data: list[str]) -> None:
+        """Queue delete_file operation as a background job."""
+        self.job_scheduler.submit(
+            "delete_file", f"Удаление {data[1]} из {data[0]}",
+            self._wrapper_delete_file, data,
+        )
+
+    # === Internal helpers ===
 
     def _load_config(self) -> dict | None:
         """Load configuration data from config.yaml in the base path.
@@ -898,6 +1823,1042 @@ class Model(QObject):
             )
             return None
 
+    def _get_catalog(self) -> Catalog | None:
+        """Return the built catalog, building it on first use.
+
+        Returns:
+            Catalog instance or None if the catalog cannot be used.
+        """
+        with self._catalog_lock:
+            if not self.catalog_enabled:
+                return None
+
+            if self.catalog is not None:
+                return self.catalog
+
+            # Other threads wait here until the catalog is built, instead of building it again
+            try:
+                versions_path = Path(self.config_data.get("versions_path"))
+                if not versions_path.exists():
+                    return None
+
+                catalog = Catalog(versions_path)
+                if not catalog.is_built():
+                    self.catalog = catalog
+                    if self.rebuild_catalog() != 0:
+                        return None
+                else:
+                    # The catalog may have been built by another client long ago
+                    self.catalog = catalog
+                    self._refresh_catalog(catalog)
+
+                return self.catalog
+
+            except (sqlite3.Error, OSError):
+                self._disable_catalog()
+                return None
+
+    def _disable_catalog(self) -> None:
+        """Stop using the catalog and fall back to listing directories."""
+        with self._catalog_lock:
+            self.catalog = None
+            self.catalog_enabled = False
+            self.search_index.clear()
+
+    def _get_search_index(self) -> SearchIndex:
+        """Return the search index, building it from the catalog on first use."""
+        if not self.search_index.is_built:
+            groups_versions = self._get_all_groups_versions()
+            actual_versions = {
+                group_name: actual_version
+                for group_name, actual_version in self.get_groups_actual_versions()
+            }
+            self.search_index.build(groups_versions, actual_versions)
+
+        return self.search_index
+
+    def _update_search_index_group(
+        self, group_name: str, versions: list[str] | None, actual_version: str | None
+    ) -> None:
+        """Apply a rescanned group to the search index if it has been built.
+
+        Args:
+            group_name: Name of the group.
+            versions: New versions of the group, or None if the group was removed.
+            actual_version: New actual version of the group.
+        """
+        if not self.search_index.is_built:
+            return
+
+        if versions is None:
+            self.search_index.remove_group(group_name)
+        else:
+            self.search_index.update_group(group_name, versions, actual_version)
+
+    def _update_catalog_group(self, group_name: str) -> None:
+        """Rescan one group and store its versions in the catalog.
+
+        If the group directory no longer exists, the group is removed.
+
+        Args:
+            group_name: Name of the changed group.
+        """
+        catalog = self._get_catalog()
+        if catalog is None:
+            # Without the catalog the index is rebuilt by directory listing on next search
+            self.search_index.clear()
+            return
+
+        try:
+            group_path = Path(self.config_data.get("versions_path")) / group_name
+            if group_path.is_dir():
+                mtime_ns = self._get_group_mtime_ns(group_path)
+                versions = self._scan_group_versions(group_name)
+                actual_version = self.get_actual_version(versions)
+                catalog.replace_group(group_name, versions, actual_version, mtime_ns)
+                self._clear_recent_snapshots(catalog, {group_name: mtime_ns})
+                self._update_search_index_group(group_name, versions, actual_version)
+            else:
+                catalog.remove_group(group_name)
+                self._update_search_index_group(group_name, None, None)
+
+        except sqlite3.Error:
+            self._disable_catalog()
+
+    def _refresh_catalog(self, catalog: Catalog) -> list[str]:
+        """Rescan groups whose directory mtime changed since the last pass.
+
+        Args:
+            catalog: Catalog to refresh.
+
+        Returns:
+            Names of groups that were rescanned or removed.
+        """
+        try:
+            versions_path = Path(self.config_data.get("versions_path"))
+            snapshots = catalog.get_snapshots()
+
+            # One listing of the versions directory gives mtimes of all groups
+            current: dict[str, int] = {}
+            with os.scandir(versions_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith("~"):
+                        continue
+                    current[entry.name] = entry.stat().st_mtime_ns
+
+            changed: dict[str, tuple[list[str], str | None, int | None]] = {}
+            for group_name, mtime_ns in current.items():
+                if mtime_ns == snapshots.get(group_name):
+                    continue
+
+                versions = self._scan_group_versions(group_name)
+                changed[group_name] = (versions, self.get_actual_version(versions), mtime_ns)
+
+            removed = [name for name in snapshots if name not in current]
+
+            if changed or removed:
+                catalog.apply_changes(changed, removed)
+                self._clear_recent_snapshots(
+                    catalog, {group_name: mtime_ns for group_name, (_, _, mtime_ns) in changed.items()}
+                )
+
+                for group_name, (versions, actual_version, _) in changed.items():
+                    self._update_search_index_group(group_name, versions, actual_version)
+                for group_name in removed:
+                    self._update_search_index_group(group_name, None, None)
+
+            return list(changed) + removed
+
+        except sqlite3.Error:
+            self._disable_catalog()
+            return []
+        except OSError:
+            return []
+
+    def _get_group_mtime_ns(self, group_path: Path) -> int | None:
+        """Return modification time of a group directory in ns (None if it cannot be read)."""
+        try:
+            return group_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _clear_recent_snapshots(self, catalog: Catalog, mtimes: dict[str, int | None]) -> None:
+        """Clear just written snapshots whose mtime is too recent to rely on.
+
+        A group changed again within the same timestamp tick keeps its mtime,
+        so such a snapshot would hide the change; a cleared snapshot is
+        rescanned on the next refresh. The time of the share is the mtime of
+        the catalog file just written, so the local clock does not have to
+        agree with the clock of the server.
+
+        Args:
+            catalog: Catalog the snapshots were written to.
+            mtimes: Group name -> mtime of the group directory in ns stored in the snapshot.
+        """
+        share_time_ns = catalog.path.stat().st_mtime_ns
+        recent = [
+            group_name for group_name, mtime_ns in mtimes.items()
+            if mtime_ns is not None and share_time_ns - mtime_ns < self.CATALOG_MTIME_GRANULARITY_NS
+        ]
+        if recent:
+            catalog.clear_snapshots(recent)
+
+    def _scan_groups_names(self, path_to_groups: Path) -> list[str]:
+        """List group names directly from the versions directory.
+
+        Service entries (starting with "~", e.g. the catalog file) are skipped.
+
+        Args:
+            path_to_groups: Path to the versions directory.
+
+        Returns:
+            Sorted list of group names.
+        """
+        groups_names = [
+            p.name for p in path_to_groups.iterdir() if not p.name.startswith("~")
+        ]
+        return sorted(groups_names)
+
+    def _get_all_groups_versions(self) -> dict[str, list[str]]:
+        """Return mapping group name -> versions (newest first) for all groups."""
+        try:
+            catalog = self._get_catalog()
+            if catalog is not None:
+                return catalog.get_all_versions()
+
+        except sqlite3.Error:
+            self._disable_catalog()
+
+        return {group: self.get_group_versions(group) for group in self.get_groups_names()}
+
+    def _walk_with_sizes(self, top: Path) -> Iterator[tuple[Path, list[tuple[str, int]]]]:
+        """Walk a directory tree top-down, yielding file names with sizes.
+
+        Sizes come from the directory listing (free on Windows/SMB),
+        so no extra request per file is made.
+
+        Args:
+            top: Root directory.
+
+        Yields:
+            (directory path, [(file name, size in bytes), ...]); a directory
+            is always yielded before its subdirectories.
+        """
+        pending = [Path(top)]
+        while pending:
+            directory = pending.pop()
+            files: list[tuple[str, int]] = []
+
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.is_file():
+                        files.append((entry.name, entry.stat().st_size))
+
+            yield directory, files
+
+    def _get_storage_mode(self) -> str:
+        """Return how new versions are stored: "files", "pack" or "dedup"."""
+        storage_mode = self.config_data.get("storage_mode")
+        return storage_mode if storage_mode in ("pack", "dedup") else "files"
+
+    def _find_version_storage(self, group: str, version: str) -> tuple[str | None, Path | None]:
+        """Find how a version is stored on the share.
+
+        Args:
+            group: Group name.
+            version: Version name without storage extension.
+
+        Returns:
+            (storage kind, path): "files" with the version folder, "pack" with
+            the pack file, "dedup" with the manifest file, or (None, None).
+        """
+        version_path = Path(self.config_data.get("versions_path")) / group / version
+        if version_path.is_dir():
+            return "files", version_path
+
+        for storage_kind, extension in (("pack", VersionPack.EXTENSION), ("dedup", ObjectStore.MANIFEST_EXTENSION)):
+            path = version_path.with_name(f"{version}{extension}")
+            if path.is_file():
+                return storage_kind, path
+
+        return None, None
+
+    def _choose_compression(self, group_name: str, src_path: Path, size: int) -> str | None:
+        """Choose the compression codec for a file being added.
+
+        The codec comes from the compression setting, overridden per group by
+        compression_groups. Already compressed formats are skipped by
+        extension; for files larger than the sample size, the beginning of
+        the file is test-compressed and the file is stored as is if it does
+        not shrink enough.
+
+        Args:
+            group_name: Name of the target group.
+            src_path: Path to the source file.
+            size: Size of the source file in bytes.
+
+        Returns:
+            Codec name from FileCipher.CODECS, or None to store without compression.
+        """
+        group_codecs = self.config_data.get("compression_groups") or {}
+        codec = group_codecs.get(group_name, self.config_data.get("compression"))
+        if codec not in FileCipher.CODECS:
+            return None
+
+        if src_path.suffix.lower() in self.COMPRESSED_EXTENSIONS:
+            return None
+
+        if size > self.COMPRESSION_SAMPLE_SIZE:
+            with open(src_path, "rb") as src:
+                sample = src.read(self.COMPRESSION_SAMPLE_SIZE)
+            if len(zlib.compress(sample, 1)) > len(sample) * self.COMPRESSION_MIN_RATIO:
+                return None
+
+        return codec
+
+    def _get_version_cache(self) -> VersionCache | None:
+        """Return the local cache of downloaded versions, or None if it is disabled."""
+        cache_mb = self.config_data.get("version_cache_mb")
+        if not isinstance(cache_mb, int) or cache_mb <= 0:
+            return None
+
+        cache_path = self.config_data.get("version_cache_path")
+        if not cache_path:
+            cache_path = Path.home() / "AppData" / "Local" / "filearchive_cache" / "versions"
+        return VersionCache(cache_path, self._get_file_cipher(), cache_mb * 1024 * 1024)
+
+    def _extract_cached_version(self, cache: VersionCache, cache_key: str, dst_path: Path) -> bool:
+        """Decrypt a version from the local cache.
+
+        Args:
+            cache: Local version cache.
+            cache_key: Cache key of the version.
+            dst_path: Destination folder of the version (must not exist).
+
+        Returns:
+            True on success; False if the destination exists or the cache
+            entry cannot be read, so the version is downloaded from the share.
+        """
+        if dst_path.exists():
+            return False
+
+        self.progress_chehged.emit("Копируем файлы из локального кэша...", 0)
+        try:
+            progress = self._create_progress_tracker(
+                text="Копируем файлы из локального кэша...",
+                total_bytes=cache.cached_length(cache_key),
+            )
+            progress.start()
+
+            dst_path.mkdir(parents=True)
+            cache.extract(cache_key, dst_path, progress.advance)
+            progress.finish()
+            return True
+
+        except OperationCancelled:
+            shutil.rmtree(dst_path, ignore_errors=True)
+            raise
+        except Exception:
+            # A damaged entry is deleted by the cache; the version is read from the share
+            shutil.rmtree(dst_path, ignore_errors=True)
+            return False
+
+    def _store_cached_version(self, cache: VersionCache, cache_key: str, src_path: Path) -> None:
+        """Keep a downloaded version in the local cache.
+
+        The download is complete at this point: a version larger than the
+        cache is skipped, and a failure or a cancellation of the job only
+        leaves the version uncached.
+
+        Args:
+            cache: Local version cache.
+            cache_key: Cache key of the version.
+            src_path: Downloaded folder of the version.
+        """
+        try:
+            total_bytes = sum(size for _, files in self._walk_with_sizes(src_path) for _, size in files)
+            if total_bytes > cache.max_bytes:
+                return
+
+            progress = self._create_progress_tracker(
+                text="Сохраняем версию в локальный кэш...",
+                total_bytes=total_bytes,
+            )
+            progress.start()
+            cache.store(cache_key, src_path, progress.advance)
+            progress.finish()
+
+        except Exception:
+            # Also a cancellation (OperationCancelled); the cache removes its partial entry
+            pass
+
+    def _get_version_fingerprint(self, storage_kind: str, storage_path: Path) -> str:
+        """Return a fingerprint of a stored version that changes when the version changes.
+
+        Args:
+            storage_kind: "files", "pack" or "dedup", as returned by _find_version_storage.
+            storage_path: Version folder, pack file or manifest file.
+
+        Returns:
+            Hex digest: of the manifest content for "dedup", of the size and
+            modification time of the pack for "pack", of the file listing with
+            sizes and modification times for "files" (both come with the
+            listing, so no request per file is made). The size of an .enc file
+            depends only on the size of the original, so a version re-uploaded
+            under the same name with a small fix differs only in mtimes.
+        """
+        digest = hashlib.sha256(storage_kind.encode("ascii"))
+
+        if storage_kind == "dedup":
+            with open(storage_path, "rb") as f:
+                digest.update(f.read())
+
+        elif storage_kind == "pack":
+            stat = storage_path.stat()
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode("ascii"))
+
+        else:
+            listing: list[tuple[str, int, int]] = []  # (relative path, size, mtime)
+            pending = [storage_path]
+            while pending:
+                directory = pending.pop()
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(Path(entry.path))
+                        elif entry.is_file():
+                            stat = entry.stat()
+                            rel = Path(entry.path).relative_to(storage_path).as_posix()
+                            listing.append((rel, stat.st_size, stat.st_mtime_ns))
+
+            for rel, size, mtime_ns in sorted(listing):
+                digest.update(f"{rel}:{size}:{mtime_ns}\0".encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def _get_object_store(self, group: str) -> ObjectStore:
+        """Return the object store of a group."""
+        store_path = Path(self.config_data.get("versions_path")) / group / ObjectStore.DIR_NAME
+        max_chain_length = self.config_data.get("delta_max_chain")
+        return ObjectStore(
+            store_path,
+            self._get_file_cipher(),
+            block_size=self.DELTA_BLOCK_SIZE,
+            max_chain_length=max_chain_length if isinstance(max_chain_length, int) else 5,
+        )
+
+    def _get_previous_version_objects(self, group_name: str, store: ObjectStore) -> dict[str, str]:
+        """Return object ids by relative path of the actual "dedup" version of a group.
+
+        Args:
+            group_name: Group name.
+            store: Object store of the group.
+
+        Returns:
+            Mapping of relative file paths to object ids, empty if the group
+            has no "dedup" version.
+        """
+        manifests = [
+            version for version in self._scan_group_versions(group_name)
+            if version.endswith(ObjectStore.MANIFEST_EXTENSION)
+        ]
+        previous_version = self.get_actual_version(manifests)
+        if previous_version is None:
+            return {}
+
+        group_path = Path(self.config_data.get("versions_path")) / group_name
+        _, entries = store.read_manifest(group_path / previous_version)
+        return {entry.path: entry.object_id for entry in entries}
+
+    def _store_version_objects(
+        self,
+        group_name: str,
+        src_path: Path,
+        tree: list[tuple[Path, list[tuple[str, int]]]],
+        total_bytes: int,
+        manifest_path: Path,
+        start_value: int,
+    ) -> None:
+        """Store a version folder in the group object store and write its manifest.
+
+        Files are hashed first; only contents that are not stored yet are
+        encrypted and uploaded. With delta_encoding enabled, a changed large
+        file is stored as a delta against the same path in the previous
+        version when that is smaller. The manifest is written last, so the
+        version appears only when all its objects are in place.
+
+        Args:
+            group_name: Name of the target group.
+            src_path: Source directory of the version.
+            tree: Pre-scanned tree of the source, as yielded by _walk_with_sizes.
+            total_bytes: Total size of the source files.
+            manifest_path: Path to the resulting manifest.
+            start_value: Progress value at the start of the operation.
+        """
+        store = self._get_object_store(group_name)
+        workers = FilePipeline.resolve_workers(self.config_data.get("encryption_workers"))
+
+        directories: list[str] = []
+        files: list[tuple[str, Path, int]] = []  # (relative path, source path, size)
+        for root_path, names in tree:
+            rel = root_path.relative_to(src_path).as_posix()
+            prefix = "" if rel == "." else f"{rel}/"
+            if prefix:
+                directories.append(rel)
+            files.extend((f"{prefix}{name}", root_path / name, size) for name, size in names)
+
+        # Stage 1: content ids of all files (local reads only)
+        middle_value = (start_value + 100) // 2
+        progress = self._create_progress_tracker(
+            text="Проверяем файлы...",
+            total_bytes=total_bytes,
+            start_value=start_value,
+            end_value=middle_value,
+        )
+        progress.start()
+
+        object_ids: list[str | None] = [None] * len(files)
+
+        def hash_file(index: int, path: Path) -> None:
+            object_ids[index] = store.object_id(path, progress.advance)
+
+        with FilePipeline(workers=workers) as pipeline:
+            for index, (_, path, _) in enumerate(files):
+                pipeline.submit(hash_file, index, path)
+
+        # Stage 2: upload contents the store does not have yet. Reused objects are touched,
+        # so a concurrent garbage collection keeps them until the manifest refers to them;
+        # an object deleted meanwhile is uploaded again
+        new_files: dict[str, tuple[str, Path, int]] = {}
+        reused_ids: set[str] = set()
+        for object_id, (rel_path, path, size) in zip(object_ids, files):
+            if object_id in new_files or object_id in reused_ids:
+                continue
+            if store.has_object(object_id) and store.touch(object_id):
+                reused_ids.add(object_id)
+            else:
+                new_files[object_id] = (rel_path, path, size)
+
+        use_delta = bool(self.config_data.get("delta_encoding"))
+        previous_objects = self._get_previous_version_objects(group_name, store) if use_delta and new_files else {}
+
+        progress = self._create_progress_tracker(
+            text="Копируем и шифруем новые файлы...",
+            total_bytes=sum(size for _, _, size in new_files.values()),
+            start_value=middle_value,
+        )
+        progress.start()
+
+        with FilePipeline(workers=workers) as pipeline:
+            for object_id, (rel_path, path, size) in new_files.items():
+                compression = self._choose_compression(group_name, path, size)
+                use_file_delta = use_delta and size >= self.DELTA_MIN_FILE_SIZE
+                pipeline.submit(
+                    self._put_version_object,
+                    store,
+                    object_id,
+                    path,
+                    previous_objects.get(rel_path) if use_file_delta else None,
+                    use_file_delta,
+                    progress.advance,
+                    compression,
+                )
+
+        progress.finish()
+
+        entries = [
+            ManifestEntry(rel_path, object_id, size)
+            for object_id, (rel_path, _, size) in zip(object_ids, files)
+        ]
+        store.write_manifest(manifest_path, directories, entries)
+
+    def _put_version_object(
+        self,
+        store: ObjectStore,
+        object_id: str,
+        src_path: Path,
+        base_id: str | None,
+        with_signature: bool,
+        progress: Callable[[int], None],
+        compression: str | None,
+    ) -> None:
+        """Store one new file of a version, as a delta if possible.
+
+        Args:
+            store: Object store of the group.
+            object_id: Id of the file content.
+            src_path: Path to the source file.
+            base_id: Object id of the same path in the previous version, or None.
+            with_signature: Whether to store a block signature for later deltas.
+            progress: Callback receiving the number of source bytes processed.
+            compression: Codec from FileCipher.CODECS, or None.
+        """
+        if base_id is None or not store.put_delta(object_id, src_path, base_id, progress, compression):
+            # Full snapshot: no base, the chain is too long or the file changed too much
+            store.put(object_id, src_path, progress, compression)
+
+        if with_signature:
+            store.put_signature(object_id, src_path)
+
+    def _sync_version_files(
+        self,
+        files: list[tuple[str, int]],
+        directories: list[str],
+        matches: Callable[[str, Path, Callable[[int], None]], bool],
+        fetch: Callable[[str, Path, Callable[[int], None]], None],
+        workers: int,
+        dst_root: Path,
+        stage_root: Path,
+        remove_stale: bool,
+        start_value: int,
+        sizes_known: bool = True,
+        stored_sizes: dict[str, int] | None = None,
+    ) -> tuple[int, int, int]:
+        """Bring a local copy of a version in line with the version (see sync_version).
+
+        Args:
+            files: (relative path, size) of the files of the version.
+            directories: Relative paths of the directories of the version.
+            matches: matches(relative path, local path, progress) -> True if the local file is up to date.
+            fetch: fetch(relative path, destination, progress) decrypts a file of the version.
+            workers: Number of files processed at the same time.
+            dst_root: Local copy of the version.
+            stage_root: Staging folder for decrypted files (on the same disk as dst_root).
+            remove_stale: Delete local files that are not in the version.
+            start_value: Progress value at the start of the comparison.
+            sizes_known: Whether the sizes are plain file sizes (a differing size means a changed file).
+            stored_sizes: Stored (encrypted) sizes of the files, if the progress of fetch
+                counts stored bytes; by default it counts the sizes from files.
+
+        Returns:
+            (updated files, removed files, unchanged files).
+        """
+        # Stage 1: find files that differ from the version
+        changed: list[tuple[str, int]] = []
+        candidates: list[tuple[str, int, Path]] = []
+        for rel_path, size in files:
+            local_path = dst_root / rel_path
+            if not local_path.is_file() or (sizes_known and local_path.stat().st_size != size):
+                changed.append((rel_path, size))
+            else:
+                candidates.append((rel_path, size, local_path))
+
+        middle_value = (start_value + 100) // 2
+        progress = self._create_progress_tracker(
+            text="Сравниваем файлы...",
+            total_bytes=sum(local_path.stat().st_size for _, _, local_path in candidates),
+            start_value=start_value,
+            end_value=middle_value,
+        )
+        progress.start()
+
+        same = [False] * len(candidates)
+
+        def compare(index: int, rel_path: str, local_path: Path) -> None:
+            same[index] = matches(rel_path, local_path, progress.advance)
+
+        with FilePipeline(workers=workers) as pipeline:
+            for index, (rel_path, _, local_path) in enumerate(candidates):
+                pipeline.submit(compare, index, rel_path, local_path)
+
+        changed.extend((rel_path, size) for (rel_path, size, _), is_same in zip(candidates, same) if not is_same)
+
+        # Stage 2: decrypt the differing files into the staging folder
+        progress = self._create_progress_tracker(
+            text="Скачиваем изменённые файлы...",
+            total_bytes=sum(stored_sizes[rel_path] if stored_sizes else size for rel_path, size in changed),
+            start_value=middle_value,
+        )
+        progress.start()
+
+        in_flight_mb = self.config_data.get("download_in_flight_mb") or 256
+        with FilePipeline(workers=workers, max_in_flight_bytes=in_flight_mb * 1024 * 1024) as pipeline:
+            for rel_path, size in changed:
+                staged_path = stage_root / rel_path
+                staged_path.parent.mkdir(parents=True, exist_ok=True)
+                pipeline.submit(fetch, rel_path, staged_path, progress.advance, size=size)
+
+        progress.finish()
+
+        # Stage 3: apply the changes; only renames and deletions from here on
+        stale: list[str] = []
+        if remove_stale and dst_root.is_dir():
+            version_files = {rel_path for rel_path, _ in files}
+            for root_path, names in self._walk_with_sizes(dst_root):
+                rel = root_path.relative_to(dst_root).as_posix()
+                prefix = "" if rel == "." else f"{rel}/"
+                stale.extend(f"{prefix}{name}" for name, _ in names if f"{prefix}{name}" not in version_files)
+
+        dst_root.mkdir(parents=True, exist_ok=True)
+        for rel_path in directories:
+            (dst_root / rel_path).mkdir(parents=True, exist_ok=True)
+
+        for rel_path, _ in changed:
+            dst_path = dst_root / rel_path
+            dst_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(stage_root / rel_path, dst_path)
+
+        for rel_path in stale:
+            (dst_root / rel_path).unlink()
+
+        return len(changed), len(stale), len(files) - len(changed)
+
+    def _same_content(
+        self, pieces: Iterator[bytes], local_path: Path, progress: Callable[[int], None] | None = None
+    ) -> bool:
+        """Compare decrypted pieces of a file with a local file, stopping at the first difference.
+
+        Args:
+            pieces: Plaintext pieces, as yielded by FileCipher.iter_decrypt().
+            local_path: Path to the local file.
+            progress: Callback receiving the number of local bytes compared.
+        """
+        with open(local_path, "rb") as local:
+            for piece in pieces:
+                data = local.read(len(piece))
+                if progress is not None:
+                    progress(len(data))
+                if data != piece:
+                    return False
+            return not local.read(1)
+
+    def _get_content_digest_key(self) -> bytes:
+        """Return the key of the content digests, derived from the archive key.
+
+        The stored digests tell nothing about the contents without the key.
+        """
+        return self._get_file_cipher().derive_key(b"file-archive/content-digest-v1")
+
+    def _new_content_digest(self) -> hashlib.blake2b:
+        """Return a hash object for the content digests stored with the versions and journals."""
+        return hashlib.blake2b(key=self._get_content_digest_key(), digest_size=32)
+
+    def _digest_file(self, path: Path, progress: Callable[[int], None] | None = None) -> str:
+        """Return the content digest of a local file (see _new_content_digest).
+
+        Args:
+            path: Path to the file.
+            progress: Callback receiving the number of bytes read.
+        """
+        digest = self._new_content_digest()
+        with open(path, "rb") as file:
+            while data := file.read(1024 * 1024):
+                digest.update(data)
+                if progress is not None:
+                    progress(len(data))
+        return digest.hexdigest()
+
+    def _write_version_index(self, version_path: Path, files: dict[str, list]) -> None:
+        """Write the encrypted index of a folder version.
+
+        Args:
+            version_path: Folder of the version.
+            files: Relative path -> [plain size, content digest] of every file.
+        """
+        data = json.dumps({"files": files}, ensure_ascii=False).encode("utf-8")
+        (version_path / self.VERSION_INDEX_NAME).write_bytes(self._get_file_cipher().encrypt_bytes(data))
+
+    def _read_version_index(self, version_path: Path) -> dict[str, list] | None:
+        """Read the index of a folder version.
+
+        Args:
+            version_path: Folder of the version.
+
+        Returns:
+            Relative path -> [plain size, content digest], or None if the version
+            has no index (uploaded by an older program) or it cannot be read.
+        """
+        from cryptography.fernet import InvalidToken
+
+        try:
+            data = self._get_file_cipher().decrypt_bytes((version_path / self.VERSION_INDEX_NAME).read_bytes())
+            return json.loads(data.decode("utf-8"))["files"]
+        except (OSError, InvalidToken, ValueError, KeyError):
+            return None
+
+    def _collect_group_garbage(self, group: str) -> None:
+        """Delete objects of a group that no remaining manifest refers to.
+
+        If any manifest cannot be read, nothing is deleted.
+
+        Args:
+            group: Group name.
+        """
+        group_path = Path(self.config_data.get("versions_path")) / group
+        store = self._get_object_store(group)
+
+        referenced_ids: set[str] = set()
+        for manifest_path in group_path.glob(f"*{ObjectStore.MANIFEST_EXTENSION}"):
+            if manifest_path.name.startswith("~"):
+                continue
+            _, entries = store.read_manifest(manifest_path)
+            referenced_ids.update(entry.object_id for entry in entries)
+
+        store.collect_garbage(referenced_ids, self.OBJECT_GC_GRACE_SECONDS)
+
+    def _write_version_pack(
+        self,
+        group_name: str,
+        src_path: Path,
+        tree: list[tuple[Path, list[tuple[str, int]]]],
+        pack_path: Path,
+        progress: Callable[[int], None] | None = None,
+    ) -> None:
+        """Encrypt a version folder into a single pack file.
+
+        The pack is written under a service name ("~" prefix, skipped when
+        listing versions) and renamed when complete, so an interrupted upload
+        never shows up as a version. Every PACK_JOURNAL_INTERVAL bytes the
+        written entries are committed to a TransferJournal; a failed upload
+        keeps the partial pack, and the next attempt truncates it after the
+        committed entries and appends only the remaining files. A cancelled
+        upload deletes both.
+
+        Args:
+            group_name: Name of the target group.
+            src_path: Source directory of the version.
+            tree: Pre-scanned tree of the source, as yielded by _walk_with_sizes.
+            pack_path: Path to the resulting pack file.
+            progress: Callback receiving the number of processed source bytes.
+        """
+        temp_path = pack_path.with_name(f"~{pack_path.name}.tmp")
+        journal = self._get_transfer_journal(temp_path.with_name(temp_path.name + TransferJournal.EXTENSION))
+
+        files: list[tuple[str, Path, int]] = []  # (relative path, source path, size)
+        directories: list[str] = []
+        for root_path, names in tree:
+            rel = root_path.relative_to(src_path).as_posix()
+            prefix = "" if rel == "." else f"{rel}/"
+            if prefix:
+                directories.append(rel)
+            files.extend((f"{prefix}{name}", root_path / name, size) for name, size in names)
+
+        resume_offset, committed = self._load_pack_journal(journal, temp_path, files)
+        if resume_offset is None:
+            # Records of an unusable previous attempt
+            journal.remove()
+        digests = {rel_path: journal.get(rel_path)["digest"] for rel_path in committed}
+
+        try:
+            with PackWriter(
+                temp_path, self._get_file_cipher(), resume_offset, list(committed.values()), digests
+            ) as pack:
+                for rel_path in directories:
+                    pack.add_directory(rel_path)
+
+                pending: list[tuple[PackEntry, Path, str]] = []
+                journaled_offset = pack.offset
+                for rel_path, src_file, size in files:
+                    if rel_path in committed:
+                        if progress is not None:
+                            progress(size)
+                        continue
+
+                    compression = self._choose_compression(group_name, src_file, size)
+                    digest = journal.new_digest()
+                    entry = pack.add_file(rel_path, src_file, progress, compression, digest)
+                    pending.append((entry, src_file, digest.hexdigest()))
+
+                    if pack.offset - journaled_offset >= self.PACK_JOURNAL_INTERVAL:
+                        # Entries are journaled only once their data has left the buffer
+                        pack.flush()
+                        for entry, entry_src, entry_digest in pending:
+                            journal.record(entry.path, entry_src, entry_digest, offset=entry.offset, length=entry.length)
+                        pending = []
+                        journaled_offset = pack.offset
+
+            os.replace(temp_path, pack_path)
+            journal.remove()
+
+        except OperationCancelled:
+            journal.remove()
+            temp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            journal.close()
+
+    def _load_pack_journal(
+        self, journal: TransferJournal, temp_path: Path, files: list[tuple[str, Path, int]]
+    ) -> tuple[int | None, dict[str, PackEntry]]:
+        """Find the entries of an interrupted pack upload that can be kept.
+
+        Args:
+            journal: Journal of the pack upload.
+            temp_path: Partial pack file.
+            files: (relative path, source path, size) of the files of the version.
+
+        Returns:
+            (offset to continue writing at, entries whose source did not change
+            by relative path), or (None, {}) to write the pack from scratch.
+        """
+        if not journal.load() or not temp_path.is_file():
+            return None, {}
+
+        files_by_key = {journal.path_key(rel_path): (rel_path, src) for rel_path, src, _ in files}
+        resume_offset = VersionPack.HEADER_STRUCT.size
+        committed: dict[str, PackEntry] = {}
+        for record in journal.records:
+            resume_offset = max(resume_offset, record["offset"] + record["length"])
+            rel_path, src = files_by_key.get(record["key"], (None, None))
+            # Entries of changed or removed files stay in the pack as unreferenced data
+            if rel_path is not None and journal.is_committed(rel_path, src):
+                committed[rel_path] = PackEntry(rel_path, record["offset"], record["length"], record["size"])
+
+        if resume_offset > temp_path.stat().st_size:
+            # The journal is ahead of the data that reached the share
+            return None, {}
+        return resume_offset, committed
+
+    def _get_transfer_journal(self, path: Path) -> TransferJournal:
+        """Return a transfer journal keyed with the content digest key.
+
+        Journal records then hold the same digests as the version indexes,
+        so a resumed upload takes the digests of skipped files from the journal.
+        """
+        return TransferJournal(path, self._get_content_digest_key())
+
+    def _get_download_journal_path(self, dst_path: Path) -> Path:
+        """Return the journal path of a version download (next to the version folder)."""
+        return dst_path.with_name(f"~{dst_path.name}{TransferJournal.EXTENSION}")
+
+    def _open_download_journal(self, dst_path: Path) -> TransferJournal | None:
+        """Open the journal of a version download.
+
+        A new download needs a free destination; an existing folder is only
+        accepted together with the journal of an interrupted download.
+
+        Args:
+            dst_path: Destination folder of the version.
+
+        Returns:
+            Loaded journal, or None (with a notification) if the folder exists
+            and is not an interrupted download.
+        """
+        journal = self._get_transfer_journal(self._get_download_journal_path(dst_path))
+        if dst_path.exists():
+            if not journal.load():
+                self.show_notification.emit(
+                    "error",
+                    f"Директория {dst_path} уже существует.",
+                )
+                return None
+            self.progress_chehged.emit("Продолжаем прерванное скачивание...", 0)
+        else:
+            # A journal without the folder is a leftover of a removed download
+            journal.remove()
+        return journal
+
+    def _run_journaled(
+        self,
+        journal: TransferJournal,
+        rel_path: str,
+        local_path: Path,
+        target_path: Path,
+        size: int,
+        progress: Callable[[int], None],
+        fn: Callable,
+        *args,
+    ) -> str:
+        """Transfer one file unless the journal shows it was transferred already.
+
+        fn receives a digest keyword argument, a hash to update with the plain
+        content of the file while it is transferred, so the journal records the
+        hash without reading the file again.
+
+        Args:
+            journal: Journal of the transfer.
+            rel_path: Relative path of the file in the transfer.
+            local_path: Local side of the transfer (source of an upload, destination of a download).
+            target_path: Written file, which must still exist to skip the transfer.
+            size: Amount of progress the file accounts for.
+            progress: Progress callback, advanced by size for a skipped file.
+            fn: Function transferring the file.
+            *args: Positional arguments for fn.
+
+        Returns:
+            Content digest of the file (see _new_content_digest), from the
+            journal for a skipped file.
+        """
+        if target_path.exists() and journal.is_committed(rel_path, local_path):
+            progress(size)
+            return journal.get(rel_path)["digest"]
+
+        digest = journal.new_digest()
+        fn(*args, digest=digest)
+        hexdigest = digest.hexdigest()
+        journal.record(rel_path, local_path, hexdigest)
+        return hexdigest
+
+    def _create_progress_tracker(
+        self, text: str, total_bytes: int, start_value: int = 0, end_value: int = 100
+    ) -> ProgressTracker:
+        """Create a byte-based progress tracker bound to the progress_chehged signal.
+
+        Args:
+            text: Description of the operation.
+            total_bytes: Total number of bytes to process.
+            start_value: Progress value that corresponds to zero bytes.
+            end_value: Progress value that corresponds to all bytes processed.
+
+        Inside a job the tracker checks the cancel token of the job on every
+        advance() and stores the progress on the job, also from pipeline
+        worker threads, which have no current job of their own.
+
+        Returns:
+            Configured ProgressTracker instance.
+        """
+        job = self.job_scheduler.current_job()
+
+        def emit(text: str, value: int) -> None:
+            if job is not None:
+                self.job_scheduler.report_job_progress(job, text, value)
+            self.progress_chehged.emit(text, value)
+
+        return ProgressTracker(
+            emit=emit,
+            text=text,
+            total_bytes=total_bytes,
+            start_value=start_value,
+            max_updates_per_second=self.PROGRESS_UPDATES_PER_SECOND,
+            end_value=end_value,
+            checkpoint=job.token.check if job is not None else None,
+        )
+
+    def _check_cancelled(self) -> None:
+        """Wait while the current job is paused.
+
+        Raises:
+            OperationCancelled: If the current job is cancelled.
+        """
+        job = self.job_scheduler.current_job()
+        if job is not None:
+            job.token.check()
+
+    def _remove_partial_output(self, path: Path | None) -> None:
+        """Delete a partially written file or folder of a cancelled operation."""
+        if path is None or not path.exists():
+            return
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+
+    def _delete_tree(self, path: Path) -> None:
+        """Delete a folder file by file, checking the cancel token between files."""
+        for root_path, dir_names, file_names in os.walk(path, topdown=False):
+            for name in file_names:
+                self._check_cancelled()
+                os.unlink(os.path.join(root_path, name))
+            for name in dir_names:
+                dir_path = os.path.join(root_path, name)
+                if os.path.islink(dir_path):
+                    os.unlink(dir_path)
+                else:
+                    os.rmdir(dir_path)
+        path.rmdir()
+
     def _parse_date(self, date_str: str | None) -> datetime.datetime:
         """Parse date string in DD.MM.YYYY format into datetime.
 
@@ -914,59 +2875,58 @@ class Model(QObject):
         except ValueError:
             return datetime.datetime.min
 
-    def _encrypt_file(self, src_path: str, dst_path: str) -> None:
+    def _encrypt_file(
+        self,
+        src_path: str,
+        dst_path: str,
+        make_dirs: bool = True,
+        progress: Callable[[int], None] | None = None,
+        compression: str | None = None,
+        digest: Digest | None = None,
+    ) -> None:
         """Encrypt a single file and save encrypted copy with .enc extension.
 
+        The file is streamed in authenticated chunks (see FileCipher),
+        so memory usage does not depend on the file size.
+
         Args:
             src_path: Path to the source file.
             dst_path: Path to the destination file without .enc extension.
+            make_dirs: Create the destination directory. Callers that already
+                created it skip the extra round trip to the share.
+            progress: Callback receiving the number of processed source bytes.
+            compression: Codec from FileCipher.CODECS applied before encryption, or None.
+            digest: Hash updated with the source bytes.
         """
         # Add .enc extension to the destination file
         dst_path_obj = Path(str(dst_path) + ".enc")
 
-        # Read encryption key
-        with open(self.keyfile_path, "rb") as kf:
-            key = kf.read().strip()
-
-        fernet = Fernet(key)
-
-        # Read source data
-        with open(src_path, "rb") as f:
-            data = f.read()
-
-        # Encrypt data
-        encrypted_data = fernet.encrypt(data)
-
         # Ensure destination directory exists
-        dst_path_obj.parent.mkdir(parents=True, exist_ok=True)
+        if make_dirs:
+            dst_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write encrypted file
-        with open(dst_path_obj, "wb") as f:
-            f.write(encrypted_data)
+        self._get_file_cipher().encrypt_file(src_path, dst_path_obj, progress, compression, digest)
 
-    def _decryprt_file(self, src_path: str, dst_path: str) -> None:
+    def _decryprt_file(
+        self, src_path: str, dst_path: str, progress: Callable[[int], None] | None = None
+    ) -> None:
         """Decrypt a single file and save decrypted copy to the given path.
 
+        Both the chunked format and legacy whole-file Fernet tokens are supported.
+
         Args:
             src_path: Path to encrypted .enc file.
             dst_path: Path to the destination decrypted file.
+            progress: Callback receiving the number of processed encrypted bytes.
         """
-        try:
-            with open(self.keyfile_path, "rb") as kf:
-                key = kf.read().strip()
-
-            fernet = Fernet(key)
-
-            with open(src_path, "rb") as f:
-                encrypted_data = f.read()
-
-            decrypted_data = fernet.decrypt(encrypted_data)
+        from cryptography.fernet import InvalidToken
 
+        try:
             Path(dst_path).parent.mkdir(parents=True, exist_ok=True)
+            self._get_file_cipher().decrypt_file(src_path, dst_path, progress)
 
-            with open(dst_path, "wb") as f:
-                f.write(decrypted_data)
-
+        except OperationCancelled:
+            raise
         except FileNotFoundError:
             self.show_notification.emit(
                 "error",
@@ -987,15 +2947,21 @@ class Model(QObject):
             )
             return
 
-    def _get_fernet(self) -> Fernet:
-        """Read encryption key from keyfile and return Fernet instance.
+    def _get_file_cipher(self) -> FileCipher:
+        """Return the cached FileCipher instance from the key manager.
+
+        Returns:
+            Configured FileCipher instance.
+        """
+        return self.key_manager.get_cipher()
+
+    def _get_fernet(self) -> "Fernet":
+        """Return the cached Fernet instance from the key manager.
 
         Returns:
             Configured Fernet instance.
         """
-        with open(self.keyfile_path, "rb") as kf:
-            key = kf.read().strip()
-        return Fernet(key)
+        return self.key_manager.get_fernet()
 
     def _encrypt_string(self, plaintext: str) -> str:
         """Encrypt plain text string and return base64-encoded value.
@@ -1022,6 +2988,8 @@ class Model(QObject):
         Returns:
             Decrypted string, original text if token invalid, or empty string on error.
         """
+        from cryptography.fernet import InvalidToken
+
         if not encrypted_text:
             return ""
 
@@ -1035,6 +3003,39 @@ class Model(QObject):
         except Exception:
             return ""
         
+    def _evict_instruction_cache(self, keep_path: Path) -> None:
+        """Remove least recently opened files from the temp folder above instruction_cache_mb.
+
+        Files that are still open in another program cannot be removed on
+        Windows and are skipped.
+
+        Args:
+            keep_path: File that has just been opened and must stay.
+        """
+        cache_mb = self.config_data.get("instruction_cache_mb")
+        max_bytes = (cache_mb if isinstance(cache_mb, int) and cache_mb >= 0 else 200) * 1024 * 1024
+
+        temp_folder = self._create_temp_folder()
+        files: list[tuple[float, int, Path]] = []  # (last use, size, path)
+        for root_path, names in self._walk_with_sizes(temp_folder):
+            for name, size in names:
+                path = root_path / name
+                files.append((path.stat().st_mtime, size, path))
+
+        total_size = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total_size <= max_bytes:
+                break
+            if path == keep_path:
+                continue
+            try:
+                path.unlink()
+                if path.parent != temp_folder and not any(path.parent.iterdir()):
+                    path.parent.rmdir()
+            except OSError:
+                continue
+            total_size -= size
+
     def _create_temp_folder(self) -> Path:
         """Create a temporary folder for file operations.
 
@@ -1059,32 +3060,70 @@ class Model(QObject):
 
     # === Thread wrapper helpers ===
 
-    def _wrapper_download(self, group: str, file: str, save_path: str | Path | None) -> None:
+    def _on_job_changed(self, job: Job) -> None:
+        """Pass a job change to the GUI and report a job that failed with an exception.
+
+        Operations report their own errors; an exception that escaped one
+        also skipped its operation_finished signal, so it is emitted here to
+        unlock the page of the operation.
+        """
+        if job.status == Job.FAILED and job.error is not None:
+            self.show_notification.emit(
+                "error",
+                f"Операция «{job.title}» завершилась с ошибкой.\n"
+                f"Ошибка: {job.error}",
+            )
+            self.operation_finished.emit(job.name, 1)
+        self.jobs_changed.emit()
+
+    def _wrapper_download(self, group: str, file: str, save_path: str | Path | None) -> int:
         """Wrapper for download() to emit operation_finished signal."""
         status_code = self.download(group, file, save_path)
         self.operation_finished.emit("download", status_code)
-
-    def _wrapper_create_new_group(self, group_name: str) -> None:
+        return status_code
+
+    def _wrapper_extract_files(
+        self, group: str, version: str, paths: list[str], save_path: str | Path | None
+    ) -> int:
+        """Wrapper for extract_files() to emit operation_finished signal."""
+        status_code = self.extract_files(group, version, paths, save_path)
+        self.operation_finished.emit("extract_files", status_code)
+        return status_code
+
+    def _wrapper_sync_version(
+        self, group: str, version: str, save_path: str | Path | None, remove_stale: bool
+    ) -> int:
+        """Wrapper for sync_version() to emit operation_finished signal."""
+        status_code = self.sync_version(group, version, save_path, remove_stale)
+        self.operation_finished.emit("sync_version", status_code)
+        return status_code
+
+    def _wrapper_create_new_group(self, group_name: str) -> int:
         """Wrapper for create_new_group() to emit operation_finished signal."""
         status_code = self.create_new_group(group_name)
         self.operation_finished.emit("create_group", status_code)
+        return status_code
 
-    def _wrapper_add_version(self, version_path: str, group_name: str) -> None:
+    def _wrapper_add_version(self, version_path: str, group_name: str) -> int:
         """Wrapper for add_version() to emit operation_finished signal."""
         status_code = self.add_version(version_path, group_name)
         self.operation_finished.emit("add_version", status_code)
+        return status_code
 
-    def _wrapper_add_instruction(self, instruction_path: str, group_name: str) -> None:
+    def _wrapper_add_instruction(self, instruction_path: str, group_name: str) -> int:
         """Wrapper for add_instruction() to emit operation_finished signal."""
         status_code = self.add_instruction(instruction_path, group_name)
         self.operation_finished.emit("add_instruction", status_code)
+        return status_code
 
-    def _wrapper_delete_group(self, group_name: str) -> None:
+    def _wrapper_delete_group(self, group_name: str) -> int:
         """Wrapper for delete_group() to emit operation_finished signal."""
         status_code = self.delete_group(group_name)
         self.operation_finished.emit("delete_group", status_code)
+        return status_code
 
-    def _wrapper_delete_file(self, data: list[str]) -> None:
+    def _wrapper_delete_file(self, data: list[str]) -> int:
         """Wrapper for delete_file() to emit operation_finished signal."""
         status_code = self.delete_file(data)
-        self.operation_finished.emit("delete_file", status_code)
\ No newline at end of file
+        self.operation_finished.emit("delete_file", status_code)
+        return status_code
\ No newline at end of file
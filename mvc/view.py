@@ -1,16 +1,21 @@
 from resources import resources_rc
 
-from classes import Notification
+from ui import Ui_AddPage, Ui_DeletePage
+from classes import Job, Notification, TableRowsModel
 
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
+    QLabel,
     QLineEdit,
     QHeaderView,
+    QPushButton,
+    QTableWidget,
     QTableWidgetItem,
     QAbstractItemView,
     QScroller,
+    QVBoxLayout,
 )
-from PyQt5.QtCore import QObject
+from PyQt5.QtCore import QObject, Qt
 
 
 class View(QObject):
@@ -19,6 +24,10 @@ class View(QObject):
     This class connects the generated UI (self.ui) with higher-level
     helper methods and signal wiring used by the controller.
     It exposes convenience methods for working with widgets on all tabs.
+
+    The Add and Delete tabs are built on first use (see load_page): until
+    then self.add_ui and self.delete_ui are None, their helper collections
+    are empty and group names are only remembered for their comboboxes.
     """
 
     def __init__(self, ui: object, authenticated: bool) -> None:
@@ -43,17 +52,65 @@ class View(QObject):
         # === Table configuration ===
         self.table_groups_layer_headers = ["Изделие", "Последняя версия"]
         self.table_versions_layer_headers = ["Версия"]
+        self.table_files_layer_headers = ["Файл", "Размер"]
+        self.TABLE_RESIZE_SAMPLE_ROWS: int = 200  # Column widths are measured on this many rows
+
+        # The table shows a model, so large search results are not turned into widget items
+        self.table_model = TableRowsModel(self)
+        self.ui.tableView.setModel(self.table_model)
+        header = self.ui.tableView.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setResizeContentsPrecision(self.TABLE_RESIZE_SAMPLE_ROWS)
         self.create_table_columns(headers=self.table_groups_layer_headers)
 
         # Smooth scrolling for the table using mouse drag
-        QScroller.grabGesture(self.ui.tableWidget.viewport(), QScroller.LeftMouseButtonGesture)
-        self.ui.tableWidget.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
-        self.ui.tableWidget.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        QScroller.grabGesture(self.ui.tableView.viewport(), QScroller.LeftMouseButtonGesture)
+        self.ui.tableView.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.ui.tableView.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        # Loading state: the table is locked and covered by a label while the share is read
+        self.table_loading_label = QLabel("Загрузка...", self.ui.tableView.viewport())
+        self.table_loading_label.setVisible(False)
+        loading_layout = QVBoxLayout(self.ui.tableView.viewport())
+        loading_layout.addWidget(self.table_loading_label, alignment=Qt.AlignCenter)
 
         # UI options
-        self.ui.tableWidget.setAlternatingRowColors(True)
+        self.ui.tableView.setAlternatingRowColors(True)
         self.ui.open_file_pushButton.setVisible(False)
 
+        # === Job queue panel (above the progress bar, hidden while the queue is empty) ===
+        self.queue_table_headers = ["Задача", "Состояние", "Выполнено"]
+        self.queue_statuses_texts = {
+            Job.QUEUED: "В очереди",
+            Job.RUNNING: "Выполняется",
+            Job.DONE: "Готово",
+            Job.FAILED: "Ошибка",
+            Job.CANCELLED: "Отменено",
+        }
+        self.queue_paused_text = "Пауза"
+        self._queue_job_ids: list[int] = []  # Job ids of the panel rows
+        self.queue_tableWidget = QTableWidget(0, len(self.queue_table_headers), self.ui.progress_bar_frame)
+        self.queue_tableWidget.setHorizontalHeaderLabels(self.queue_table_headers)
+        self.queue_tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.queue_tableWidget.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.queue_tableWidget.verticalHeader().setVisible(False)
+        self.queue_tableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.queue_tableWidget.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.queue_tableWidget.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.queue_tableWidget.setMaximumHeight(120)
+        self.queue_tableWidget.setVisible(False)
+        self.ui.verticalLayout_3.insertWidget(0, self.queue_tableWidget)
+
+        # Pause and cancel buttons next to the progress labels; they act on the job
+        # selected in the queue panel or on all cancellable jobs if none is selected
+        self.pause_texts = {False: "Пауза", True: "Продолжить"}
+        self.pause_job_pushButton = QPushButton(self.pause_texts[False], self.ui.progress_bar_labels_frame)
+        self.cancel_job_pushButton = QPushButton("Отменить", self.ui.progress_bar_labels_frame)
+        for button in (self.pause_job_pushButton, self.cancel_job_pushButton):
+            button.setFont(self.ui.process_label.font())
+            button.setVisible(False)
+            self.ui.horizontalLayout_2.addWidget(button)
+
         # === Icons ===
         # Search line edit icon
         self.search_action = self.ui.search_lineEdit.addAction(
@@ -74,18 +131,6 @@ class View(QObject):
             self.ui.delete_tab_pushButton: self.ui.delete_page,
         }
 
-        # Add options: radio button -> page
-        self.add_options_dict = {
-            self.ui.version_radioButton: self.ui.version_page,
-            self.ui.instruction_radioButton: self.ui.instruction_page,
-        }
-
-        # Delete options: radio button -> page
-        self.delete_options_dict = {
-            self.ui.what_delete_file_radioButton: self.ui.delete_file_page,
-            self.ui.what_delete_group_radioButton: self.ui.delete_group_page,
-        }
-
         # Pages -> internal page name
         self.pages_dict = {
             self.ui.download_page: "download",
@@ -93,60 +138,140 @@ class View(QObject):
             self.ui.delete_page: "delete",
         }
 
+        # === Lazily built pages ===
+        self.add_ui: Ui_AddPage | None = None
+        self.delete_ui: Ui_DeletePage | None = None
+        self.group_names: list[str] = []  # Shown in the group comboboxes of pages built later
+
+        # Filled when the Add and Delete pages are built
+        self.add_options_dict: dict = {}
+        self.delete_options_dict: dict = {}
+        self.add_page_choose_push_buttons_dict: dict = {}
+        self.add_page_add_push_buttons_dict: dict = {}
+        self.delete_page_delete_push_buttons_dict: dict = {}
+        self.add_page_paths_lineedits_dict: dict = {}
+        self.delete_page_comboboxes_dict: dict = {}
+        self.delete_page_checkboxes_dict: dict = {}
+        self.groups_comboboxes_lst: list = []
+        self.add_page_comboboxes: list = []
+
+        # === Additional collections for handlers ===
+        # These attributes are used by handler-binding methods below.
+        self.download_page_lineedits = [
+            self.ui.save_file_path_lineEdit,
+        ]
+
+    # === Lazily built pages ===
+
+    def is_page_loaded(self, page: str) -> bool:
+        """Check whether a page is built.
+
+        Args:
+            page: Internal page name ('download', 'add', 'delete').
+        """
+        if page == "add":
+            return self.add_ui is not None
+        if page == "delete":
+            return self.delete_ui is not None
+        return True
+
+    def load_page(self, page: str) -> bool:
+        """Build the Add or Delete page if it is not built yet.
+
+        Args:
+            page: Internal page name ('download', 'add', 'delete').
+
+        Returns:
+            True if the page was built by this call, False if it already existed.
+        """
+        if self.is_page_loaded(page):
+            return False
+
+        if page == "add":
+            self._setup_add_page()
+        else:
+            self._setup_delete_page()
+
+        return True
+
+    def _setup_add_page(self) -> None:
+        """Build the Add page and its helper collections."""
+        self.add_ui = Ui_AddPage()
+        self.add_ui.setupUi(self.ui.add_page)
+
+        # Add options: radio button -> page
+        self.add_options_dict = {
+            self.add_ui.version_radioButton: self.add_ui.version_page,
+            self.add_ui.instruction_radioButton: self.add_ui.instruction_page,
+        }
+
         # === Buttons dictionaries ===
         # Add page: choose path buttons -> corresponding line edits
         self.add_page_choose_push_buttons_dict = {
-            self.ui.choose_version_folder_pushButton: self.ui.choose_version_folder_lineEdit,
-            self.ui.choose_instruction_file_pushButton: self.ui.choose_instruction_file_lineEdit,
+            self.add_ui.choose_version_folder_pushButton: self.add_ui.choose_version_folder_lineEdit,
+            self.add_ui.choose_instruction_file_pushButton: self.add_ui.choose_instruction_file_lineEdit,
         }
 
         # Add page: add buttons -> action type
         self.add_page_add_push_buttons_dict = {
-            self.ui.add_version_pushButton: "version",
-            self.ui.add_instruction_pushButton: "instruction",
-        }
-
-        # Delete page: delete buttons -> type
-        self.delete_page_delete_push_buttons_dict = {
-            self.ui.delete_file_pushButton: "file",
-            self.ui.delete_group_pushButton: "group",
+            self.add_ui.add_version_pushButton: "version",
+            self.add_ui.add_instruction_pushButton: "instruction",
         }
 
         # === Line edits dictionaries ===
         # Add page: path line edits -> related add buttons
         self.add_page_paths_lineedits_dict = {
-            self.ui.choose_version_folder_lineEdit: self.ui.add_version_pushButton,
-            self.ui.choose_instruction_file_lineEdit: self.ui.add_instruction_pushButton,
+            self.add_ui.choose_version_folder_lineEdit: self.add_ui.add_version_pushButton,
+            self.add_ui.choose_instruction_file_lineEdit: self.add_ui.add_instruction_pushButton,
+        }
+
+        # === Comboboxes ===
+        self.add_page_comboboxes = [
+            self.add_ui.groups_comboBox,
+        ]
+        self._add_groups_comboboxes([self.add_ui.groups_comboBox])
+
+    def _setup_delete_page(self) -> None:
+        """Build the Delete page and its helper collections."""
+        self.delete_ui = Ui_DeletePage()
+        self.delete_ui.setupUi(self.ui.delete_page)
+
+        # Delete options: radio button -> page
+        self.delete_options_dict = {
+            self.delete_ui.what_delete_file_radioButton: self.delete_ui.delete_file_page,
+            self.delete_ui.what_delete_group_radioButton: self.delete_ui.delete_group_page,
+        }
+
+        # === Buttons dictionaries ===
+        # Delete page: delete buttons -> type
+        self.delete_page_delete_push_buttons_dict = {
+            self.delete_ui.delete_file_pushButton: "file",
+            self.delete_ui.delete_group_pushButton: "group",
         }
 
         # === Comboboxes dictionaries ===
         self.delete_page_comboboxes_dict = {
-            self.ui.choose_group_to_delete_comboBox: "file",
-            self.ui.choose_file_to_delete_comboBox: "file",
-            self.ui.choose_group_to_delete_comboBox_2: "group",
+            self.delete_ui.choose_group_to_delete_comboBox: "file",
+            self.delete_ui.choose_file_to_delete_comboBox: "file",
+            self.delete_ui.choose_group_to_delete_comboBox_2: "group",
         }
 
         # === Checkboxes dictionaries ===
         self.delete_page_checkboxes_dict = {
-            self.ui.accept_file_delete_checkBox: "file",
-            self.ui.accept_group_delete_checkBox: "group",
+            self.delete_ui.accept_file_delete_checkBox: "file",
+            self.delete_ui.accept_group_delete_checkBox: "group",
         }
 
-        # === Group comboboxes list ===
-        self.groups_comboboxes_lst = [
-            self.ui.groups_comboBox,
-            self.ui.choose_group_to_delete_comboBox,
-            self.ui.choose_group_to_delete_comboBox_2,
-        ]
+        self._add_groups_comboboxes([
+            self.delete_ui.choose_group_to_delete_comboBox,
+            self.delete_ui.choose_group_to_delete_comboBox_2,
+        ])
 
-        # === Additional collections for handlers ===
-        # These attributes are used by handler-binding methods below.
-        self.download_page_lineedits = [
-            self.ui.save_file_path_lineEdit,
-        ]
-        self.add_page_comboboxes = [
-            self.ui.groups_comboBox,
-        ]
+    def _add_groups_comboboxes(self, comboboxes: list) -> None:
+        """Register group comboboxes of a new page and fill them with the known groups."""
+        for combobox in comboboxes:
+            combobox.addItems(self.group_names)
+        self.groups_comboboxes_lst.extend(comboboxes)
 
     # === Common helper methods ===
 
@@ -156,6 +281,7 @@ class View(QObject):
         Args:
             group_names: List of group names to display.
         """
+        self.group_names = list(group_names)
         for combobox in self.groups_comboboxes_lst:
             combobox.clear()
             combobox.addItems(group_names)
@@ -166,8 +292,8 @@ class View(QObject):
         Args:
             versions: List of version names.
         """
-        self.ui.choose_file_to_delete_comboBox.clear()
-        self.ui.choose_file_to_delete_comboBox.addItems(versions)
+        self.delete_ui.choose_file_to_delete_comboBox.clear()
+        self.delete_ui.choose_file_to_delete_comboBox.addItems(versions)
 
     def update_page_enabled_state(self, page: str | None = None, state: bool = True, check_all: bool = False) -> None:
         """Enable or disable one or all pages.
@@ -190,6 +316,14 @@ class View(QObject):
 
     # === Navigation bar (tabs) ===
 
+    def get_tab_page_name(self, button) -> str | None:
+        """Return internal name of the page opened by a tab button.
+
+        Args:
+            button: Tab button.
+        """
+        return self.pages_dict.get(self.tabs_dict.get(button))
+
     def set_tab_page(self, button) -> None:
         """Switch stacked widget page based on tab button.
 
@@ -220,11 +354,7 @@ class View(QObject):
         Returns:
             List of cell texts for the given row.
         """
-        data: list[str] = []
-        for column in range(self.ui.tableWidget.columnCount()):
-            item = self.ui.tableWidget.item(row, column)
-            data.append(item.text() if item is not None else "")
-        return data
+        return self.table_model.row_data(row)
 
     def get_choosen_label_text(self) -> str:
         """Return text of the 'chosen file' label on Download tab."""
@@ -263,29 +393,9 @@ class View(QObject):
         Args:
             layer_one_data: List of [group_name, version_name] rows.
         """
-        self.clear_table()
-
-        self.ui.tableWidget.setColumnCount(len(self.table_groups_layer_headers))
-        self.ui.tableWidget.setHorizontalHeaderLabels(self.table_groups_layer_headers)
-
-        header = self.ui.tableWidget.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
-
-        for data_row in layer_one_data:
-            row = self.ui.tableWidget.rowCount()
-            self.ui.tableWidget.insertRow(row)
-
-            group_name = data_row[0]
-            version_raw = data_row[1]
-
-            self.ui.tableWidget.setItem(row, 0, QTableWidgetItem(group_name))
-
-            if version_raw is not None and isinstance(version_raw, str) and version_raw.endswith(".enc"):
-                version = version_raw[:-4]
-            else:
-                version = version_raw if version_raw is not None else ""
-
-            self.ui.tableWidget.setItem(row, 1, QTableWidgetItem(version))
+        # Stored .enc files, .pack and .manifest versions are shown without extension
+        rows = [[group_name, self._strip_storage_extension(version)] for group_name, version in layer_one_data]
+        self.table_model.set_rows(self.table_groups_layer_headers, rows)
 
     def set_layer_two_table_data(self, layer_two_data: list[str | None]) -> None:
         """Populate table with versions for a selected group.
@@ -293,24 +403,19 @@ class View(QObject):
         Args:
             layer_two_data: List of version names.
         """
-        self.clear_table()
-
-        self.ui.tableWidget.setColumnCount(len(self.table_versions_layer_headers))
-        self.ui.tableWidget.setHorizontalHeaderLabels(self.table_versions_layer_headers)
-
-        header = self.ui.tableWidget.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        rows = [[self._strip_storage_extension(version)] for version in layer_two_data]
+        self.table_model.set_rows(self.table_versions_layer_headers, rows)
 
-        for data_row in layer_two_data:
-            row = self.ui.tableWidget.rowCount()
-            self.ui.tableWidget.insertRow(row)
+    def set_layer_three_table_data(self, layer_three_data: list[tuple[str, int]]) -> None:
+        """Populate table with files of a selected version.
 
-            if data_row is not None and isinstance(data_row, str) and data_row.endswith(".enc"):
-                version = data_row[:-4]
-            else:
-                version = data_row if data_row is not None else ""
+        Files are sorted by path, so files of one folder stay together.
 
-            self.ui.tableWidget.setItem(row, 0, QTableWidgetItem(version))
+        Args:
+            layer_three_data: List of (relative path, size in bytes) rows.
+        """
+        rows = [[file_path, self._format_size(size)] for file_path, size in layer_three_data]
+        self.table_model.set_rows(self.table_files_layer_headers, rows)
 
     def set_choosen_label_text(self, data, in_group_flag: bool | None) -> None:
         """Update 'chosen file' label text on Download tab.
@@ -334,6 +439,18 @@ class View(QObject):
                 f"Выбрано изделие: {self.current_group_name}, Версия: {data[0]}",
             )
 
+    def set_choosen_file_label_text(self, version: str, file_path: str | None) -> None:
+        """Update 'chosen file' label text for a file inside a version.
+
+        Args:
+            version: Name of the opened version.
+            file_path: Relative path of the selected file or None.
+        """
+        text = f"Выбрано изделие: {self.current_group_name}, Версия: {version}"
+        if file_path:
+            text += f", Файл: {file_path}"
+        self.ui.choose_file_label.setText(text)
+
     def set_back_button_state(self, state: bool) -> None:
         """Enable or disable 'Back' button on Download tab."""
         self.ui.back_pushButton.setEnabled(state)
@@ -347,11 +464,34 @@ class View(QObject):
         self.ui.open_file_pushButton.setVisible(state)
         self.ui.open_file_pushButton.setEnabled(state)
 
+    def set_table_loading(self, state: bool) -> None:
+        """Show or hide the loading state of the table on Download tab.
+
+        Args:
+            state: True while the table data is being read from the share.
+        """
+        self.ui.tableView.setEnabled(not state)
+        self.table_loading_label.setVisible(state)
+
     def clear_table(self) -> None:
-        """Clear all data and structure from the table widget."""
-        self.ui.tableWidget.clear()
-        self.ui.tableWidget.setRowCount(0)
-        self.ui.tableWidget.setColumnCount(0)
+        """Clear all data and structure from the table."""
+        self.table_model.clear()
+
+    @staticmethod
+    def _strip_storage_extension(name: str | None) -> str:
+        """Return a version or file name without the .enc/.pack/.manifest storage extension."""
+        if name is not None and isinstance(name, str) and name.endswith((".enc", ".pack", ".manifest")):
+            return name.rsplit(".", 1)[0]
+        return name if name is not None else ""
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        """Format a file size for the table."""
+        if size < 1024:
+            return f"{size} Б"
+        if size < 1024 * 1024:
+            return f"{size / 1024:.1f} КБ"
+        return f"{size / (1024 * 1024):.1f} МБ"
 
     def create_table_columns(self, headers: list[str]) -> None:
         """Create table columns with the given headers.
@@ -359,8 +499,7 @@ class View(QObject):
         Args:
             headers: List of column header texts.
         """
-        self.ui.tableWidget.setColumnCount(len(headers))
-        self.ui.tableWidget.setHorizontalHeaderLabels(headers)
+        self.table_model.set_rows(headers, [])
 
     def download_page_table_row_clicked(self, handler) -> None:
         """Bind handler for single row click on Download tab table.
@@ -368,7 +507,7 @@ class View(QObject):
         Args:
             handler: Callback accepting row index as 'row' keyword argument.
         """
-        self.ui.tableWidget.cellClicked.connect(lambda row, _col: handler(row=row))
+        self.ui.tableView.clicked.connect(lambda index: handler(row=index.row()))
 
     def download_page_table_row_double_clicked(self, handler) -> None:
         """Bind handler for double row click on Download tab table.
@@ -376,7 +515,7 @@ class View(QObject):
         Args:
             handler: Callback accepting row index as 'row' keyword argument.
         """
-        self.ui.tableWidget.cellDoubleClicked.connect(lambda row, _col: handler(row=row))
+        self.ui.tableView.doubleClicked.connect(lambda index: handler(row=index.row()))
 
     def download_page_search_lineedit_text_changed(self, handler) -> None:
         """Bind handler for search line edit text changes on Download tab.
@@ -459,7 +598,7 @@ class View(QObject):
 
     def get_new_group_name_lineedit_text(self) -> str:
         """Return text from 'new group name' line edit on Add tab."""
-        return self.ui.group_name_lineEdit.text()
+        return self.add_ui.group_name_lineEdit.text()
 
     def get_add_page_paths_lineedits_datas(self) -> dict:
         """Return mapping of Add tab path line edits to their texts and buttons.
@@ -474,15 +613,15 @@ class View(QObject):
 
     def get_add_page_combobox_current_group_name(self) -> str:
         """Return currently selected group name on Add tab."""
-        return self.ui.groups_comboBox.currentText()
+        return self.add_ui.groups_comboBox.currentText()
 
     def get_version_path_lineedit_text(self) -> str:
         """Return version folder path from Add tab."""
-        return self.ui.choose_version_folder_lineEdit.text()
+        return self.add_ui.choose_version_folder_lineEdit.text()
 
     def get_instruction_path_lineedit_text(self) -> str:
         """Return instruction file path from Add tab."""
-        return self.ui.choose_instruction_file_lineEdit.text()
+        return self.add_ui.choose_instruction_file_lineEdit.text()
 
     def set_add_option_page(self, page) -> None:
         """Switch page inside Add tab format stacked widget.
@@ -490,7 +629,7 @@ class View(QObject):
         Args:
             page: Page widget to display.
         """
-        self.ui.add_format_stackedWidget.setCurrentWidget(page)
+        self.add_ui.add_format_stackedWidget.setCurrentWidget(page)
 
     def set_lineedit_path(self, lineedit, path: str) -> None:
         """Set path into a given line edit on Add tab.
@@ -516,11 +655,11 @@ class View(QObject):
         Args:
             new_group_name: Name of the created group.
         """
-        self.ui.groups_comboBox.setCurrentText(new_group_name)
+        self.add_ui.groups_comboBox.setCurrentText(new_group_name)
 
     def update_add_page_create_push_button_state(self, state: bool) -> None:
         """Enable or disable 'Create group' button on Add tab."""
-        self.ui.create_group_pushButton.setEnabled(state)
+        self.add_ui.create_group_pushButton.setEnabled(state)
 
     def add_page_comboboxes_state_changed(self, handler) -> None:
         """Bind handler for combobox state changes on Add tab.
@@ -533,11 +672,11 @@ class View(QObject):
 
     def add_page_new_group_name_lineedit_text_changed(self, handler) -> None:
         """Bind handler for 'new group name' text changes on Add tab."""
-        self.ui.group_name_lineEdit.textChanged.connect(handler)
+        self.add_ui.group_name_lineEdit.textChanged.connect(handler)
 
     def add_page_create_push_buttons_clicked(self, handler) -> None:
         """Bind handler for 'Create' button click on Add tab."""
-        self.ui.create_group_pushButton.clicked.connect(handler)
+        self.add_ui.create_group_pushButton.clicked.connect(handler)
 
     def add_page_radio_buttons_state_changed(self, handler) -> None:
         """Bind handler for radio button state changes on Add tab.
@@ -559,8 +698,8 @@ class View(QObject):
         Args:
             handler: Callback accepting 'button' keyword argument.
         """
-        button = self.ui.choose_version_folder_pushButton
-        self.ui.choose_version_folder_pushButton.clicked.connect(
+        button = self.add_ui.choose_version_folder_pushButton
+        self.add_ui.choose_version_folder_pushButton.clicked.connect(
             lambda: handler(button=button),
         )
 
@@ -570,8 +709,8 @@ class View(QObject):
         Args:
             handler: Callback accepting 'button' keyword argument.
         """
-        button = self.ui.choose_instruction_file_pushButton
-        self.ui.choose_instruction_file_pushButton.clicked.connect(
+        button = self.add_ui.choose_instruction_file_pushButton
+        self.add_ui.choose_instruction_file_pushButton.clicked.connect(
             lambda: handler(button=button),
         )
 
@@ -586,7 +725,7 @@ class View(QObject):
 
     def add_page_group_name_combobox_item_changed(self, handler) -> None:
         """Bind handler for group combobox text changes on Add tab."""
-        self.ui.groups_comboBox.currentTextChanged.connect(handler)
+        self.add_ui.groups_comboBox.currentTextChanged.connect(handler)
 
     # === Delete tab ===
 
@@ -629,7 +768,7 @@ class View(QObject):
 
     def get_delete_page_version_combobox_current_text(self) -> str:
         """Return current text of 'group to delete (file)' combobox on Delete tab."""
-        return self.ui.choose_group_to_delete_comboBox.currentText()
+        return self.delete_ui.choose_group_to_delete_comboBox.currentText()
 
     def get_delete_page_combobox_text(self, combobox) -> str:
         """Return current text for a given combobox on Delete tab."""
@@ -641,7 +780,7 @@ class View(QObject):
         Args:
             page: Page widget to display.
         """
-        self.ui.delete_stackedWidget.setCurrentWidget(page)
+        self.delete_ui.delete_stackedWidget.setCurrentWidget(page)
 
     def set_delete_button_state(self, state: bool, button_type: str) -> None:
         """Enable or disable 'Delete' buttons on Delete tab.
@@ -693,6 +832,69 @@ class View(QObject):
         for button, button_type in self.delete_page_delete_push_buttons_dict.items():
             button.clicked.connect(lambda _, btn_type=button_type: handler(button_type=btn_type))
 
+    # === Job queue panel ===
+
+    def set_queue_table_data(self, jobs: list[Job]) -> None:
+        """Show queued, running and recently finished jobs.
+
+        Args:
+            jobs: Jobs in submission order.
+        """
+        selected_job_id = self.get_selected_queue_job_id()
+
+        self.queue_tableWidget.setRowCount(len(jobs))
+        for row, job in enumerate(jobs):
+            progress = f"{job.progress}%" if job.status == Job.RUNNING else ""
+            if job.status == Job.DONE:
+                progress = "100%"
+
+            status = self.queue_statuses_texts[job.status]
+            if job.token.is_paused and not job.is_finished:
+                status = self.queue_paused_text
+
+            self.queue_tableWidget.setItem(row, 0, QTableWidgetItem(job.title))
+            self.queue_tableWidget.setItem(row, 1, QTableWidgetItem(status))
+            self.queue_tableWidget.setItem(row, 2, QTableWidgetItem(progress))
+
+        # Rows move when old jobs are dropped, so the selection follows the job id
+        self._queue_job_ids = [job.job_id for job in jobs]
+        if selected_job_id in self._queue_job_ids:
+            self.queue_tableWidget.selectRow(self._queue_job_ids.index(selected_job_id))
+        else:
+            self.queue_tableWidget.clearSelection()
+
+        self.queue_tableWidget.setVisible(bool(jobs))
+
+    def get_selected_queue_job_id(self) -> int | None:
+        """Return the id of the job selected in the queue panel, or None."""
+        rows = self.queue_tableWidget.selectionModel().selectedRows()
+        if not rows or rows[0].row() >= len(self._queue_job_ids):
+            return None
+        return self._queue_job_ids[rows[0].row()]
+
+    def set_job_buttons_state(self, visible: bool, paused: bool = False) -> None:
+        """Show or hide the pause and cancel buttons.
+
+        Args:
+            visible: True if there are jobs the buttons can act on.
+            paused: True if these jobs are paused (the pause button resumes them).
+        """
+        self.pause_job_pushButton.setText(self.pause_texts[paused])
+        self.pause_job_pushButton.setVisible(visible)
+        self.cancel_job_pushButton.setVisible(visible)
+
+    def queue_table_selection_changed(self, handler) -> None:
+        """Bind handler for selection change in the job queue panel."""
+        self.queue_tableWidget.itemSelectionChanged.connect(handler)
+
+    def pause_job_push_button_clicked(self, handler) -> None:
+        """Bind handler for 'Pause'/'Resume' button click near the progress bar."""
+        self.pause_job_pushButton.clicked.connect(handler)
+
+    def cancel_job_push_button_clicked(self, handler) -> None:
+        """Bind handler for 'Cancel' button click near the progress bar."""
+        self.cancel_job_pushButton.clicked.connect(handler)
+
     # === Progress bar ===
 
     def set_progress_bar_process_text(self, text: str, set_to_zero: bool = False) -> None:
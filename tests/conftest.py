@@ -0,0 +1,25 @@
+import sys
+
+from pathlib import Path
+
+import pytest
+
+
+# The program is not installed as a package: modules are imported from the project folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def key() -> bytes:
+    """A fresh archive key (the content of keyfile.key)."""
+    from cryptography.fernet import Fernet
+
+    return Fernet.generate_key()
+
+
+@pytest.fixture
+def cipher(key):
+    """FileCipher with small chunks, so short test files span several of them."""
+    from classes.file_cipher import FileCipher
+
+    return FileCipher(key, chunk_size=4096)
@@ -0,0 +1,108 @@
+import io
+import os
+
+import pytest
+
+from cryptography.fernet import InvalidToken
+
+from classes.block_delta import BlockDelta, IterReader
+
+
+BLOCK_SIZE = 1024
+BASE_ID = "b" * 64
+
+
+@pytest.fixture
+def delta() -> BlockDelta:
+    return BlockDelta(b"test-key", block_size=BLOCK_SIZE)
+
+
+def encode(delta: BlockDelta, base: bytes, target_path) -> bytes | None:
+    """Return the delta stream of a target file against base, or None if not worth storing."""
+    base_path = target_path.with_name("base.bin")
+    base_path.write_bytes(base)
+    plan = delta.plan(target_path, delta.signature(base_path))
+    if plan is None:
+        return None
+    ops, _, size = plan
+    return b"".join(delta.iter_encode(target_path, ops, BASE_ID, 1, size))
+
+
+def apply(stream: bytes, base: bytes) -> bytes:
+    """Rebuild the target from a delta stream and its base."""
+    reader = IterReader(iter([stream]))
+    depth, block_size, base_id, size = BlockDelta.read_header(reader)
+    assert (depth, block_size, base_id) == (1, BLOCK_SIZE, BASE_ID)
+
+    dst = io.BytesIO()
+    BlockDelta.apply(reader, block_size, size, io.BytesIO(base), dst)
+    return dst.getvalue()
+
+
+def changed_in_place(base: bytes) -> bytes:
+    data = bytearray(base)
+    data[5 * BLOCK_SIZE + 10:5 * BLOCK_SIZE + 20] = os.urandom(10)
+    return bytes(data)
+
+
+@pytest.mark.parametrize(
+    "make_target",
+    [
+        lambda base: base,
+        changed_in_place,
+        lambda base: base + os.urandom(BLOCK_SIZE // 3),  # Appended, ends with a short block
+        lambda base: base[:-BLOCK_SIZE // 2],  # Truncated inside the last block
+        lambda base: base[4 * BLOCK_SIZE:] + base[:4 * BLOCK_SIZE],  # Blocks moved
+    ],
+    ids=["unchanged", "changed_in_place", "appended", "truncated", "moved_blocks"],
+)
+def test_apply_rebuilds_target(delta, tmp_path, make_target):
+    base = os.urandom(16 * BLOCK_SIZE + 100)
+    target = make_target(base)
+    target_path = tmp_path / "target.bin"
+    target_path.write_bytes(target)
+
+    stream = encode(delta, base, target_path)
+
+    assert stream is not None
+    assert apply(stream, base) == target
+
+
+def test_changed_block_is_the_only_literal(delta, tmp_path):
+    base = os.urandom(16 * BLOCK_SIZE)
+    target_path = tmp_path / "target.bin"
+    target_path.write_bytes(changed_in_place(base))
+    base_path = tmp_path / "base.bin"
+    base_path.write_bytes(base)
+
+    _, literal, size = delta.plan(target_path, delta.signature(base_path))
+
+    assert (literal, size) == (BLOCK_SIZE, len(base))
+
+
+def test_unrelated_file_is_not_worth_a_delta(delta, tmp_path):
+    target_path = tmp_path / "target.bin"
+    target_path.write_bytes(os.urandom(16 * BLOCK_SIZE))
+
+    assert encode(delta, os.urandom(16 * BLOCK_SIZE), target_path) is None
+
+
+def test_truncated_delta_is_rejected(delta, tmp_path):
+    base = os.urandom(16 * BLOCK_SIZE)
+    target_path = tmp_path / "target.bin"
+    target_path.write_bytes(changed_in_place(base))
+    stream = encode(delta, base, target_path)
+
+    with pytest.raises(InvalidToken):
+        apply(stream[:-1], base)
+
+
+def test_delta_against_another_base_is_rejected(delta, tmp_path):
+    base = os.urandom(16 * BLOCK_SIZE)
+    target_path = tmp_path / "target.bin"
+    target_path.write_bytes(base + os.urandom(100))
+    stream = encode(delta, base, target_path)
+
+    # A shorter base cannot provide the copied blocks, so the size does not add up
+    with pytest.raises(InvalidToken):
+        apply(stream, base[:8 * BLOCK_SIZE])
@@ -0,0 +1,113 @@
+import sqlite3
+
+import pytest
+
+from classes.catalog import Catalog
+
+
+GROUPS = {
+    "Alpha": (["rel 03.03.2024", "v1 01.01.2024"], "rel 03.03.2024", 100),
+    "Beta": (["v2 02.02.2024"], "v2 02.02.2024", 200),
+    "Empty": ([], None, None),
+}
+
+
+@pytest.fixture
+def catalog(tmp_path) -> Catalog:
+    catalog = Catalog(tmp_path)
+    catalog.rebuild(GROUPS)
+    return catalog
+
+
+def test_new_catalog_is_not_built(tmp_path):
+    assert not Catalog(tmp_path).is_built()
+
+
+def test_rebuild_stores_groups_and_versions(catalog):
+    assert catalog.is_built()
+    assert catalog.get_groups() == ["Alpha", "Beta", "Empty"]
+    assert catalog.get_group_versions("Alpha") == ["rel 03.03.2024", "v1 01.01.2024"]
+    assert catalog.get_groups_actual_versions() == [
+        ["Alpha", "rel 03.03.2024"],
+        ["Beta", "v2 02.02.2024"],
+        ["Empty", None],
+    ]
+    assert catalog.get_all_versions() == {
+        "Alpha": ["rel 03.03.2024", "v1 01.01.2024"],
+        "Beta": ["v2 02.02.2024"],
+        "Empty": [],
+    }
+    assert catalog.get_snapshots() == {"Alpha": 100, "Beta": 200, "Empty": None}
+
+
+def test_rebuild_replaces_the_content(catalog):
+    catalog.rebuild({"Gamma": (["v1 01.01.2024"], "v1 01.01.2024", 300)})
+
+    assert catalog.get_groups() == ["Gamma"]
+    assert catalog.get_snapshots() == {"Gamma": 300}
+    assert not catalog.has_group("Alpha")
+
+
+def test_catalog_of_an_older_schema_is_rebuilt(tmp_path):
+    # Schema version 1 also kept a required entry count in the snapshots
+    conn = sqlite3.connect(tmp_path / Catalog.FILE_NAME)
+    with conn:
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO meta VALUES ('schema_version', '1')")
+        conn.execute(
+            "CREATE TABLE snapshots (group_name TEXT PRIMARY KEY, mtime_ns INTEGER, entry_count INTEGER NOT NULL)"
+        )
+        conn.execute("INSERT INTO snapshots VALUES ('Alpha', 50, 2)")
+    conn.close()
+
+    catalog = Catalog(tmp_path)
+    assert not catalog.is_built()
+
+    catalog.rebuild(GROUPS)
+    assert catalog.is_built()
+    assert catalog.get_snapshots() == {"Alpha": 100, "Beta": 200, "Empty": None}
+
+
+def test_apply_changes_updates_only_the_given_groups(catalog):
+    catalog.apply_changes(
+        {
+            "Beta": (["v3 04.04.2024", "v2 02.02.2024"], "v3 04.04.2024", 250),
+            "Delta": (["v1 05.05.2024"], "v1 05.05.2024", 400),
+        },
+        removed=["Empty"],
+    )
+
+    assert catalog.get_groups_actual_versions() == [
+        ["Alpha", "rel 03.03.2024"],
+        ["Beta", "v3 04.04.2024"],
+        ["Delta", "v1 05.05.2024"],
+    ]
+    assert catalog.get_group_versions("Beta") == ["v3 04.04.2024", "v2 02.02.2024"]
+    assert catalog.get_snapshots() == {"Alpha": 100, "Beta": 250, "Delta": 400}
+    assert not catalog.has_group("Empty")
+    assert catalog.get_group_versions("Empty") == []
+
+
+def test_apply_changes_is_one_transaction(catalog):
+    # A version listed twice violates the primary key: nothing is written
+    with pytest.raises(sqlite3.IntegrityError):
+        catalog.apply_changes({"Beta": (["v3 04.04.2024", "v3 04.04.2024"], "v3 04.04.2024", 250)}, removed=["Alpha"])
+
+    assert catalog.get_groups() == ["Alpha", "Beta", "Empty"]
+    assert catalog.get_group_versions("Beta") == ["v2 02.02.2024"]
+    assert catalog.get_snapshots()["Beta"] == 200
+
+
+def test_cleared_snapshots_keep_the_groups(catalog):
+    catalog.clear_snapshots(["Alpha", "Missing"])
+
+    assert catalog.get_snapshots() == {"Alpha": None, "Beta": 200, "Empty": None}
+    assert catalog.get_group_versions("Alpha") == ["rel 03.03.2024", "v1 01.01.2024"]
+
+
+def test_replace_and_remove_group(catalog):
+    catalog.replace_group("Alpha", ["v1 01.01.2024"], "v1 01.01.2024", 150)
+    catalog.remove_group("Beta")
+
+    assert catalog.get_groups_actual_versions() == [["Alpha", "v1 01.01.2024"], ["Empty", None]]
+    assert catalog.get_snapshots() == {"Alpha": 150, "Empty": None}
@@ -0,0 +1,106 @@
+import io
+import os
+import struct
+import hashlib
+
+import pytest
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from classes.file_cipher import FileCipher
+
+
+CODECS = [None, *FileCipher.CODECS]
+
+
+def encrypt(cipher: FileCipher, data: bytes, compression: str | None = None) -> bytes:
+    """Return data encrypted into the chunked format."""
+    dst = io.BytesIO()
+    cipher.encrypt_stream(io.BytesIO(data), dst, compression=compression)
+    return dst.getvalue()
+
+
+def chunk_offsets(data: bytes) -> list[int]:
+    """Return offsets of the length fields of all chunks of an encrypted stream."""
+    offsets = []
+    offset = FileCipher.HEADER_STRUCT.size
+    while offset < len(data):
+        offsets.append(offset)
+        length = FileCipher.LENGTH_STRUCT.unpack_from(data, offset)[0] & ~FileCipher.LAST_CHUNK_FLAG
+        offset += FileCipher.LENGTH_STRUCT.size + length
+    return offsets
+
+
+@pytest.mark.parametrize("compression", CODECS)
+@pytest.mark.parametrize("size", [0, 1, 4096, 3 * 4096 + 17])
+def test_file_roundtrip(cipher, tmp_path, compression, size):
+    data = os.urandom(size // 2) + b"a" * (size - size // 2)
+    src, enc, dst = tmp_path / "src.bin", tmp_path / "src.bin.enc", tmp_path / "dst.bin"
+    src.write_bytes(data)
+
+    cipher.encrypt_file(src, enc, compression=compression)
+    cipher.decrypt_file(enc, dst)
+
+    assert dst.read_bytes() == data
+
+
+@pytest.mark.parametrize("compression", CODECS)
+def test_digest_covers_plaintext(cipher, compression):
+    data = os.urandom(10_000)
+    encrypt_digest, decrypt_digest = hashlib.sha256(), hashlib.sha256()
+
+    dst = io.BytesIO()
+    cipher.encrypt_stream(io.BytesIO(data), dst, compression=compression, digest=encrypt_digest)
+    cipher.decrypt_stream(io.BytesIO(dst.getvalue()), io.BytesIO(), digest=decrypt_digest)
+
+    assert encrypt_digest.digest() == decrypt_digest.digest() == hashlib.sha256(data).digest()
+
+
+def test_legacy_fernet_file(key, cipher):
+    data = b"encrypted by an older version of the program"
+    assert cipher.decrypt_bytes(Fernet(key).encrypt(data)) == data
+
+
+def test_wrong_key_is_rejected(cipher, key):
+    other = FileCipher(Fernet.generate_key(), chunk_size=4096)
+    with pytest.raises(InvalidToken):
+        other.decrypt_bytes(encrypt(cipher, b"secret"))
+
+
+@pytest.mark.parametrize("compression", CODECS)
+def test_truncated_stream_is_rejected(cipher, compression):
+    data = encrypt(cipher, os.urandom(3 * 4096), compression)
+    last_chunk = chunk_offsets(data)[-1]
+
+    for truncated in (data[:last_chunk], data[:-1], data[:FileCipher.HEADER_STRUCT.size]):
+        with pytest.raises(InvalidToken):
+            cipher.decrypt_bytes(truncated)
+
+
+def test_tampered_chunk_is_rejected(cipher):
+    data = bytearray(encrypt(cipher, os.urandom(3 * 4096)))
+    data[chunk_offsets(bytes(data))[1] + FileCipher.LENGTH_STRUCT.size] ^= 1
+
+    with pytest.raises(InvalidToken):
+        cipher.decrypt_bytes(bytes(data))
+
+
+def test_reordered_chunks_are_rejected(cipher):
+    data = encrypt(cipher, os.urandom(3 * 4096))
+    first, second, third = chunk_offsets(data)
+    swapped = data[:first] + data[second:third] + data[first:second] + data[third:]
+
+    with pytest.raises(InvalidToken):
+        cipher.decrypt_bytes(swapped)
+
+
+def test_oversized_chunk_length_is_rejected(cipher):
+    data = bytearray(encrypt(cipher, os.urandom(3 * 4096)))
+    # Longer than chunk_size + TAG_SIZE, although the stream holds that many bytes
+    struct.pack_into(">I", data, FileCipher.HEADER_STRUCT.size, 4096 + FileCipher.TAG_SIZE + 1)
+
+    src = io.BytesIO(bytes(data))
+    with pytest.raises(InvalidToken):
+        list(cipher.iter_decrypt(src))
+    # Rejected by the length field alone, before the chunk is read
+    assert src.tell() == FileCipher.HEADER_STRUCT.size + FileCipher.LENGTH_STRUCT.size
@@ -0,0 +1,144 @@
+import os
+import time
+
+import pytest
+
+from classes.object_store import ObjectStore
+
+
+BLOCK_SIZE = 1024
+GRACE_SECONDS = 3600.0
+
+
+@pytest.fixture
+def store(tmp_path, cipher) -> ObjectStore:
+    return ObjectStore(tmp_path / "group" / ObjectStore.DIR_NAME, cipher, block_size=BLOCK_SIZE)
+
+
+def add(store: ObjectStore, path, data: bytes, base_id: str | None = None) -> str:
+    """Store data as a full object or as a delta against base_id, with a signature as the model does."""
+    path.write_bytes(data)
+    object_id = store.object_id(path)
+    if base_id is None:
+        store.put(object_id, path)
+    else:
+        assert store.put_delta(object_id, path, base_id)
+    store.put_signature(object_id, path)
+    return object_id
+
+
+def make_old(store: ObjectStore) -> None:
+    """Date every file of the store back beyond the grace period, as if uploaded long ago."""
+    old = time.time() - 2 * GRACE_SECONDS
+    for entry in os.scandir(store.root):
+        os.utime(entry.path, (old, old))
+
+
+def stored_ids(store: ObjectStore) -> set[str]:
+    return {name.split(".", 1)[0] for name in os.listdir(store.root)}
+
+
+def changed(data: bytes) -> bytes:
+    """Return data with one block changed, so it is stored as a small delta."""
+    return data[:BLOCK_SIZE] + os.urandom(BLOCK_SIZE) + data[2 * BLOCK_SIZE:]
+
+
+def test_unreferenced_objects_are_deleted(store, tmp_path):
+    kept = add(store, tmp_path / "a.bin", os.urandom(4000))
+    dropped = add(store, tmp_path / "b.bin", os.urandom(4000))
+    make_old(store)
+
+    removed = store.collect_garbage({kept}, GRACE_SECONDS)
+
+    assert removed == 2  # The object and its signature
+    assert stored_ids(store) == {kept}
+    assert not store.has_object(dropped)
+
+
+def test_recent_objects_are_kept(store, tmp_path):
+    object_id = add(store, tmp_path / "a.bin", os.urandom(4000))
+
+    assert store.collect_garbage(set(), GRACE_SECONDS) == 0
+    assert stored_ids(store) == {object_id}
+
+
+def test_delta_bases_are_kept(store, tmp_path):
+    data = os.urandom(16 * BLOCK_SIZE)
+    base_id = add(store, tmp_path / "v1.bin", data)
+    middle_id = add(store, tmp_path / "v2.bin", changed(data), base_id)
+    target = changed(changed(data))
+    target_id = add(store, tmp_path / "v3.bin", target, middle_id)
+    make_old(store)
+
+    store.collect_garbage({target_id}, GRACE_SECONDS)
+
+    assert stored_ids(store) == {base_id, middle_id, target_id}
+    store.get(target_id, tmp_path / "restored.bin")
+    assert (tmp_path / "restored.bin").read_bytes() == target
+
+
+def test_reused_object_survives_collection(store, tmp_path):
+    path = tmp_path / "a.bin"
+    object_id = add(store, path, os.urandom(4000))
+    make_old(store)
+
+    # An upload reusing the object, before its manifest is written
+    assert store.put(object_id, path) is False
+    store.collect_garbage(set(), GRACE_SECONDS)
+
+    assert store.has_object(object_id)
+
+
+def test_delta_base_survives_collection(store, tmp_path):
+    data = os.urandom(16 * BLOCK_SIZE)
+    base_id = add(store, tmp_path / "v1.bin", data)
+    middle_id = add(store, tmp_path / "v2.bin", changed(data), base_id)
+    make_old(store)
+
+    # A new delta against the old chain touches the whole chain
+    target_id = add(store, tmp_path / "v3.bin", changed(changed(data)), middle_id)
+    store.collect_garbage(set(), GRACE_SECONDS)
+
+    assert stored_ids(store) == {base_id, middle_id, target_id}
+
+
+def test_object_deleted_meanwhile_is_written_again(store, tmp_path, cipher):
+    path = tmp_path / "a.bin"
+    object_id = add(store, path, os.urandom(4000))
+    assert store.has_object(object_id)
+
+    # Collected by another client; this store still lists the object as existing
+    other = ObjectStore(store.root, cipher, block_size=BLOCK_SIZE)
+    make_old(other)
+    other.collect_garbage(set(), GRACE_SECONDS)
+
+    assert store.put(object_id, path) is True
+    store.get(object_id, tmp_path / "restored.bin")
+    assert (tmp_path / "restored.bin").read_bytes() == path.read_bytes()
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_get_reports_plain_bytes_of_full_objects(store, tmp_path, compression):
+    data = b"text " * 3000
+    path = tmp_path / "a.bin"
+    path.write_bytes(data)
+    object_id = store.object_id(path)
+    store.put(object_id, path, compression=compression)
+
+    advanced = []
+    store.get(object_id, tmp_path / "restored.bin", advanced.append)
+
+    assert sum(advanced) == len(data)
+
+
+def test_get_reports_plain_bytes_of_delta_objects(store, tmp_path):
+    data = os.urandom(16 * BLOCK_SIZE)
+    new_data = changed(data)
+    base_id = add(store, tmp_path / "v1.bin", data)
+    delta_id = add(store, tmp_path / "v2.bin", new_data, base_id)
+
+    advanced = []
+    store.get(delta_id, tmp_path / "restored.bin", advanced.append)
+
+    assert (tmp_path / "restored.bin").read_bytes() == new_data
+    assert sum(advanced) == len(new_data)
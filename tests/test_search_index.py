@@ -0,0 +1,141 @@
+import pytest
+
+from classes.search_index import SearchIndex
+
+
+GROUPS = {
+    "Alpha Pump": ["rel 03.03.2024", "v2 02.02.2024", "v1 01.01.2024"],
+    "beta-valve": ["REL 05.05.2024", "draft 04.04.2024"],
+    "Gamma": ["v1 01.01.2024"],
+    "Empty group": [],
+    "Delta Tool": ["Pump fix 06.06.2024"],
+}
+ACTUAL = {
+    "Alpha Pump": "rel 03.03.2024",
+    "beta-valve": "REL 05.05.2024",
+    "Gamma": "v1 01.01.2024",
+    "Empty group": None,
+    "Delta Tool": "Pump fix 06.06.2024",
+}
+QUERIES = ["pump", "PUMP", "  rel ", "v1", "v2 02", "a", "ta", "2024", "-va", "group", "absent", "lpha p", " "]
+
+
+def baseline_search(groups: dict[str, list[str]], actual: dict[str, str | None], text: str) -> list:
+    """Search over groups and actual versions by scanning every name, as before the index."""
+    search_text = text.lower().strip()
+    result = []
+    for group in sorted(groups):
+        version = actual[group]
+        if search_text in group.lower().strip() or (version is not None and search_text in version.lower().strip()):
+            result.append([group, version])
+    return result
+
+
+def baseline_search_all(groups: dict[str, list[str]], text: str) -> list:
+    """Search over all versions by scanning every name, as before the index."""
+    search_text = text.lower().strip()
+    result = []
+    for group in sorted(groups):
+        group_matches = search_text in group.lower().strip()
+        if not groups[group]:
+            if group_matches:
+                result.append([group, None])
+            continue
+        result.extend(
+            [group, version] for version in groups[group]
+            if group_matches or search_text in version.lower().strip()
+        )
+    return result
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    index = SearchIndex()
+    index.build(GROUPS, ACTUAL)
+    return index
+
+
+@pytest.mark.parametrize("text", QUERIES)
+def test_search_matches_baseline(index, text):
+    assert index.search(text) == baseline_search(GROUPS, ACTUAL, text)
+
+
+@pytest.mark.parametrize("text", QUERIES)
+def test_search_all_matches_baseline(index, text):
+    assert index.search_all(text) == baseline_search_all(GROUPS, text)
+
+
+def test_empty_query_finds_nothing(index):
+    assert index.search("") == []
+    assert index.search_all("") == []
+
+
+def test_short_queries_scan_all_terms(index):
+    # Shorter than a trigram: no posting list is used
+    assert index.search("v2") == []  # Not an actual version anywhere
+    assert index.search_all("v2") == [["Alpha Pump", "v2 02.02.2024"]]
+    assert index.search_all("x") == [["Delta Tool", "Pump fix 06.06.2024"]]
+
+
+def test_version_matches_only_as_actual_version(index):
+    # "draft" is an older version of beta-valve, so only search_all finds it
+    assert index.search("draft") == []
+    assert index.search_all("draft") == [["beta-valve", "draft 04.04.2024"]]
+
+
+def test_update_group_replaces_its_versions(index):
+    index.update_group("Gamma", ["v3 07.07.2024", "v1 01.01.2024"], "v3 07.07.2024")
+
+    assert index.search("v3") == [["Gamma", "v3 07.07.2024"]]
+    assert index.search_all("v1") == [
+        ["Alpha Pump", "v1 01.01.2024"],
+        ["Gamma", "v1 01.01.2024"],
+    ]
+    # The former actual version is no longer found by the regular search
+    assert index.search("v1 01") == []
+
+
+def test_update_group_adds_a_new_group(index):
+    index.update_group("Omega", ["v1 01.01.2024"], "v1 01.01.2024")
+
+    assert index.search("v1 01") == [["Gamma", "v1 01.01.2024"], ["Omega", "v1 01.01.2024"]]
+    assert index.search("omeg") == [["Omega", "v1 01.01.2024"]]
+
+
+def test_remove_group_drops_its_terms(index):
+    index.remove_group("Delta Tool")
+
+    assert index.search("pump") == [["Alpha Pump", "rel 03.03.2024"]]
+    assert index.search_all("fix") == []
+    assert index.search("delta") == []
+
+
+def test_removing_one_of_equal_names_keeps_the_other(index):
+    # "v1 01.01.2024" is shared by Alpha Pump and Gamma
+    index.remove_group("Gamma")
+
+    assert index.search_all("v1 01") == [["Alpha Pump", "v1 01.01.2024"]]
+
+
+def test_incremental_updates_match_a_rebuild(index):
+    groups = dict(GROUPS)
+    actual = dict(ACTUAL)
+
+    groups["beta-valve"] = ["fix 08.08.2024", "REL 05.05.2024"]
+    actual["beta-valve"] = "fix 08.08.2024"
+    index.update_group("beta-valve", groups["beta-valve"], actual["beta-valve"])
+    del groups["Alpha Pump"], actual["Alpha Pump"]
+    index.remove_group("Alpha Pump")
+
+    rebuilt = SearchIndex()
+    rebuilt.build(groups, actual)
+    for text in QUERIES + ["fix"]:
+        assert index.search(text) == rebuilt.search(text) == baseline_search(groups, actual, text)
+        assert index.search_all(text) == rebuilt.search_all(text) == baseline_search_all(groups, text)
+
+
+def test_clear_requires_a_rebuild(index):
+    index.clear()
+
+    assert not index.is_built
+    assert index.search("pump") == []
@@ -0,0 +1,135 @@
+import os
+
+import pytest
+
+from classes.transfer_journal import TransferJournal
+
+
+HASH_KEY = b"k" * 32
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / f"~transfer{TransferJournal.EXTENSION}"
+
+
+def write(path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def reopen(journal_path) -> TransferJournal:
+    """Open the journal as the next attempt of the transfer does."""
+    journal = TransferJournal(journal_path, HASH_KEY)
+    journal.load()
+    return journal
+
+
+def test_committed_files_are_skipped_after_a_restart(tmp_path, journal_path):
+    done = write(tmp_path / "out" / "a.bin", os.urandom(3000))
+    with TransferJournal(journal_path, HASH_KEY) as journal:
+        journal.record("a.bin", done, object_id="abc")
+
+    resumed = reopen(journal_path)
+
+    assert resumed.is_committed("a.bin", done)
+    assert not resumed.is_committed("b.bin", tmp_path / "out" / "b.bin")
+    assert resumed.get("a.bin")["object_id"] == "abc"
+
+
+def test_streamed_digest_matches_the_file_digest(tmp_path, journal_path):
+    data = os.urandom(3000)
+    path = write(tmp_path / "a.bin", data)
+    journal = TransferJournal(journal_path, HASH_KEY)
+
+    digest = journal.new_digest()
+    digest.update(data[:1000])
+    digest.update(data[1000:])
+    journal.record("a.bin", path, digest=digest.hexdigest())
+    journal.close()
+
+    assert reopen(journal_path).get("a.bin")["digest"] == journal.digest_file(path)
+
+
+def test_unchanged_file_with_new_mtime_is_hashed(tmp_path, journal_path):
+    path = write(tmp_path / "a.bin", os.urandom(3000))
+    with TransferJournal(journal_path, HASH_KEY) as journal:
+        journal.record("a.bin", path)
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert reopen(journal_path).is_committed("a.bin", path)
+
+
+def test_changed_files_are_transferred_again(tmp_path, journal_path):
+    same_size = write(tmp_path / "a.bin", os.urandom(3000))
+    other_size = write(tmp_path / "b.bin", os.urandom(3000))
+    removed = write(tmp_path / "c.bin", os.urandom(3000))
+    with TransferJournal(journal_path, HASH_KEY) as journal:
+        for path in (same_size, other_size, removed):
+            journal.record(path.name, path)
+
+    stat = os.stat(same_size)
+    same_size.write_bytes(os.urandom(3000))
+    os.utime(same_size, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    other_size.write_bytes(os.urandom(100))
+    removed.unlink()
+
+    resumed = reopen(journal_path)
+    assert not resumed.is_committed("a.bin", same_size)
+    assert not resumed.is_committed("b.bin", other_size)
+    assert not resumed.is_committed("c.bin", removed)
+
+
+def test_line_cut_off_by_a_crash_is_ignored(tmp_path, journal_path):
+    first = write(tmp_path / "a.bin", b"first")
+    second = write(tmp_path / "b.bin", b"second")
+    with TransferJournal(journal_path, HASH_KEY) as journal:
+        journal.record("a.bin", first)
+        journal.record("b.bin", second)
+
+    content = journal_path.read_bytes()
+    journal_path.write_bytes(content[:-10])
+
+    resumed = TransferJournal(journal_path, HASH_KEY)
+    assert resumed.load() == 1
+    assert resumed.is_committed("a.bin", first)
+    assert not resumed.is_committed("b.bin", second)
+
+
+def test_records_of_the_next_attempt_are_appended(tmp_path, journal_path):
+    first = write(tmp_path / "a.bin", b"first")
+    second = write(tmp_path / "b.bin", b"second")
+    with TransferJournal(journal_path, HASH_KEY) as journal:
+        journal.record("a.bin", first)
+
+    with reopen(journal_path) as journal:
+        journal.record("b.bin", second)
+
+    assert len(reopen(journal_path).records) == 2
+
+
+def test_journal_reveals_no_file_names(tmp_path, journal_path):
+    path = write(tmp_path / "secret report.docx", b"data")
+    with TransferJournal(journal_path, HASH_KEY) as journal:
+        journal.record("secret report.docx", path)
+
+    assert b"secret" not in journal_path.read_bytes()
+    # Another key gives other path keys, so the journal of another archive matches nothing
+    other = TransferJournal(journal_path, b"x" * 32)
+    other.load()
+    assert other.get("secret report.docx") is None
+
+
+def test_remove_deletes_the_journal(tmp_path, journal_path):
+    path = write(tmp_path / "a.bin", b"data")
+    journal = TransferJournal(journal_path, HASH_KEY)
+    journal.record("a.bin", path)
+
+    journal.remove()
+
+    assert not journal_path.exists()
+    assert journal.get("a.bin") is None
+    assert reopen(journal_path).records == []
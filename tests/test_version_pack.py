@@ -0,0 +1,146 @@
+import os
+import hashlib
+
+import pytest
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from classes.file_cipher import FileCipher
+from classes.version_pack import PackReader, PackWriter, VersionPack
+
+
+FILES = {
+    "readme.txt": b"text " * 2000,
+    "docs/a.bin": os.urandom(10000),
+    "docs/empty.txt": b"",
+}
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Plain files of a version."""
+    root = tmp_path / "src"
+    for rel_path, data in FILES.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return root
+
+
+def write_pack(path, cipher, source, compression=None):
+    with PackWriter(path, cipher) as pack:
+        pack.add_directory("docs")
+        pack.add_directory("docs/empty dir")
+        for rel_path in FILES:
+            pack.add_file(rel_path, source / rel_path, compression=compression)
+    return path
+
+
+@pytest.fixture
+def pack_path(tmp_path, cipher, source):
+    return write_pack(tmp_path / f"v1{VersionPack.EXTENSION}", cipher, source)
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_round_trip(tmp_path, cipher, source, compression):
+    pack_path = write_pack(tmp_path / "v1.pack", cipher, source, compression)
+
+    with PackReader(pack_path, cipher) as pack:
+        assert pack.directories == ["docs", "docs/empty dir"]
+        assert [(entry.path, entry.size) for entry in pack.entries] == [
+            (rel_path, len(data)) for rel_path, data in FILES.items()
+        ]
+        pack.extract_all(tmp_path / "out")
+
+    for rel_path, data in FILES.items():
+        assert (tmp_path / "out" / rel_path).read_bytes() == data
+    assert (tmp_path / "out" / "docs" / "empty dir").is_dir()
+
+
+def test_single_files_are_read_on_demand(tmp_path, cipher, pack_path):
+    with PackReader(pack_path, cipher) as pack:
+        entries = {entry.path: entry for entry in pack.entries}
+        assert b"".join(pack.iter_file(entries["docs/a.bin"])) == FILES["docs/a.bin"]
+
+        advanced = []
+        pack.extract(entries["readme.txt"], tmp_path / "readme.txt", advanced.append)
+        assert (tmp_path / "readme.txt").read_bytes() == FILES["readme.txt"]
+        assert sum(advanced) == entries["readme.txt"].length
+        assert pack.total_length == sum(entry.length for entry in pack.entries)
+
+
+def test_digests_are_stored_in_the_index(tmp_path, cipher, source):
+    key = b"d" * 32
+    pack_path = tmp_path / "v1.pack"
+    with PackWriter(pack_path, cipher) as pack:
+        for rel_path in FILES:
+            digest = hashlib.blake2b(key=key, digest_size=32)
+            pack.add_file(rel_path, source / rel_path, digest=digest)
+
+    with PackReader(pack_path, cipher) as pack:
+        for rel_path, data in FILES.items():
+            expected = hashlib.blake2b(data, key=key, digest_size=32).hexdigest()
+            assert pack.digests[rel_path] == expected
+
+
+def test_pack_without_digests_has_empty_digests(cipher, pack_path):
+    with PackReader(pack_path, cipher) as pack:
+        assert pack.digests == {}
+
+
+@pytest.mark.parametrize("cut", [1, VersionPack.TRAILER_STRUCT.size, VersionPack.TRAILER_STRUCT.size + 10])
+def test_truncated_trailer_is_rejected(cipher, pack_path, cut):
+    data = pack_path.read_bytes()
+    pack_path.write_bytes(data[:-cut])
+
+    with pytest.raises(InvalidToken):
+        PackReader(pack_path, cipher)
+
+
+def test_interrupted_pack_is_rejected(tmp_path, cipher, source):
+    pack_path = tmp_path / "v1.pack"
+    with pytest.raises(RuntimeError):
+        with PackWriter(pack_path, cipher) as pack:
+            pack.add_file("readme.txt", source / "readme.txt")
+            raise RuntimeError("connection lost")
+
+    with pytest.raises(InvalidToken):
+        PackReader(pack_path, cipher)
+
+
+def test_damaged_index_is_rejected(cipher, pack_path):
+    data = bytearray(pack_path.read_bytes())
+    data[-VersionPack.TRAILER_STRUCT.size - 5] ^= 1
+    pack_path.write_bytes(bytes(data))
+
+    with pytest.raises(InvalidToken):
+        PackReader(pack_path, cipher)
+
+
+def test_wrong_key_is_rejected(cipher, pack_path):
+    with pytest.raises(InvalidToken):
+        PackReader(pack_path, FileCipher(Fernet.generate_key(), chunk_size=4096))
+
+
+def test_interrupted_pack_is_resumed(tmp_path, cipher, source):
+    pack_path = tmp_path / "v1.pack"
+    pack = PackWriter(pack_path, cipher)
+    pack.add_directory("docs")
+    first = pack.add_file("readme.txt", source / "readme.txt")
+    pack.flush()
+    resume_offset = pack.offset
+    # Half of the next file was written when the upload stopped
+    pack.add_file("docs/a.bin", source / "docs" / "a.bin")
+    pack.abort()
+    with open(pack_path, "r+b") as f:
+        f.truncate(resume_offset + 100)
+
+    with PackWriter(pack_path, cipher, resume_offset=resume_offset, entries=[first]) as pack:
+        pack.add_directory("docs")
+        pack.add_file("docs/a.bin", source / "docs" / "a.bin")
+        pack.add_file("docs/empty.txt", source / "docs" / "empty.txt")
+
+    with PackReader(pack_path, cipher) as pack:
+        pack.extract_all(tmp_path / "out")
+    for rel_path, data in FILES.items():
+        assert (tmp_path / "out" / rel_path).read_bytes() == data
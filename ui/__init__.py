@@ -1,4 +1,6 @@
 from .mainUI import Ui_MainWindow
 from .passwordUI import Ui_PasswordDialog
 from .message_boxUI import Ui_MessageBoxDialog
-from .action_message_boxUI import Ui_ActionMessageBoxDialog
\ No newline at end of file
+from .action_message_boxUI import Ui_ActionMessageBoxDialog
+from .addPageUI import Ui_AddPage
+from .deletePageUI import Ui_DeletePage
\ No newline at end of file
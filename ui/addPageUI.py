@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ui/addPageUI.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_AddPage(object):
+    def setupUi(self, add_page):
+        add_page.setObjectName("add_page")
+        self.verticalLayout_13 = QtWidgets.QVBoxLayout(add_page)
+        self.verticalLayout_13.setContentsMargins(8, 16, 8, 16)
+        self.verticalLayout_13.setSpacing(16)
+        self.verticalLayout_13.setObjectName("verticalLayout_13")
+        self.choose_or_create_frame = QtWidgets.QFrame(add_page)
+        self.choose_or_create_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.choose_or_create_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.choose_or_create_frame.setObjectName("choose_or_create_frame")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.choose_or_create_frame)
+        self.verticalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_8.setSpacing(8)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.choose_or_create_label = QtWidgets.QLabel(self.choose_or_create_frame)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(14)
+        self.choose_or_create_label.setFont(font)
+        self.choose_or_create_label.setObjectName("choose_or_create_label")
+        self.verticalLayout_8.addWidget(self.choose_or_create_label)
+        self.choose_or_create_actions_frame = QtWidgets.QFrame(self.choose_or_create_frame)
+        self.choose_or_create_actions_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.choose_or_create_actions_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.choose_or_create_actions_frame.setObjectName("choose_or_create_actions_frame")
+        self.horizontalLayout_12 = QtWidgets.QHBoxLayout(self.choose_or_create_actions_frame)
+        self.horizontalLayout_12.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_12.setSpacing(16)
+        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
+        self.groups_comboBox = QtWidgets.QComboBox(self.choose_or_create_actions_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groups_comboBox.sizePolicy().hasHeightForWidth())
+        self.groups_comboBox.setSizePolicy(sizePolicy)
+        self.groups_comboBox.setMinimumSize(QtCore.QSize(130, 0))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.groups_comboBox.setFont(font)
+        self.groups_comboBox.setObjectName("groups_comboBox")
+        self.horizontalLayout_12.addWidget(self.groups_comboBox)
+        self.line_3 = QtWidgets.QFrame(self.choose_or_create_actions_frame)
+        self.line_3.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.horizontalLayout_12.addWidget(self.line_3)
+        self.create_group_actions_frame = QtWidgets.QFrame(self.choose_or_create_actions_frame)
+        self.create_group_actions_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.create_group_actions_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.create_group_actions_frame.setObjectName("create_group_actions_frame")
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout(self.create_group_actions_frame)
+        self.horizontalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_6.setSpacing(8)
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.group_name_lineEdit = QtWidgets.QLineEdit(self.create_group_actions_frame)
+        self.group_name_lineEdit.setMinimumSize(QtCore.QSize(130, 0))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.group_name_lineEdit.setFont(font)
+        self.group_name_lineEdit.setClearButtonEnabled(True)
+        self.group_name_lineEdit.setObjectName("group_name_lineEdit")
+        self.horizontalLayout_6.addWidget(self.group_name_lineEdit)
+        self.create_group_pushButton = QtWidgets.QPushButton(self.create_group_actions_frame)
+        self.create_group_pushButton.setEnabled(False)
+        self.create_group_pushButton.setMinimumSize(QtCore.QSize(100, 0))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.create_group_pushButton.setFont(font)
+        self.create_group_pushButton.setObjectName("create_group_pushButton")
+        self.horizontalLayout_6.addWidget(self.create_group_pushButton)
+        self.horizontalLayout_12.addWidget(self.create_group_actions_frame)
+        self.verticalLayout_8.addWidget(self.choose_or_create_actions_frame)
+        self.verticalLayout_13.addWidget(self.choose_or_create_frame)
+        self.select_add_format_frame = QtWidgets.QFrame(add_page)
+        self.select_add_format_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.select_add_format_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.select_add_format_frame.setObjectName("select_add_format_frame")
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.select_add_format_frame)
+        self.verticalLayout_12.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_12.setSpacing(16)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.selecet_format_frame = QtWidgets.QFrame(self.select_add_format_frame)
+        self.selecet_format_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.selecet_format_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.selecet_format_frame.setObjectName("selecet_format_frame")
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout(self.selecet_format_frame)
+        self.verticalLayout_11.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_11.setSpacing(8)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.select_type_label = QtWidgets.QLabel(self.selecet_format_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.select_type_label.sizePolicy().hasHeightForWidth())
+        self.select_type_label.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(14)
+        self.select_type_label.setFont(font)
+        self.select_type_label.setObjectName("select_type_label")
+        self.verticalLayout_11.addWidget(self.select_type_label)
+        self.select_add_format_actions_frame = QtWidgets.QFrame(self.selecet_format_frame)
+        self.select_add_format_actions_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.select_add_format_actions_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.select_add_format_actions_frame.setObjectName("select_add_format_actions_frame")
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.select_add_format_actions_frame)
+        self.horizontalLayout_8.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_8.setSpacing(16)
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.version_radioButton = QtWidgets.QRadioButton(self.select_add_format_actions_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.version_radioButton.sizePolicy().hasHeightForWidth())
+        self.version_radioButton.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.version_radioButton.setFont(font)
+        self.version_radioButton.setChecked(True)
+        self.version_radioButton.setObjectName("version_radioButton")
+        self.horizontalLayout_8.addWidget(self.version_radioButton)
+        self.instruction_radioButton = QtWidgets.QRadioButton(self.select_add_format_actions_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.instruction_radioButton.sizePolicy().hasHeightForWidth())
+        self.instruction_radioButton.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.instruction_radioButton.setFont(font)
+        self.instruction_radioButton.setObjectName("instruction_radioButton")
+        self.horizontalLayout_8.addWidget(self.instruction_radioButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_8.addItem(spacerItem)
+        self.verticalLayout_11.addWidget(self.select_add_format_actions_frame)
+        self.verticalLayout_12.addWidget(self.selecet_format_frame)
+        self.add_format_stackedWidget = QtWidgets.QStackedWidget(self.select_add_format_frame)
+        self.add_format_stackedWidget.setObjectName("add_format_stackedWidget")
+        self.version_page = QtWidgets.QWidget()
+        self.version_page.setObjectName("version_page")
+        self.verticalLayout_14 = QtWidgets.QVBoxLayout(self.version_page)
+        self.verticalLayout_14.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_14.setSpacing(16)
+        self.verticalLayout_14.setObjectName("verticalLayout_14")
+        self.choose_version_folder_label = QtWidgets.QLabel(self.version_page)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.choose_version_folder_label.sizePolicy().hasHeightForWidth())
+        self.choose_version_folder_label.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_version_folder_label.setFont(font)
+        self.choose_version_folder_label.setObjectName("choose_version_folder_label")
+        self.verticalLayout_14.addWidget(self.choose_version_folder_label)
+        self.choose_version_folder_frame = QtWidgets.QFrame(self.version_page)
+        self.choose_version_folder_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.choose_version_folder_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.choose_version_folder_frame.setObjectName("choose_version_folder_frame")
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout(self.choose_version_folder_frame)
+        self.horizontalLayout_9.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_9.setSpacing(8)
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.choose_version_folder_lineEdit = QtWidgets.QLineEdit(self.choose_version_folder_frame)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_version_folder_lineEdit.setFont(font)
+        self.choose_version_folder_lineEdit.setClearButtonEnabled(True)
+        self.choose_version_folder_lineEdit.setObjectName("choose_version_folder_lineEdit")
+        self.horizontalLayout_9.addWidget(self.choose_version_folder_lineEdit)
+        self.choose_version_folder_pushButton = QtWidgets.QPushButton(self.choose_version_folder_frame)
+        self.choose_version_folder_pushButton.setMinimumSize(QtCore.QSize(100, 0))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_version_folder_pushButton.setFont(font)
+        self.choose_version_folder_pushButton.setObjectName("choose_version_folder_pushButton")
+        self.horizontalLayout_9.addWidget(self.choose_version_folder_pushButton)
+        self.verticalLayout_14.addWidget(self.choose_version_folder_frame)
+        self.add_version_pushButton = QtWidgets.QPushButton(self.version_page)
+        self.add_version_pushButton.setEnabled(False)
+        self.add_version_pushButton.setMinimumSize(QtCore.QSize(0, 35))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.add_version_pushButton.setFont(font)
+        self.add_version_pushButton.setStyleSheet("/* === Accent Button === */\n"
+"QPushButton {\n"
+"    background-color: #2563EB;\n"
+"    color: #FFFFFF;\n"
+"    font-weight: bold;\n"
+"    border: none;\n"
+"    border-radius: 6px;\n"
+"    padding: 6px 12px;\n"
+"}\n"
+"\n"
+"/* ===Hover === */\n"
+"QPushButton:hover {\n"
+"    background-color: #5283EF;\n"
+"}\n"
+"\n"
+"/* === Pressed / Checked === */\n"
+"QPushButton:pressed,\n"
+"QPushButton:checked {\n"
+"    background-color: #124CC9;\n"
+"}\n"
+"\n"
+"/* === Disabled === */\n"
+"QPushButton:disabled {\n"
+"    background-color: #DEE8FC;\n"
+"    color: #FFFFFF; \n"
+"    border: none;\n"
+"    border-radius: 6px;\n"
+"}")
+        self.add_version_pushButton.setObjectName("add_version_pushButton")
+        self.verticalLayout_14.addWidget(self.add_version_pushButton)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 300, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_14.addItem(spacerItem1)
+        self.add_format_stackedWidget.addWidget(self.version_page)
+        self.instruction_page = QtWidgets.QWidget()
+        self.instruction_page.setObjectName("instruction_page")
+        self.verticalLayout_15 = QtWidgets.QVBoxLayout(self.instruction_page)
+        self.verticalLayout_15.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_15.setSpacing(16)
+        self.verticalLayout_15.setObjectName("verticalLayout_15")
+        self.choose_instruction_file_label = QtWidgets.QLabel(self.instruction_page)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.choose_instruction_file_label.sizePolicy().hasHeightForWidth())
+        self.choose_instruction_file_label.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_instruction_file_label.setFont(font)
+        self.choose_instruction_file_label.setObjectName("choose_instruction_file_label")
+        self.verticalLayout_15.addWidget(self.choose_instruction_file_label)
+        self.choose_instruction_file_frame = QtWidgets.QFrame(self.instruction_page)
+        self.choose_instruction_file_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.choose_instruction_file_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.choose_instruction_file_frame.setObjectName("choose_instruction_file_frame")
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout(self.choose_instruction_file_frame)
+        self.horizontalLayout_10.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_10.setSpacing(8)
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.choose_instruction_file_lineEdit = QtWidgets.QLineEdit(self.choose_instruction_file_frame)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_instruction_file_lineEdit.setFont(font)
+        self.choose_instruction_file_lineEdit.setClearButtonEnabled(True)
+        self.choose_instruction_file_lineEdit.setObjectName("choose_instruction_file_lineEdit")
+        self.horizontalLayout_10.addWidget(self.choose_instruction_file_lineEdit)
+        self.choose_instruction_file_pushButton = QtWidgets.QPushButton(self.choose_instruction_file_frame)
+        self.choose_instruction_file_pushButton.setEnabled(True)
+        self.choose_instruction_file_pushButton.setMinimumSize(QtCore.QSize(100, 0))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_instruction_file_pushButton.setFont(font)
+        self.choose_instruction_file_pushButton.setObjectName("choose_instruction_file_pushButton")
+        self.horizontalLayout_10.addWidget(self.choose_instruction_file_pushButton)
+        self.verticalLayout_15.addWidget(self.choose_instruction_file_frame)
+        self.add_instruction_pushButton = QtWidgets.QPushButton(self.instruction_page)
+        self.add_instruction_pushButton.setEnabled(False)
+        self.add_instruction_pushButton.setMinimumSize(QtCore.QSize(0, 35))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.add_instruction_pushButton.setFont(font)
+        self.add_instruction_pushButton.setStyleSheet("/* === Accent Button === */\n"
+"QPushButton {\n"
+"    background-color: #2563EB;\n"
+"    color: #FFFFFF;\n"
+"    font-weight: bold;\n"
+"    border: none;\n"
+"    border-radius: 6px;\n"
+"    padding: 6px 12px;\n"
+"}\n"
+"\n"
+"/* ===Hover === */\n"
+"QPushButton:hover {\n"
+"    background-color: #5283EF;\n"
+"}\n"
+"\n"
+"/* === Pressed / Checked === */\n"
+"QPushButton:pressed,\n"
+"QPushButton:checked {\n"
+"    background-color: #124CC9;\n"
+"}\n"
+"\n"
+"/* === Disabled === */\n"
+"QPushButton:disabled {\n"
+"    background-color: #DEE8FC;\n"
+"    color: #FFFFFF; \n"
+"    border: none;\n"
+"    border-radius: 6px;\n"
+"}")
+        self.add_instruction_pushButton.setObjectName("add_instruction_pushButton")
+        self.verticalLayout_15.addWidget(self.add_instruction_pushButton)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 300, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_15.addItem(spacerItem2)
+        self.add_format_stackedWidget.addWidget(self.instruction_page)
+        self.verticalLayout_12.addWidget(self.add_format_stackedWidget)
+        self.verticalLayout_13.addWidget(self.select_add_format_frame)
+
+        self.retranslateUi(add_page)
+        self.add_format_stackedWidget.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(add_page)
+
+    def retranslateUi(self, add_page):
+        _translate = QtCore.QCoreApplication.translate
+        self.choose_or_create_label.setText(_translate("AddPage", "Выберите группу или создайте новую:"))
+        self.group_name_lineEdit.setPlaceholderText(_translate("AddPage", "БВВ.01"))
+        self.create_group_pushButton.setText(_translate("AddPage", "Создать"))
+        self.select_type_label.setText(_translate("AddPage", "Выберите что хотите добавить:"))
+        self.version_radioButton.setText(_translate("AddPage", "Версия"))
+        self.instruction_radioButton.setText(_translate("AddPage", "Инструкция"))
+        self.choose_version_folder_label.setText(_translate("AddPage", "Выберите папку или вставьте путь к ней:"))
+        self.choose_version_folder_lineEdit.setPlaceholderText(_translate("AddPage", "C:\\"))
+        self.choose_version_folder_pushButton.setText(_translate("AddPage", "Выбрать"))
+        self.add_version_pushButton.setText(_translate("AddPage", "Добавить"))
+        self.choose_instruction_file_label.setText(_translate("AddPage", "Выберите файл или вставьте путь к нему:"))
+        self.choose_instruction_file_lineEdit.setPlaceholderText(_translate("AddPage", "C:\\"))
+        self.choose_instruction_file_pushButton.setText(_translate("AddPage", "Выбрать"))
+        self.add_instruction_pushButton.setText(_translate("AddPage", "Добавить"))
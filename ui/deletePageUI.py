@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ui/deletePageUI.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_DeletePage(object):
+    def setupUi(self, delete_page):
+        delete_page.setObjectName("delete_page")
+        self.verticalLayout_17 = QtWidgets.QVBoxLayout(delete_page)
+        self.verticalLayout_17.setContentsMargins(8, 16, 8, 16)
+        self.verticalLayout_17.setSpacing(16)
+        self.verticalLayout_17.setObjectName("verticalLayout_17")
+        self.what_delete_frame = QtWidgets.QFrame(delete_page)
+        self.what_delete_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.what_delete_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.what_delete_frame.setObjectName("what_delete_frame")
+        self.verticalLayout_16 = QtWidgets.QVBoxLayout(self.what_delete_frame)
+        self.verticalLayout_16.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_16.setSpacing(8)
+        self.verticalLayout_16.setObjectName("verticalLayout_16")
+        self.what_delete_label = QtWidgets.QLabel(self.what_delete_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.what_delete_label.sizePolicy().hasHeightForWidth())
+        self.what_delete_label.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(14)
+        self.what_delete_label.setFont(font)
+        self.what_delete_label.setObjectName("what_delete_label")
+        self.verticalLayout_16.addWidget(self.what_delete_label)
+        self.what_delete_actions_frame = QtWidgets.QFrame(self.what_delete_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.what_delete_actions_frame.sizePolicy().hasHeightForWidth())
+        self.what_delete_actions_frame.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.what_delete_actions_frame.setFont(font)
+        self.what_delete_actions_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.what_delete_actions_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.what_delete_actions_frame.setObjectName("what_delete_actions_frame")
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout(self.what_delete_actions_frame)
+        self.horizontalLayout_11.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_11.setSpacing(16)
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.what_delete_file_radioButton = QtWidgets.QRadioButton(self.what_delete_actions_frame)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.what_delete_file_radioButton.setFont(font)
+        self.what_delete_file_radioButton.setChecked(True)
+        self.what_delete_file_radioButton.setObjectName("what_delete_file_radioButton")
+        self.horizontalLayout_11.addWidget(self.what_delete_file_radioButton)
+        self.what_delete_group_radioButton = QtWidgets.QRadioButton(self.what_delete_actions_frame)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.what_delete_group_radioButton.setFont(font)
+        self.what_delete_group_radioButton.setObjectName("what_delete_group_radioButton")
+        self.horizontalLayout_11.addWidget(self.what_delete_group_radioButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_11.addItem(spacerItem)
+        self.verticalLayout_16.addWidget(self.what_delete_actions_frame)
+        self.verticalLayout_17.addWidget(self.what_delete_frame)
+        self.delete_stackedWidget = QtWidgets.QStackedWidget(delete_page)
+        self.delete_stackedWidget.setObjectName("delete_stackedWidget")
+        self.delete_file_page = QtWidgets.QWidget()
+        self.delete_file_page.setObjectName("delete_file_page")
+        self.verticalLayout_20 = QtWidgets.QVBoxLayout(self.delete_file_page)
+        self.verticalLayout_20.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_20.setSpacing(16)
+        self.verticalLayout_20.setObjectName("verticalLayout_20")
+        self.choose_group_to_delete_frame = QtWidgets.QFrame(self.delete_file_page)
+        self.choose_group_to_delete_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.choose_group_to_delete_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.choose_group_to_delete_frame.setObjectName("choose_group_to_delete_frame")
+        self.verticalLayout_19 = QtWidgets.QVBoxLayout(self.choose_group_to_delete_frame)
+        self.verticalLayout_19.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_19.setSpacing(8)
+        self.verticalLayout_19.setObjectName("verticalLayout_19")
+        self.choose_group_to_delete_label = QtWidgets.QLabel(self.choose_group_to_delete_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.choose_group_to_delete_label.sizePolicy().hasHeightForWidth())
+        self.choose_group_to_delete_label.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_group_to_delete_label.setFont(font)
+        self.choose_group_to_delete_label.setObjectName("choose_group_to_delete_label")
+        self.verticalLayout_19.addWidget(self.choose_group_to_delete_label)
+        self.choose_group_to_delete_comboBox = QtWidgets.QComboBox(self.choose_group_to_delete_frame)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_group_to_delete_comboBox.setFont(font)
+        self.choose_group_to_delete_comboBox.setObjectName("choose_group_to_delete_comboBox")
+        self.verticalLayout_19.addWidget(self.choose_group_to_delete_comboBox)
+        self.verticalLayout_20.addWidget(self.choose_group_to_delete_frame)
+        self.choose_file_to_delete_frame = QtWidgets.QFrame(self.delete_file_page)
+        self.choose_file_to_delete_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.choose_file_to_delete_frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.choose_file_to_delete_frame.setObjectName("choose_file_to_delete_frame")
+        self.verticalLayout_18 = QtWidgets.QVBoxLayout(self.choose_file_to_delete_frame)
+        self.verticalLayout_18.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_18.setSpacing(8)
+        self.verticalLayout_18.setObjectName("verticalLayout_18")
+        self.choose_file_to_delete_label = QtWidgets.QLabel(self.choose_file_to_delete_frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.choose_file_to_delete_label.sizePolicy().hasHeightForWidth())
+        self.choose_file_to_delete_label.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_file_to_delete_label.setFont(font)
+        self.choose_file_to_delete_label.setObjectName("choose_file_to_delete_label")
+        self.verticalLayout_18.addWidget(self.choose_file_to_delete_label)
+        self.choose_file_to_delete_comboBox = QtWidgets.QComboBox(self.choose_file_to_delete_frame)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_file_to_delete_comboBox.setFont(font)
+        self.choose_file_to_delete_comboBox.setObjectName("choose_file_to_delete_comboBox")
+        self.verticalLayout_18.addWidget(self.choose_file_to_delete_comboBox)
+        self.verticalLayout_20.addWidget(self.choose_file_to_delete_frame)
+        self.accept_file_delete_checkBox = QtWidgets.QCheckBox(self.delete_file_page)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.accept_file_delete_checkBox.setFont(font)
+        self.accept_file_delete_checkBox.setObjectName("accept_file_delete_checkBox")
+        self.verticalLayout_20.addWidget(self.accept_file_delete_checkBox)
+        self.delete_file_pushButton = QtWidgets.QPushButton(self.delete_file_page)
+        self.delete_file_pushButton.setEnabled(False)
+        self.delete_file_pushButton.setMinimumSize(QtCore.QSize(0, 35))
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.delete_file_pushButton.setFont(font)
+        self.delete_file_pushButton.setStyleSheet("/* === Accent Button === */\n"
+"QPushButton {\n"
+"    background-color: #2563EB;\n"
+"    color: #FFFFFF;\n"
+"    font-weight: bold;\n"
+"    border: none;\n"
+"    border-radius: 6px;\n"
+"    padding: 6px 12px;\n"
+"}\n"
+"\n"
+"/* ===Hover === */\n"
+"QPushButton:hover {\n"
+"    background-color: #5283EF;\n"
+"}\n"
+"\n"
+"/* === Pressed / Checked === */\n"
+"QPushButton:pressed,\n"
+"QPushButton:checked {\n"
+"    background-color: #124CC9;\n"
+"}\n"
+"\n"
+"/* === Disabled === */\n"
+"QPushButton:disabled {\n"
+"    background-color: #DEE8FC;\n"
+"    color: #FFFFFF; \n"
+"    border: none;\n"
+"    border-radius: 6px;\n"
+"}")
+        self.delete_file_pushButton.setObjectName("delete_file_pushButton")
+        self.verticalLayout_20.addWidget(self.delete_file_pushButton)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 283, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_20.addItem(spacerItem1)
+        self.delete_stackedWidget.addWidget(self.delete_file_page)
+        self.delete_group_page = QtWidgets.QWidget()
+        self.delete_group_page.setObjectName("delete_group_page")
+        self.verticalLayout_22 = QtWidgets.QVBoxLayout(self.delete_group_page)
+        self.verticalLayout_22.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_22.setSpacing(16)
+        self.verticalLayout_22.setObjectName("verticalLayout_22")
+        self.choose_group_to_delete_frame_2 = QtWidgets.QFrame(self.delete_group_page)
+        self.choose_group_to_delete_frame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.choose_group_to_delete_frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.choose_group_to_delete_frame_2.setObjectName("choose_group_to_delete_frame_2")
+        self.verticalLayout_21 = QtWidgets.QVBoxLayout(self.choose_group_to_delete_frame_2)
+        self.verticalLayout_21.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_21.setSpacing(8)
+        self.verticalLayout_21.setObjectName("verticalLayout_21")
+        self.choose_group_to_delete_label_2 = QtWidgets.QLabel(self.choose_group_to_delete_frame_2)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.choose_group_to_delete_label_2.sizePolicy().hasHeightForWidth())
+        self.choose_group_to_delete_label_2.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_group_to_delete_label_2.setFont(font)
+        self.choose_group_to_delete_label_2.setObjectName("choose_group_to_delete_label_2")
+        self.verticalLayout_21.addWidget(self.choose_group_to_delete_label_2)
+        self.choose_group_to_delete_comboBox_2 = QtWidgets.QComboBox(self.choose_group_to_delete_frame_2)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.choose_group_to_delete_comboBox_2.setFont(font)
+        self.choose_group_to_delete_comboBox_2.setObjectName("choose_group_to_delete_comboBox_2")
+        self.verticalLayout_21.addWidget(self.choose_group_to_delete_comboBox_2)
+        self.verticalLayout_22.addWidget(self.choose_group_to_delete_frame_2)
+        self.accept_group_delete_checkBox = QtWidgets.QCheckBox(self.delete_group_page)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(12)
+        self.accept_group_delete_checkBox.setFont(font)
+        self.accept_group_delete_checkBox.setObjectName("accept_group_delete_checkBox")
+        self.verticalLayout_22.addWidget(self.accept_group_delete_checkBox)
+        self.delete_group_pushButton = QtWidgets.QPushButton(self.delete_group_page)
+        self.delete_group_pushButton.setEnabled(False)
+        self.delete_group_pushButton.setMinimumSize(QtCore.QSize(0, 35))
+        font = QtGui.QFont()
+        font.setFamily("MS Shell Dlg 2")
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setWeight(75)
+        self.delete_group_pushButton.setFont(font)
+        self.delete_group_pushButton.setStyleSheet("/* === Accent Button === */\n"
+"QPushButton {\n"
+"    background-color: #2563EB;\n"
+"    color: #FFFFFF;\n"
+"    font-weight: bold;\n"
+"    border: none;\n"
+"    border-radius: 6px;\n"
+"    padding: 6px 12px;\n"
+"}\n"
+"\n"
+"/* ===Hover === */\n"
+"QPushButton:hover {\n"
+"    background-color: #5283EF;\n"
+"}\n"
+"\n"
+"/* === Pressed / Checked === */\n"
+"QPushButton:pressed,\n"
+"QPushButton:checked {\n"
+"    background-color: #124CC9;\n"
+"}\n"
+"\n"
+"/* === Disabled === */\n"
+"QPushButton:disabled {\n"
+"    background-color: #DEE8FC;\n"
+"    color: #FFFFFF; \n"
+"    border: none;\n"
+"    border-radius: 6px;\n"
+"}")
+        self.delete_group_pushButton.setObjectName("delete_group_pushButton")
+        self.verticalLayout_22.addWidget(self.delete_group_pushButton)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 361, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_22.addItem(spacerItem2)
+        self.delete_stackedWidget.addWidget(self.delete_group_page)
+        self.verticalLayout_17.addWidget(self.delete_stackedWidget)
+
+        self.retranslateUi(delete_page)
+        self.delete_stackedWidget.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(delete_page)
+
+    def retranslateUi(self, delete_page):
+        _translate = QtCore.QCoreApplication.translate
+        self.what_delete_label.setText(_translate("DeletePage", "Выберите что хотите удалить:"))
+        self.what_delete_file_radioButton.setText(_translate("DeletePage", "Файл"))
+        self.what_delete_group_radioButton.setText(_translate("DeletePage", "Группу"))
+        self.choose_group_to_delete_label.setText(_translate("DeletePage", "Выберите группу:"))
+        self.choose_file_to_delete_label.setText(_translate("DeletePage", "Выберите файл:"))
+        self.accept_file_delete_checkBox.setText(_translate("DeletePage", "Подтвердить удаление"))
+        self.delete_file_pushButton.setText(_translate("DeletePage", "Удалить"))
+        self.choose_group_to_delete_label_2.setText(_translate("DeletePage", "Выберите группу:"))
+        self.accept_group_delete_checkBox.setText(_translate("DeletePage", "Подтвердить удаление"))
+        self.delete_group_pushButton.setText(_translate("DeletePage", "Удалить"))
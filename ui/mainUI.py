@@ -294,7 +294,7 @@ class Ui_MainWindow(object):
 "\n"
 "\n"
 "/* === Table === */\n"
-"QTableWidget {\n"
+"QTableView {\n"
 "    background-color: #FFFFFF;\n"
 "    border: 1px solid #E2E8F0;\n"
 "    border-radius: 6px;\n"
@@ -320,17 +320,17 @@ class Ui_MainWindow(object):
 "}\n"
 "\n"
 "/* === Cells === */\n"
-"QTableWidget::item {\n"
+"QTableView::item {\n"
 "    padding: 4px 8px;\n"
 "}\n"
 "\n"
 "/* === Hover === */\n"
-"QTableWidget::item:hover {\n"
+"QTableView::item:hover {\n"
 "    background-color: #EEF4FF;\n"
 "}\n"
 "\n"
 "/* === Celected === */\n"
-"QTableWidget::item:selected {\n"
+"QTableView::item:selected {\n"
 "    background-color: #C8D9FF;\n"
 "}\n"
 "\n"
@@ -619,17 +619,15 @@ class Ui_MainWindow(object):
         self.search_all_versions_checkBox.setObjectName("search_all_versions_checkBox")
         self.verticalLayout_5.addWidget(self.search_all_versions_checkBox)
         self.verticalLayout_7.addWidget(self.filters_frame)
-        self.tableWidget = QtWidgets.QTableWidget(self.download_page)
+        self.tableView = QtWidgets.QTableView(self.download_page)
         font = QtGui.QFont()
         font.setPointSize(12)
-        self.tableWidget.setFont(font)
-        self.tableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.tableWidget.setObjectName("tableWidget")
-        self.tableWidget.setColumnCount(0)
-        self.tableWidget.setRowCount(0)
-        self.tableWidget.horizontalHeader().setStretchLastSection(True)
-        self.tableWidget.verticalHeader().setStretchLastSection(False)
-        self.verticalLayout_7.addWidget(self.tableWidget)
+        self.tableView.setFont(font)
+        self.tableView.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tableView.setObjectName("tableView")
+        self.tableView.horizontalHeader().setStretchLastSection(True)
+        self.tableView.verticalHeader().setStretchLastSection(False)
+        self.verticalLayout_7.addWidget(self.tableView)
         self.choose_file_frame = QtWidgets.QFrame(self.download_page)
         self.choose_file_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
         self.choose_file_frame.setFrameShadow(QtWidgets.QFrame.Raised)
@@ -810,577 +808,9 @@ class Ui_MainWindow(object):
         self.tabs_stackedWidget.addWidget(self.download_page)
         self.add_page = QtWidgets.QWidget()
         self.add_page.setObjectName("add_page")
-        self.verticalLayout_13 = QtWidgets.QVBoxLayout(self.add_page)
-        self.verticalLayout_13.setContentsMargins(8, 16, 8, 16)
-        self.verticalLayout_13.setSpacing(16)
-        self.verticalLayout_13.setObjectName("verticalLayout_13")
-        self.choose_or_create_frame = QtWidgets.QFrame(self.add_page)
-        self.choose_or_create_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.choose_or_create_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.choose_or_create_frame.setObjectName("choose_or_create_frame")
-        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.choose_or_create_frame)
-        self.verticalLayout_8.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_8.setSpacing(8)
-        self.verticalLayout_8.setObjectName("verticalLayout_8")
-        self.choose_or_create_label = QtWidgets.QLabel(self.choose_or_create_frame)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(14)
-        self.choose_or_create_label.setFont(font)
-        self.choose_or_create_label.setObjectName("choose_or_create_label")
-        self.verticalLayout_8.addWidget(self.choose_or_create_label)
-        self.choose_or_create_actions_frame = QtWidgets.QFrame(self.choose_or_create_frame)
-        self.choose_or_create_actions_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.choose_or_create_actions_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.choose_or_create_actions_frame.setObjectName("choose_or_create_actions_frame")
-        self.horizontalLayout_12 = QtWidgets.QHBoxLayout(self.choose_or_create_actions_frame)
-        self.horizontalLayout_12.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_12.setSpacing(16)
-        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
-        self.groups_comboBox = QtWidgets.QComboBox(self.choose_or_create_actions_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.groups_comboBox.sizePolicy().hasHeightForWidth())
-        self.groups_comboBox.setSizePolicy(sizePolicy)
-        self.groups_comboBox.setMinimumSize(QtCore.QSize(130, 0))
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.groups_comboBox.setFont(font)
-        self.groups_comboBox.setObjectName("groups_comboBox")
-        self.horizontalLayout_12.addWidget(self.groups_comboBox)
-        self.line_3 = QtWidgets.QFrame(self.choose_or_create_actions_frame)
-        self.line_3.setFrameShape(QtWidgets.QFrame.VLine)
-        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.line_3.setObjectName("line_3")
-        self.horizontalLayout_12.addWidget(self.line_3)
-        self.create_group_actions_frame = QtWidgets.QFrame(self.choose_or_create_actions_frame)
-        self.create_group_actions_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.create_group_actions_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.create_group_actions_frame.setObjectName("create_group_actions_frame")
-        self.horizontalLayout_6 = QtWidgets.QHBoxLayout(self.create_group_actions_frame)
-        self.horizontalLayout_6.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_6.setSpacing(8)
-        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
-        self.group_name_lineEdit = QtWidgets.QLineEdit(self.create_group_actions_frame)
-        self.group_name_lineEdit.setMinimumSize(QtCore.QSize(130, 0))
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.group_name_lineEdit.setFont(font)
-        self.group_name_lineEdit.setClearButtonEnabled(True)
-        self.group_name_lineEdit.setObjectName("group_name_lineEdit")
-        self.horizontalLayout_6.addWidget(self.group_name_lineEdit)
-        self.create_group_pushButton = QtWidgets.QPushButton(self.create_group_actions_frame)
-        self.create_group_pushButton.setEnabled(False)
-        self.create_group_pushButton.setMinimumSize(QtCore.QSize(100, 0))
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.create_group_pushButton.setFont(font)
-        self.create_group_pushButton.setObjectName("create_group_pushButton")
-        self.horizontalLayout_6.addWidget(self.create_group_pushButton)
-        self.horizontalLayout_12.addWidget(self.create_group_actions_frame)
-        self.verticalLayout_8.addWidget(self.choose_or_create_actions_frame)
-        self.verticalLayout_13.addWidget(self.choose_or_create_frame)
-        self.select_add_format_frame = QtWidgets.QFrame(self.add_page)
-        self.select_add_format_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.select_add_format_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.select_add_format_frame.setObjectName("select_add_format_frame")
-        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.select_add_format_frame)
-        self.verticalLayout_12.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_12.setSpacing(16)
-        self.verticalLayout_12.setObjectName("verticalLayout_12")
-        self.selecet_format_frame = QtWidgets.QFrame(self.select_add_format_frame)
-        self.selecet_format_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.selecet_format_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.selecet_format_frame.setObjectName("selecet_format_frame")
-        self.verticalLayout_11 = QtWidgets.QVBoxLayout(self.selecet_format_frame)
-        self.verticalLayout_11.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_11.setSpacing(8)
-        self.verticalLayout_11.setObjectName("verticalLayout_11")
-        self.select_type_label = QtWidgets.QLabel(self.selecet_format_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.select_type_label.sizePolicy().hasHeightForWidth())
-        self.select_type_label.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(14)
-        self.select_type_label.setFont(font)
-        self.select_type_label.setObjectName("select_type_label")
-        self.verticalLayout_11.addWidget(self.select_type_label)
-        self.select_add_format_actions_frame = QtWidgets.QFrame(self.selecet_format_frame)
-        self.select_add_format_actions_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.select_add_format_actions_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.select_add_format_actions_frame.setObjectName("select_add_format_actions_frame")
-        self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.select_add_format_actions_frame)
-        self.horizontalLayout_8.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_8.setSpacing(16)
-        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
-        self.version_radioButton = QtWidgets.QRadioButton(self.select_add_format_actions_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.version_radioButton.sizePolicy().hasHeightForWidth())
-        self.version_radioButton.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.version_radioButton.setFont(font)
-        self.version_radioButton.setChecked(True)
-        self.version_radioButton.setObjectName("version_radioButton")
-        self.horizontalLayout_8.addWidget(self.version_radioButton)
-        self.instruction_radioButton = QtWidgets.QRadioButton(self.select_add_format_actions_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.instruction_radioButton.sizePolicy().hasHeightForWidth())
-        self.instruction_radioButton.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.instruction_radioButton.setFont(font)
-        self.instruction_radioButton.setObjectName("instruction_radioButton")
-        self.horizontalLayout_8.addWidget(self.instruction_radioButton)
-        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_8.addItem(spacerItem2)
-        self.verticalLayout_11.addWidget(self.select_add_format_actions_frame)
-        self.verticalLayout_12.addWidget(self.selecet_format_frame)
-        self.add_format_stackedWidget = QtWidgets.QStackedWidget(self.select_add_format_frame)
-        self.add_format_stackedWidget.setObjectName("add_format_stackedWidget")
-        self.version_page = QtWidgets.QWidget()
-        self.version_page.setObjectName("version_page")
-        self.verticalLayout_14 = QtWidgets.QVBoxLayout(self.version_page)
-        self.verticalLayout_14.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_14.setSpacing(16)
-        self.verticalLayout_14.setObjectName("verticalLayout_14")
-        self.choose_version_folder_label = QtWidgets.QLabel(self.version_page)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.choose_version_folder_label.sizePolicy().hasHeightForWidth())
-        self.choose_version_folder_label.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_version_folder_label.setFont(font)
-        self.choose_version_folder_label.setObjectName("choose_version_folder_label")
-        self.verticalLayout_14.addWidget(self.choose_version_folder_label)
-        self.choose_version_folder_frame = QtWidgets.QFrame(self.version_page)
-        self.choose_version_folder_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.choose_version_folder_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.choose_version_folder_frame.setObjectName("choose_version_folder_frame")
-        self.horizontalLayout_9 = QtWidgets.QHBoxLayout(self.choose_version_folder_frame)
-        self.horizontalLayout_9.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_9.setSpacing(8)
-        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
-        self.choose_version_folder_lineEdit = QtWidgets.QLineEdit(self.choose_version_folder_frame)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_version_folder_lineEdit.setFont(font)
-        self.choose_version_folder_lineEdit.setClearButtonEnabled(True)
-        self.choose_version_folder_lineEdit.setObjectName("choose_version_folder_lineEdit")
-        self.horizontalLayout_9.addWidget(self.choose_version_folder_lineEdit)
-        self.choose_version_folder_pushButton = QtWidgets.QPushButton(self.choose_version_folder_frame)
-        self.choose_version_folder_pushButton.setMinimumSize(QtCore.QSize(100, 0))
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_version_folder_pushButton.setFont(font)
-        self.choose_version_folder_pushButton.setObjectName("choose_version_folder_pushButton")
-        self.horizontalLayout_9.addWidget(self.choose_version_folder_pushButton)
-        self.verticalLayout_14.addWidget(self.choose_version_folder_frame)
-        self.add_version_pushButton = QtWidgets.QPushButton(self.version_page)
-        self.add_version_pushButton.setEnabled(False)
-        self.add_version_pushButton.setMinimumSize(QtCore.QSize(0, 35))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        font.setBold(True)
-        font.setWeight(75)
-        self.add_version_pushButton.setFont(font)
-        self.add_version_pushButton.setStyleSheet("/* === Accent Button === */\n"
-"QPushButton {\n"
-"    background-color: #2563EB;\n"
-"    color: #FFFFFF;\n"
-"    font-weight: bold;\n"
-"    border: none;\n"
-"    border-radius: 6px;\n"
-"    padding: 6px 12px;\n"
-"}\n"
-"\n"
-"/* ===Hover === */\n"
-"QPushButton:hover {\n"
-"    background-color: #5283EF;\n"
-"}\n"
-"\n"
-"/* === Pressed / Checked === */\n"
-"QPushButton:pressed,\n"
-"QPushButton:checked {\n"
-"    background-color: #124CC9;\n"
-"}\n"
-"\n"
-"/* === Disabled === */\n"
-"QPushButton:disabled {\n"
-"    background-color: #DEE8FC;\n"
-"    color: #FFFFFF; \n"
-"    border: none;\n"
-"    border-radius: 6px;\n"
-"}")
-        self.add_version_pushButton.setObjectName("add_version_pushButton")
-        self.verticalLayout_14.addWidget(self.add_version_pushButton)
-        spacerItem3 = QtWidgets.QSpacerItem(20, 300, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.verticalLayout_14.addItem(spacerItem3)
-        self.add_format_stackedWidget.addWidget(self.version_page)
-        self.instruction_page = QtWidgets.QWidget()
-        self.instruction_page.setObjectName("instruction_page")
-        self.verticalLayout_15 = QtWidgets.QVBoxLayout(self.instruction_page)
-        self.verticalLayout_15.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_15.setSpacing(16)
-        self.verticalLayout_15.setObjectName("verticalLayout_15")
-        self.choose_instruction_file_label = QtWidgets.QLabel(self.instruction_page)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.choose_instruction_file_label.sizePolicy().hasHeightForWidth())
-        self.choose_instruction_file_label.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_instruction_file_label.setFont(font)
-        self.choose_instruction_file_label.setObjectName("choose_instruction_file_label")
-        self.verticalLayout_15.addWidget(self.choose_instruction_file_label)
-        self.choose_instruction_file_frame = QtWidgets.QFrame(self.instruction_page)
-        self.choose_instruction_file_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.choose_instruction_file_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.choose_instruction_file_frame.setObjectName("choose_instruction_file_frame")
-        self.horizontalLayout_10 = QtWidgets.QHBoxLayout(self.choose_instruction_file_frame)
-        self.horizontalLayout_10.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_10.setSpacing(8)
-        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
-        self.choose_instruction_file_lineEdit = QtWidgets.QLineEdit(self.choose_instruction_file_frame)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_instruction_file_lineEdit.setFont(font)
-        self.choose_instruction_file_lineEdit.setClearButtonEnabled(True)
-        self.choose_instruction_file_lineEdit.setObjectName("choose_instruction_file_lineEdit")
-        self.horizontalLayout_10.addWidget(self.choose_instruction_file_lineEdit)
-        self.choose_instruction_file_pushButton = QtWidgets.QPushButton(self.choose_instruction_file_frame)
-        self.choose_instruction_file_pushButton.setEnabled(True)
-        self.choose_instruction_file_pushButton.setMinimumSize(QtCore.QSize(100, 0))
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_instruction_file_pushButton.setFont(font)
-        self.choose_instruction_file_pushButton.setObjectName("choose_instruction_file_pushButton")
-        self.horizontalLayout_10.addWidget(self.choose_instruction_file_pushButton)
-        self.verticalLayout_15.addWidget(self.choose_instruction_file_frame)
-        self.add_instruction_pushButton = QtWidgets.QPushButton(self.instruction_page)
-        self.add_instruction_pushButton.setEnabled(False)
-        self.add_instruction_pushButton.setMinimumSize(QtCore.QSize(0, 35))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        font.setBold(True)
-        font.setWeight(75)
-        self.add_instruction_pushButton.setFont(font)
-        self.add_instruction_pushButton.setStyleSheet("/* === Accent Button === */\n"
-"QPushButton {\n"
-"    background-color: #2563EB;\n"
-"    color: #FFFFFF;\n"
-"    font-weight: bold;\n"
-"    border: none;\n"
-"    border-radius: 6px;\n"
-"    padding: 6px 12px;\n"
-"}\n"
-"\n"
-"/* ===Hover === */\n"
-"QPushButton:hover {\n"
-"    background-color: #5283EF;\n"
-"}\n"
-"\n"
-"/* === Pressed / Checked === */\n"
-"QPushButton:pressed,\n"
-"QPushButton:checked {\n"
-"    background-color: #124CC9;\n"
-"}\n"
-"\n"
-"/* === Disabled === */\n"
-"QPushButton:disabled {\n"
-"    background-color: #DEE8FC;\n"
-"    color: #FFFFFF; \n"
-"    border: none;\n"
-"    border-radius: 6px;\n"
-"}")
-        self.add_instruction_pushButton.setObjectName("add_instruction_pushButton")
-        self.verticalLayout_15.addWidget(self.add_instruction_pushButton)
-        spacerItem4 = QtWidgets.QSpacerItem(20, 300, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.verticalLayout_15.addItem(spacerItem4)
-        self.add_format_stackedWidget.addWidget(self.instruction_page)
-        self.verticalLayout_12.addWidget(self.add_format_stackedWidget)
-        self.verticalLayout_13.addWidget(self.select_add_format_frame)
         self.tabs_stackedWidget.addWidget(self.add_page)
         self.delete_page = QtWidgets.QWidget()
         self.delete_page.setObjectName("delete_page")
-        self.verticalLayout_17 = QtWidgets.QVBoxLayout(self.delete_page)
-        self.verticalLayout_17.setContentsMargins(8, 16, 8, 16)
-        self.verticalLayout_17.setSpacing(16)
-        self.verticalLayout_17.setObjectName("verticalLayout_17")
-        self.what_delete_frame = QtWidgets.QFrame(self.delete_page)
-        self.what_delete_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.what_delete_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.what_delete_frame.setObjectName("what_delete_frame")
-        self.verticalLayout_16 = QtWidgets.QVBoxLayout(self.what_delete_frame)
-        self.verticalLayout_16.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_16.setSpacing(8)
-        self.verticalLayout_16.setObjectName("verticalLayout_16")
-        self.what_delete_label = QtWidgets.QLabel(self.what_delete_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.what_delete_label.sizePolicy().hasHeightForWidth())
-        self.what_delete_label.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(14)
-        self.what_delete_label.setFont(font)
-        self.what_delete_label.setObjectName("what_delete_label")
-        self.verticalLayout_16.addWidget(self.what_delete_label)
-        self.what_delete_actions_frame = QtWidgets.QFrame(self.what_delete_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.what_delete_actions_frame.sizePolicy().hasHeightForWidth())
-        self.what_delete_actions_frame.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.what_delete_actions_frame.setFont(font)
-        self.what_delete_actions_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.what_delete_actions_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.what_delete_actions_frame.setObjectName("what_delete_actions_frame")
-        self.horizontalLayout_11 = QtWidgets.QHBoxLayout(self.what_delete_actions_frame)
-        self.horizontalLayout_11.setContentsMargins(0, 0, 0, 0)
-        self.horizontalLayout_11.setSpacing(16)
-        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
-        self.what_delete_file_radioButton = QtWidgets.QRadioButton(self.what_delete_actions_frame)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.what_delete_file_radioButton.setFont(font)
-        self.what_delete_file_radioButton.setChecked(True)
-        self.what_delete_file_radioButton.setObjectName("what_delete_file_radioButton")
-        self.horizontalLayout_11.addWidget(self.what_delete_file_radioButton)
-        self.what_delete_group_radioButton = QtWidgets.QRadioButton(self.what_delete_actions_frame)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.what_delete_group_radioButton.setFont(font)
-        self.what_delete_group_radioButton.setObjectName("what_delete_group_radioButton")
-        self.horizontalLayout_11.addWidget(self.what_delete_group_radioButton)
-        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_11.addItem(spacerItem5)
-        self.verticalLayout_16.addWidget(self.what_delete_actions_frame)
-        self.verticalLayout_17.addWidget(self.what_delete_frame)
-        self.delete_stackedWidget = QtWidgets.QStackedWidget(self.delete_page)
-        self.delete_stackedWidget.setObjectName("delete_stackedWidget")
-        self.delete_file_page = QtWidgets.QWidget()
-        self.delete_file_page.setObjectName("delete_file_page")
-        self.verticalLayout_20 = QtWidgets.QVBoxLayout(self.delete_file_page)
-        self.verticalLayout_20.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_20.setSpacing(16)
-        self.verticalLayout_20.setObjectName("verticalLayout_20")
-        self.choose_group_to_delete_frame = QtWidgets.QFrame(self.delete_file_page)
-        self.choose_group_to_delete_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.choose_group_to_delete_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.choose_group_to_delete_frame.setObjectName("choose_group_to_delete_frame")
-        self.verticalLayout_19 = QtWidgets.QVBoxLayout(self.choose_group_to_delete_frame)
-        self.verticalLayout_19.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_19.setSpacing(8)
-        self.verticalLayout_19.setObjectName("verticalLayout_19")
-        self.choose_group_to_delete_label = QtWidgets.QLabel(self.choose_group_to_delete_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.choose_group_to_delete_label.sizePolicy().hasHeightForWidth())
-        self.choose_group_to_delete_label.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_group_to_delete_label.setFont(font)
-        self.choose_group_to_delete_label.setObjectName("choose_group_to_delete_label")
-        self.verticalLayout_19.addWidget(self.choose_group_to_delete_label)
-        self.choose_group_to_delete_comboBox = QtWidgets.QComboBox(self.choose_group_to_delete_frame)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_group_to_delete_comboBox.setFont(font)
-        self.choose_group_to_delete_comboBox.setObjectName("choose_group_to_delete_comboBox")
-        self.verticalLayout_19.addWidget(self.choose_group_to_delete_comboBox)
-        self.verticalLayout_20.addWidget(self.choose_group_to_delete_frame)
-        self.choose_file_to_delete_frame = QtWidgets.QFrame(self.delete_file_page)
-        self.choose_file_to_delete_frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.choose_file_to_delete_frame.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.choose_file_to_delete_frame.setObjectName("choose_file_to_delete_frame")
-        self.verticalLayout_18 = QtWidgets.QVBoxLayout(self.choose_file_to_delete_frame)
-        self.verticalLayout_18.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_18.setSpacing(8)
-        self.verticalLayout_18.setObjectName("verticalLayout_18")
-        self.choose_file_to_delete_label = QtWidgets.QLabel(self.choose_file_to_delete_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.choose_file_to_delete_label.sizePolicy().hasHeightForWidth())
-        self.choose_file_to_delete_label.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_file_to_delete_label.setFont(font)
-        self.choose_file_to_delete_label.setObjectName("choose_file_to_delete_label")
-        self.verticalLayout_18.addWidget(self.choose_file_to_delete_label)
-        self.choose_file_to_delete_comboBox = QtWidgets.QComboBox(self.choose_file_to_delete_frame)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_file_to_delete_comboBox.setFont(font)
-        self.choose_file_to_delete_comboBox.setObjectName("choose_file_to_delete_comboBox")
-        self.verticalLayout_18.addWidget(self.choose_file_to_delete_comboBox)
-        self.verticalLayout_20.addWidget(self.choose_file_to_delete_frame)
-        self.accept_file_delete_checkBox = QtWidgets.QCheckBox(self.delete_file_page)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.accept_file_delete_checkBox.setFont(font)
-        self.accept_file_delete_checkBox.setObjectName("accept_file_delete_checkBox")
-        self.verticalLayout_20.addWidget(self.accept_file_delete_checkBox)
-        self.delete_file_pushButton = QtWidgets.QPushButton(self.delete_file_page)
-        self.delete_file_pushButton.setEnabled(False)
-        self.delete_file_pushButton.setMinimumSize(QtCore.QSize(0, 35))
-        font = QtGui.QFont()
-        font.setPointSize(12)
-        font.setBold(True)
-        font.setWeight(75)
-        self.delete_file_pushButton.setFont(font)
-        self.delete_file_pushButton.setStyleSheet("/* === Accent Button === */\n"
-"QPushButton {\n"
-"    background-color: #2563EB;\n"
-"    color: #FFFFFF;\n"
-"    font-weight: bold;\n"
-"    border: none;\n"
-"    border-radius: 6px;\n"
-"    padding: 6px 12px;\n"
-"}\n"
-"\n"
-"/* ===Hover === */\n"
-"QPushButton:hover {\n"
-"    background-color: #5283EF;\n"
-"}\n"
-"\n"
-"/* === Pressed / Checked === */\n"
-"QPushButton:pressed,\n"
-"QPushButton:checked {\n"
-"    background-color: #124CC9;\n"
-"}\n"
-"\n"
-"/* === Disabled === */\n"
-"QPushButton:disabled {\n"
-"    background-color: #DEE8FC;\n"
-"    color: #FFFFFF; \n"
-"    border: none;\n"
-"    border-radius: 6px;\n"
-"}")
-        self.delete_file_pushButton.setObjectName("delete_file_pushButton")
-        self.verticalLayout_20.addWidget(self.delete_file_pushButton)
-        spacerItem6 = QtWidgets.QSpacerItem(20, 283, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.verticalLayout_20.addItem(spacerItem6)
-        self.delete_stackedWidget.addWidget(self.delete_file_page)
-        self.delete_group_page = QtWidgets.QWidget()
-        self.delete_group_page.setObjectName("delete_group_page")
-        self.verticalLayout_22 = QtWidgets.QVBoxLayout(self.delete_group_page)
-        self.verticalLayout_22.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_22.setSpacing(16)
-        self.verticalLayout_22.setObjectName("verticalLayout_22")
-        self.choose_group_to_delete_frame_2 = QtWidgets.QFrame(self.delete_group_page)
-        self.choose_group_to_delete_frame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        self.choose_group_to_delete_frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
-        self.choose_group_to_delete_frame_2.setObjectName("choose_group_to_delete_frame_2")
-        self.verticalLayout_21 = QtWidgets.QVBoxLayout(self.choose_group_to_delete_frame_2)
-        self.verticalLayout_21.setContentsMargins(0, 0, 0, 0)
-        self.verticalLayout_21.setSpacing(8)
-        self.verticalLayout_21.setObjectName("verticalLayout_21")
-        self.choose_group_to_delete_label_2 = QtWidgets.QLabel(self.choose_group_to_delete_frame_2)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.choose_group_to_delete_label_2.sizePolicy().hasHeightForWidth())
-        self.choose_group_to_delete_label_2.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_group_to_delete_label_2.setFont(font)
-        self.choose_group_to_delete_label_2.setObjectName("choose_group_to_delete_label_2")
-        self.verticalLayout_21.addWidget(self.choose_group_to_delete_label_2)
-        self.choose_group_to_delete_comboBox_2 = QtWidgets.QComboBox(self.choose_group_to_delete_frame_2)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.choose_group_to_delete_comboBox_2.setFont(font)
-        self.choose_group_to_delete_comboBox_2.setObjectName("choose_group_to_delete_comboBox_2")
-        self.verticalLayout_21.addWidget(self.choose_group_to_delete_comboBox_2)
-        self.verticalLayout_22.addWidget(self.choose_group_to_delete_frame_2)
-        self.accept_group_delete_checkBox = QtWidgets.QCheckBox(self.delete_group_page)
-        font = QtGui.QFont()
-        font.setFamily("Segoe UI")
-        font.setPointSize(12)
-        self.accept_group_delete_checkBox.setFont(font)
-        self.accept_group_delete_checkBox.setObjectName("accept_group_delete_checkBox")
-        self.verticalLayout_22.addWidget(self.accept_group_delete_checkBox)
-        self.delete_group_pushButton = QtWidgets.QPushButton(self.delete_group_page)
-        self.delete_group_pushButton.setEnabled(False)
-        self.delete_group_pushButton.setMinimumSize(QtCore.QSize(0, 35))
-        font = QtGui.QFont()
-        font.setFamily("MS Shell Dlg 2")
-        font.setPointSize(12)
-        font.setBold(True)
-        font.setWeight(75)
-        self.delete_group_pushButton.setFont(font)
-        self.delete_group_pushButton.setStyleSheet("/* === Accent Button === */\n"
-"QPushButton {\n"
-"    background-color: #2563EB;\n"
-"    color: #FFFFFF;\n"
-"    font-weight: bold;\n"
-"    border: none;\n"
-"    border-radius: 6px;\n"
-"    padding: 6px 12px;\n"
-"}\n"
-"\n"
-"/* ===Hover === */\n"
-"QPushButton:hover {\n"
-"    background-color: #5283EF;\n"
-"}\n"
-"\n"
-"/* === Pressed / Checked === */\n"
-"QPushButton:pressed,\n"
-"QPushButton:checked {\n"
-"    background-color: #124CC9;\n"
-"}\n"
-"\n"
-"/* === Disabled === */\n"
-"QPushButton:disabled {\n"
-"    background-color: #DEE8FC;\n"
-"    color: #FFFFFF; \n"
-"    border: none;\n"
-"    border-radius: 6px;\n"
-"}")
-        self.delete_group_pushButton.setObjectName("delete_group_pushButton")
-        self.verticalLayout_22.addWidget(self.delete_group_pushButton)
-        spacerItem7 = QtWidgets.QSpacerItem(20, 361, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.verticalLayout_22.addItem(spacerItem7)
-        self.delete_stackedWidget.addWidget(self.delete_group_page)
-        self.verticalLayout_17.addWidget(self.delete_stackedWidget)
         self.tabs_stackedWidget.addWidget(self.delete_page)
         self.verticalLayout_4.addWidget(self.tabs_stackedWidget)
         self.progress_bar_frame = QtWidgets.QFrame(self.main_frame)
@@ -1411,8 +841,8 @@ class Ui_MainWindow(object):
         self.process_label.setFont(font)
         self.process_label.setObjectName("process_label")
         self.horizontalLayout_2.addWidget(self.process_label)
-        spacerItem8 = QtWidgets.QSpacerItem(683, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_2.addItem(spacerItem8)
+        spacerItem2 = QtWidgets.QSpacerItem(683, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem2)
         self.percent_label = QtWidgets.QLabel(self.progress_bar_labels_frame)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         sizePolicy.setHorizontalStretch(0)
@@ -1437,8 +867,6 @@ class Ui_MainWindow(object):
 
         self.retranslateUi(MainWindow)
         self.tabs_stackedWidget.setCurrentIndex(0)
-        self.add_format_stackedWidget.setCurrentIndex(0)
-        self.delete_stackedWidget.setCurrentIndex(0)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
 
     def retranslateUi(self, MainWindow):
@@ -1458,29 +886,5 @@ class Ui_MainWindow(object):
         self.save_file_path_choose_pushButton.setText(_translate("MainWindow", "Выбрать"))
         self.download_file_pushButton.setText(_translate("MainWindow", "Скачать"))
         self.open_file_pushButton.setText(_translate("MainWindow", "Открыть"))
-        self.choose_or_create_label.setText(_translate("MainWindow", "Выберите группу или создайте новую:"))
-        self.group_name_lineEdit.setPlaceholderText(_translate("MainWindow", "БВВ.01"))
-        self.create_group_pushButton.setText(_translate("MainWindow", "Создать"))
-        self.select_type_label.setText(_translate("MainWindow", "Выберите что хотите добавить:"))
-        self.version_radioButton.setText(_translate("MainWindow", "Версия"))
-        self.instruction_radioButton.setText(_translate("MainWindow", "Инструкция"))
-        self.choose_version_folder_label.setText(_translate("MainWindow", "Выберите папку или вставьте путь к ней:"))
-        self.choose_version_folder_lineEdit.setPlaceholderText(_translate("MainWindow", "C:\\"))
-        self.choose_version_folder_pushButton.setText(_translate("MainWindow", "Выбрать"))
-        self.add_version_pushButton.setText(_translate("MainWindow", "Добавить"))
-        self.choose_instruction_file_label.setText(_translate("MainWindow", "Выберите файл или вставьте путь к нему:"))
-        self.choose_instruction_file_lineEdit.setPlaceholderText(_translate("MainWindow", "C:\\"))
-        self.choose_instruction_file_pushButton.setText(_translate("MainWindow", "Выбрать"))
-        self.add_instruction_pushButton.setText(_translate("MainWindow", "Добавить"))
-        self.what_delete_label.setText(_translate("MainWindow", "Выберите что хотите удалить:"))
-        self.what_delete_file_radioButton.setText(_translate("MainWindow", "Файл"))
-        self.what_delete_group_radioButton.setText(_translate("MainWindow", "Группу"))
-        self.choose_group_to_delete_label.setText(_translate("MainWindow", "Выберите группу:"))
-        self.choose_file_to_delete_label.setText(_translate("MainWindow", "Выберите файл:"))
-        self.accept_file_delete_checkBox.setText(_translate("MainWindow", "Подтвердить удаление"))
-        self.delete_file_pushButton.setText(_translate("MainWindow", "Удалить"))
-        self.choose_group_to_delete_label_2.setText(_translate("MainWindow", "Выберите группу:"))
-        self.accept_group_delete_checkBox.setText(_translate("MainWindow", "Подтвердить удаление"))
-        self.delete_group_pushButton.setText(_translate("MainWindow", "Удалить"))
         self.process_label.setText(_translate("MainWindow", "Процесс..."))
         self.percent_label.setText(_translate("MainWindow", "0%"))